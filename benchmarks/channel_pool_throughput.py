@@ -0,0 +1,133 @@
+"""
+Measures the throughput of concurrent unary calls for growing channel pool sizes.
+
+The local server only works on a limited number of calls per connection at the same time, like a server that
+caps the concurrent streams of a HTTP/2 connection. Further calls on the same connection queue up,
+so a single channel queues calls while a pool spreads them over several connections.
+
+Usage:
+    poetry run python benchmarks/channel_pool_throughput.py
+"""
+import argparse
+import threading
+import time
+from concurrent import futures
+from typing import Dict, Tuple
+
+import grpc
+
+from com.terraquantum.experiment.v3alpha2.experimentrun import (
+    experiment_run_service_pb2_grpc as pb2_exp_run_grpc,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.experiment_run_pb2 import (
+    ExperimentRunProto,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.get_experiment_run_request_pb2 import (
+    GetExperimentRunRequest,
+)
+
+from tq42.client import _api_channel_options
+from tq42.utils.channel_pool import (
+    ChannelPool,
+    ChannelSelection,
+    POOLED_CHANNEL_OPTIONS,
+)
+
+
+class _ExperimentRunService(pb2_exp_run_grpc.ExperimentRunServiceServicer):
+    def __init__(self, latency: float, max_concurrent_streams: int):
+        self._latency = latency
+        self._max_concurrent_streams = max_concurrent_streams
+        self._lock = threading.Lock()
+        self._streams: Dict[str, threading.Semaphore] = {}
+
+    def _connection_streams(self, peer: str) -> threading.Semaphore:
+        with self._lock:
+            if peer not in self._streams:
+                self._streams[peer] = threading.Semaphore(self._max_concurrent_streams)
+            return self._streams[peer]
+
+    def GetExperimentRun(self, request, context):
+        with self._connection_streams(context.peer()):
+            time.sleep(self._latency)
+        return ExperimentRunProto(id=request.experiment_run_id)
+
+
+def _start_server(
+    latency: float, max_concurrent_streams: int
+) -> Tuple[grpc.Server, str]:
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=512))
+    pb2_exp_run_grpc.add_ExperimentRunServiceServicer_to_server(
+        _ExperimentRunService(
+            latency=latency, max_concurrent_streams=max_concurrent_streams
+        ),
+        server,
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, f"localhost:{port}"
+
+
+def _measure(
+    address: str, pool_size: int, selection: ChannelSelection, calls: int, workers: int
+) -> float:
+    pool = ChannelPool(
+        channel_factory=lambda: grpc.insecure_channel(
+            address, options=_api_channel_options + POOLED_CHANNEL_OPTIONS
+        ),
+        size=pool_size,
+        selection=selection,
+    )
+    stub = pb2_exp_run_grpc.ExperimentRunServiceStub(pool)
+    request = GetExperimentRunRequest(experiment_run_id="benchmark")
+
+    # warm up all connections
+    for _ in range(pool_size):
+        stub.GetExperimentRun(request)
+
+    with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda _: stub.GetExperimentRun(request), range(calls)))
+        elapsed = time.perf_counter() - start
+
+    pool.close()
+    return calls / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=128)
+    parser.add_argument(
+        "--latency", type=float, default=0.01, help="server latency per call in seconds"
+    )
+    parser.add_argument("--max-concurrent-streams", type=int, default=16)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    server, address = _start_server(
+        latency=args.latency, max_concurrent_streams=args.max_concurrent_streams
+    )
+    print(
+        f"{args.calls} calls from {args.workers} threads, {args.latency * 1000:.0f} ms server latency, "
+        f"{args.max_concurrent_streams} concurrent streams per connection"
+    )
+    print(f"{'pool size':>9} {'selection':>13} {'calls/s':>10}")
+    for pool_size in args.pool_sizes:
+        for selection in ChannelSelection:
+            throughput = _measure(
+                address,
+                pool_size=pool_size,
+                selection=selection,
+                calls=args.calls,
+                workers=args.workers,
+            )
+            print(f"{pool_size:>9} {selection.value:>13} {throughput:>10.0f}")
+
+    server.stop(grace=None)
+
+
+if __name__ == "__main__":
+    main()
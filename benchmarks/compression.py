@@ -0,0 +1,130 @@
+"""
+Compares request size and latency of `CreateExperimentRun` with and without gzip compression.
+
+The parameters contain a QUBO matrix flattened into the `metadata` Struct of the request, once as a sparse
+integer matrix and once as a dense matrix of random floats.
+
+Usage:
+    poetry run python benchmarks/compression.py
+"""
+import argparse
+import gzip
+import random
+import statistics
+import time
+from concurrent import futures
+from typing import List, Tuple
+
+import grpc
+from google.protobuf import struct_pb2
+from google.protobuf.json_format import ParseDict
+
+from com.terraquantum.experiment.v3alpha2.experimentrun import (
+    experiment_run_service_pb2_grpc as pb2_exp_run_grpc,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.create_experiment_run_request_pb2 import (
+    CreateExperimentRunRequest,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.experiment_run_pb2 import (
+    ExperimentRunProto,
+)
+
+from tq42.client import TransportOptions, _api_channel_options
+
+
+class _ExperimentRunService(pb2_exp_run_grpc.ExperimentRunServiceServicer):
+    def CreateExperimentRun(self, request, context):
+        return ExperimentRunProto(id="benchmark", experiment_id=request.experiment_id)
+
+
+def _start_server() -> Tuple[grpc.Server, str]:
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4),
+        options=[("grpc.max_receive_message_length", -1)],
+    )
+    pb2_exp_run_grpc.add_ExperimentRunServiceServicer_to_server(
+        _ExperimentRunService(), server
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, f"localhost:{port}"
+
+
+def _qubo(size: int, sparse: bool) -> List[List[float]]:
+    rng = random.Random(42)
+    if sparse:
+        return [
+            [
+                float(rng.randint(-5, 5)) if rng.random() < 0.1 else 0.0
+                for _ in range(size)
+            ]
+            for _ in range(size)
+        ]
+    return [[rng.uniform(-1, 1) for _ in range(size)] for _ in range(size)]
+
+
+def _request(matrix: List[List[float]]) -> CreateExperimentRunRequest:
+    parameters = {"parameters": {"qubo": matrix, "steps": 100}, "inputs": {}}
+    return CreateExperimentRunRequest(
+        experiment_id="benchmark",
+        algorithm="BENCHMARK",
+        version="0.1.0",
+        metadata=ParseDict(parameters, struct_pb2.Struct()),
+    )
+
+
+def _latency_ms(
+    address: str, request: CreateExperimentRunRequest, compression, repetitions: int
+) -> float:
+    options = TransportOptions(max_send_message_length=-1, compression=compression)
+    channel = grpc.insecure_channel(
+        address,
+        options=_api_channel_options + options.channel_options(),
+        compression=options.compression,
+    )
+    stub = pb2_exp_run_grpc.ExperimentRunServiceStub(channel)
+    stub.CreateExperimentRun(request)
+
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        stub.CreateExperimentRun(request)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    channel.close()
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 600])
+    parser.add_argument("--repetitions", type=int, default=20)
+    args = parser.parse_args()
+
+    server, address = _start_server()
+    print(
+        f"{'matrix':>16} {'raw bytes':>11} {'gzip bytes':>11} {'ratio':>6} "
+        f"{'plain ms':>9} {'gzip ms':>8}"
+    )
+    for size in args.sizes:
+        for sparse in (True, False):
+            request = _request(_qubo(size, sparse=sparse))
+            raw = request.SerializeToString()
+            compressed = gzip.compress(raw)
+            plain_ms = _latency_ms(address, request, None, args.repetitions)
+            gzip_ms = _latency_ms(
+                address, request, grpc.Compression.Gzip, args.repetitions
+            )
+            name = f"{size}x{size} {'sparse' if sparse else 'dense'}"
+            print(
+                f"{name:>16} {len(raw):>11} {len(compressed):>11} "
+                f"{len(compressed) / len(raw):>6.2f} {plain_ms:>9.1f} {gzip_ms:>8.1f}"
+            )
+
+    server.stop(grace=None)
+
+
+if __name__ == "__main__":
+    main()
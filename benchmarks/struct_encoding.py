@@ -0,0 +1,74 @@
+"""
+Compares encoding experiment run parameters into the `metadata` Struct with `ParseDict` and with the encoder used by
+`ExperimentRun.create`, for QUBO matrices and flat vectors with 10^6 elements.
+
+`ParseDict` only accepts Python lists, so its timing includes the `.tolist()` call users need for NumPy inputs.
+
+Usage:
+    poetry run python benchmarks/struct_encoding.py
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+from google.protobuf import struct_pb2
+from google.protobuf.json_format import ParseDict
+
+from tq42.utils.struct_codec import encode_struct
+
+
+def _inputs(sizes: List[int], vector_length: int) -> List[Tuple[str, object]]:
+    rng = np.random.default_rng(42)
+    inputs = []
+    for size in sizes:
+        qubo = rng.uniform(-1, 1, size=(size, size))
+        inputs.append((f"qubo {size}x{size} ndarray", qubo))
+        inputs.append((f"qubo {size}x{size} list", qubo.tolist()))
+    vector = rng.uniform(-1, 1, size=vector_length)
+    inputs.append((f"vector {vector_length} ndarray", vector))
+    inputs.append((f"vector {vector_length} list", vector.tolist()))
+    return inputs
+
+
+def _median_ms(encode: Callable[[], struct_pb2.Struct], repetitions: int) -> float:
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        encode()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--vector-length", type=int, default=10**6)
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'input':>26} {'ParseDict ms':>13} {'encoder ms':>11} {'speedup':>8}")
+    for name, value in _inputs(args.sizes, args.vector_length):
+        parameters = {"parameters": {"qubo": value, "steps": 100}, "inputs": {}}
+
+        def parse_dict() -> struct_pb2.Struct:
+            plain = value.tolist() if isinstance(value, np.ndarray) else value
+            return ParseDict(
+                {"parameters": {"qubo": plain, "steps": 100}, "inputs": {}},
+                struct_pb2.Struct(),
+            )
+
+        assert parse_dict() == encode_struct(parameters)
+        parse_dict_ms = _median_ms(parse_dict, args.repetitions)
+        encoder_ms = _median_ms(lambda: encode_struct(parameters), args.repetitions)
+        print(
+            f"{name:>26} {parse_dict_ms:>13.1f} {encoder_ms:>11.1f} "
+            f"{parse_dict_ms / encoder_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""
+Awaitable counterparts of the TQ42 resources.
+
+Every resource in this package has to be used together with a :py:class:`tq42.client.TQ42AsyncClient`.
+"""
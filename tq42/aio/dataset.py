@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import os.path
+from pathlib import Path
+from typing import List
+
+from tq42 import dataset
+from tq42.dataset import (
+    CreateStorageFromExternalBucketRequest,
+    CreateStorageFromFileRequest,
+    CreateStorageFromFileResponse,
+    DatasetSensitivityProto,
+    ExportStorageRequest,
+    ExportStorageResponse,
+    StorageProto,
+    StorageType,
+    DeleteStorageRequest,
+    GetStorageRequest,
+    ListStoragesRequest,
+    ListStoragesResponse,
+)
+from tq42.utils.exception_handling import handle_generic_sdk_errors
+from tq42.utils.pretty_list import PrettyList
+
+from typing import TYPE_CHECKING
+
+# only import the stuff for type hints -> avoid circular imports
+if TYPE_CHECKING:
+    from tq42.client import TQ42AsyncClient
+
+
+class Dataset(dataset.Dataset):
+    """
+    Reference an existing dataset on an async client.
+    Use :py:meth:`get` to load a dataset by its id.
+
+    :param client: an async client instance
+    :param id: the id of the existing dataset
+    :param data: the current state of the dataset
+    """
+
+    _client: TQ42AsyncClient
+
+    def __init__(self, client: TQ42AsyncClient, id: str, data: StorageProto):
+        self._client = client
+        self.id = id
+        self.data = data
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def get(client: TQ42AsyncClient, id: str) -> Dataset:
+        """
+        Load an existing dataset
+
+        :param client: an async client instance
+        :param id: the id of the existing dataset
+        :returns: the dataset
+        """
+        res: StorageProto = await client.storage_client.GetStorage(
+            request=GetStorageRequest(storage_id=id)
+        )
+        return Dataset.from_proto(client=client, msg=res)
+
+    @handle_generic_sdk_errors
+    async def _get(self) -> StorageProto:
+        return await self._client.storage_client.GetStorage(
+            request=GetStorageRequest(storage_id=self.id)
+        )
+
+    async def _refresh(self) -> None:
+        self.data = await self._get()
+
+    @staticmethod
+    def from_proto(client: TQ42AsyncClient, msg: StorageProto) -> Dataset:
+        """
+        Creates Dataset instance from a protobuf message.
+
+        :meta private:
+        """
+        return Dataset(client=client, id=msg.id, data=msg)
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def create(
+        client: TQ42AsyncClient,
+        project_id: str,
+        name: str,
+        description: str,
+        sensitivity: DatasetSensitivityProto,
+        file: str = None,
+        url: str = None,
+    ) -> Dataset:
+        """
+        Create a dataset for a project.
+
+        :params client: an async client instance
+        :param project_id: the id of the project where the dataset should be created in
+        :param name: name for the dataset
+        :param description: description for the dataset
+        :param sensitivity: sensitivity of the dataset (e.g. `DatasetSensitivityProto.SENSITIVE` for a sensitive dataset)
+        :param file: path to local file that should be uploaded to the dataset
+        :param url: url to remote file that should be uploaded to the dataset
+        :returns: the created dataset
+
+        Only one of `url` or `file` can be specified.
+        """
+        if (file and url) or (not file and not url):
+            raise ValueError("Please provide (only) one of: file or url")
+
+        if url:
+            res: StorageProto = (
+                await client.storage_client.CreateStorageFromExternalBucket(
+                    request=CreateStorageFromExternalBucketRequest(
+                        project_id=project_id,
+                        name=name,
+                        description=description,
+                        url=url,
+                        sensitivity=sensitivity,
+                    )
+                )
+            )
+            return Dataset.from_proto(client=client, msg=res)
+
+        file_path = Path(file)
+        if not file_path.exists():
+            raise FileNotFoundError("The specified file does not exist")
+
+        data = await asyncio.to_thread(file_path.read_bytes)
+        file_hash_b64 = base64.b64encode(hashlib.md5(data).digest()).decode("utf-8")
+
+        res: CreateStorageFromFileResponse = (
+            await client.storage_client.CreateStorageFromFile(
+                request=CreateStorageFromFileRequest(
+                    project_id=project_id,
+                    name=name,
+                    description=description,
+                    hash_md5=file_hash_b64,
+                    file_name=file_path.name,
+                    sensitivity=sensitivity,
+                )
+            )
+        )
+        # the upload over HTTP blocks, so it runs in a worker thread
+        await asyncio.to_thread(
+            Dataset._upload_file,
+            signed_url=res.signed_url,
+            data=data,
+            file_name=file_path.name,
+            file_hash_b64=file_hash_b64,
+        )
+        return Dataset.from_proto(client=client, msg=res.storage)
+
+    @handle_generic_sdk_errors
+    async def export(self, directory_path: str = ".") -> List[str]:
+        """
+        Export all files within a dataset to a local path
+
+        :param directory_path: local path where all files should be exported to (must exist and be a directory)
+        :returns: a list of exported file paths
+        """
+        if not os.path.isdir(directory_path):
+            raise ValueError(
+                f"Provided directory path {directory_path} is not a valid directory"
+            )
+
+        res: ExportStorageResponse = await self._client.storage_client.ExportStorage(
+            request=ExportStorageRequest(storage_id=self.id)
+        )
+
+        export_dir = os.path.join(directory_path, self.data.name)
+        os.makedirs(export_dir, exist_ok=True)
+
+        exported_file_paths = []
+
+        for signed_url in res.signed_urls:
+            file_path = os.path.join(
+                export_dir,
+                self._get_file_name_from_signed_url(signed_url=signed_url),
+            )
+            # downloads over HTTP block, so they run in a worker thread
+            await asyncio.to_thread(
+                self._download_file_from_url, url=signed_url, file_path=file_path
+            )
+            exported_file_paths.append(file_path)
+
+        return exported_file_paths
+
+    @handle_generic_sdk_errors
+    async def delete(self):
+        """
+        Delete this dataset.
+        """
+        delete_dataset_request = DeleteStorageRequest(storage_id=self.id)
+        self.data = await self._client.storage_client.DeleteStorage(
+            request=delete_dataset_request
+        )
+
+
+@handle_generic_sdk_errors
+async def list_all(client: TQ42AsyncClient, project_id: str) -> List[Dataset]:
+    """
+    List all datasets in a project.
+
+    :param client: an async client instance
+    :param project_id: the id of a project
+    :returns: a list of datasets
+    """
+    list_datasets_request = ListStoragesRequest(
+        project_id=project_id, type=StorageType.DATASET
+    )
+    res: ListStoragesResponse = await client.storage_client.ListStorages(
+        request=list_datasets_request
+    )
+    return PrettyList(
+        [Dataset.from_proto(client=client, msg=dataset) for dataset in res.storages]
+    )
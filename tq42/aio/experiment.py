@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import Optional, List
+
+from google.protobuf.field_mask_pb2 import FieldMask
+
+from tq42 import experiment
+from tq42.experiment import (
+    ExperimentProto,
+    GetExperimentRequest,
+    ListExperimentsRequest,
+    ListExperimentsResponse,
+    UpdateExperimentRequest,
+)
+from tq42.utils.cache import get_current_value
+from tq42.utils.exception_handling import handle_generic_sdk_errors
+from tq42.utils.pretty_list import PrettyList
+
+from typing import TYPE_CHECKING
+
+# only import the stuff for type hints -> avoid circular imports
+if TYPE_CHECKING:
+    from tq42.client import TQ42AsyncClient
+
+
+class Experiment(experiment.Experiment):
+    """
+    Reference an existing experiment on an async client.
+    Use :py:meth:`get` to load an experiment by its id.
+
+    :param client: an async client instance
+    :param id: the id of the existing experiment
+    :param data: the current state of the experiment
+    """
+
+    _client: TQ42AsyncClient
+
+    def __init__(self, client: TQ42AsyncClient, id: str, data: ExperimentProto):
+        self._client = client
+        self.id = id
+        self.data = data
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def get(client: TQ42AsyncClient, id: str) -> Experiment:
+        """
+        Load an existing experiment
+
+        :param client: an async client instance
+        :param id: the id of the existing experiment
+        :returns: the experiment
+        """
+        res: ExperimentProto = await client.experiment_client.GetExperiment(
+            request=GetExperimentRequest(id=id)
+        )
+        return Experiment.from_proto(client=client, msg=res)
+
+    @handle_generic_sdk_errors
+    async def _get_data(self) -> ExperimentProto:
+        return await self._client.experiment_client.GetExperiment(
+            request=GetExperimentRequest(id=self.id)
+        )
+
+    @staticmethod
+    def from_proto(client: TQ42AsyncClient, msg: ExperimentProto) -> Experiment:
+        """
+        Creates Experiment instance from a protobuf message.
+
+        :meta private:
+        """
+        return Experiment(client=client, id=msg.id, data=msg)
+
+    @handle_generic_sdk_errors
+    async def update(self, name: str) -> Experiment:
+        """
+        Update the name of the experiment
+
+        :param name: new name for the experiment
+        :returns: the updated experiment
+        """
+        field_mask = FieldMask()
+        field_mask.paths.append("id")
+        field_mask.paths.append("name")
+
+        update_proj_request = UpdateExperimentRequest(
+            update_mask=field_mask, id=self.id, name=name
+        )
+        self.data = await self._client.experiment_client.UpdateExperiment(
+            request=update_proj_request
+        )
+
+        return self
+
+    async def set_friendly_name(self, friendly_name: str) -> Experiment:
+        """
+        Set the friendly name of the experiment
+
+        :param friendly_name: new friendly name for the experiment
+        :returns: the updated experiment
+        """
+        return await self.update(name=friendly_name)
+
+
+@handle_generic_sdk_errors
+async def list_all(
+    client: TQ42AsyncClient, project_id: Optional[str] = None
+) -> List[Experiment]:
+    """
+    List all the experiments you have permission to view within a specific project.
+    If no project_id is specified the currently set project id will be used for this.
+
+    :param client: an async client instance
+    :param project_id: the id of the project to list experiments for (defaults to the currently set project)
+    :returns: a list of all experiments
+    """
+    if not project_id:
+        project_id = get_current_value("proj")
+
+    list_experiments_request = ListExperimentsRequest(project_id=project_id)
+    res: ListExperimentsResponse = await client.experiment_client.ListExperiments(
+        request=list_experiments_request
+    )
+    return PrettyList(
+        [Experiment.from_proto(client=client, msg=msg) for msg in res.experiments]
+    )
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Iterable, List, Mapping, Any, Optional, Union
+
+import grpc
+
+
+from tq42 import experiment_run
+from tq42.experiment_run import (
+    HardwareProto,
+    CancelExperimentRunRequest,
+    CreateExperimentRunRequest,
+    ExperimentRunProto,
+    GetExperimentRunRequest,
+    ListExperimentRunsRequest,
+    ListExperimentRunsResponse,
+    _TERMINAL_STATUSES,
+    _stored_run_async,
+    _store_run_async,
+)
+from tq42.exceptions import ExperimentRunCancelError
+from tq42.utils import poll_strategy, struct_codec
+from tq42.utils.poll_strategy import PollStrategy, Poller
+from tq42.utils.exception_handling import handle_generic_sdk_errors
+from tq42.utils.pretty_list import PrettyList
+
+from typing import TYPE_CHECKING
+
+# only import the stuff for type hints -> avoid circular imports
+if TYPE_CHECKING:
+    from tq42.client import TQ42AsyncClient
+
+
+class ExperimentRun(experiment_run.ExperimentRun):
+    """
+    Reference an existing experiment run on an async client.
+    Use :py:meth:`get` to load an experiment run by its id.
+
+    :param client: an async client instance
+    :param id: the id of the existing experiment run
+    :param data: the current state of the experiment run
+    """
+
+    _client: TQ42AsyncClient
+
+    def __init__(self, client: TQ42AsyncClient, id: str, data: ExperimentRunProto):
+        self._client = client
+        self.id = id
+        self.data = data
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def get(client: TQ42AsyncClient, id: str) -> ExperimentRun:
+        """
+        Load an existing experiment run
+
+        :param client: an async client instance
+        :param id: the id of the existing experiment run
+        :returns: the experiment run
+        """
+        stored = await _stored_run_async(client, id)
+        if stored is not None:
+            return ExperimentRun.from_proto(client=client, msg=stored)
+
+        res: ExperimentRunProto = await client.experiment_run_client.GetExperimentRun(
+            request=GetExperimentRunRequest(experiment_run_id=id)
+        )
+        await _store_run_async(client, res)
+        return ExperimentRun.from_proto(client=client, msg=res)
+
+    @handle_generic_sdk_errors
+    async def _get_data(self) -> ExperimentRunProto:
+        """
+        Gets a specific experiment run by id
+        """
+        stored = await _stored_run_async(self._client, self.id)
+        if stored is not None:
+            return stored
+
+        get_exp_run_request = GetExperimentRunRequest(experiment_run_id=self.id)
+
+        res = await self._client.experiment_run_client.GetExperimentRun(
+            request=get_exp_run_request
+        )
+        await _store_run_async(self._client, res)
+        return res
+
+    @staticmethod
+    def from_proto(client: TQ42AsyncClient, msg: ExperimentRunProto) -> ExperimentRun:
+        """
+        Creates ExperimentRun instance from a protobuf message.
+
+        :meta private:
+        """
+        return ExperimentRun(client=client, id=msg.id, data=msg)
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def create(
+        client: TQ42AsyncClient,
+        algorithm: str,
+        version: str,
+        experiment_id: str,
+        compute: HardwareProto,
+        parameters: Mapping[str, Any],
+        compression: Optional[grpc.Compression] = None,
+    ) -> ExperimentRun:
+        """
+        Start a new experiment run in an experiment
+
+        :param client: an async client instance
+        :param algorithm: name of the algorithm (e.g. `'TOY'`)
+        :param version: version of the algorithm in the format `x.y.z`
+        :param experiment_id: id of the experiment in which the run should be started
+        :param compute: the hardware specification on which the run should be started (e.g. `HardwareProto.SMALL`)
+        :param parameters: dict with parameters for the algorithm
+        :param compression: compression of the request, overrides the compression configured on the client
+            (e.g. `grpc.Compression.Gzip` for large parameters)
+        :returns: the created experiment run
+        """
+
+        request = CreateExperimentRunRequest(
+            experiment_id=experiment_id,
+            algorithm=algorithm,
+            version=version,
+            hardware=compute,
+            metadata=struct_codec.encode_struct(parameters),
+        )
+
+        res: ExperimentRunProto = (
+            await client.experiment_run_client.CreateExperimentRun(
+                request=request, compression=compression
+            )
+        )
+
+        return ExperimentRun.from_proto(client=client, msg=res)
+
+    @staticmethod
+    async def create_many(
+        client: TQ42AsyncClient,
+        experiment_id: str,
+        specs: Iterable[Mapping[str, Any]],
+        max_concurrency: int = 16,
+    ) -> List[Union[ExperimentRun, Exception]]:
+        """
+        Start many experiment runs in an experiment at once, e.g. for a parameter sweep.
+
+        :param client: an async client instance
+        :param experiment_id: id of the experiment in which the runs should be started
+        :param specs: one dict per run with the arguments `algorithm`, `version`, `compute`, `parameters` and
+            optionally `compression` of :py:meth:`create`
+        :param max_concurrency: number of runs submitted at the same time (default: 16)
+        :returns: the created experiment runs in the order of `specs`. If a run could not be created,
+            the exception raised for it takes its place, the other runs are still created.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency has to be at least 1, got {max_concurrency}"
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def submit(spec: Mapping[str, Any]) -> ExperimentRun:
+            async with semaphore:
+                return await ExperimentRun.create(
+                    client=client, experiment_id=experiment_id, **spec
+                )
+
+        return PrettyList(
+            await asyncio.gather(
+                *[submit(spec) for spec in specs], return_exceptions=True
+            )
+        )
+
+    @handle_generic_sdk_errors
+    async def check(self) -> ExperimentRun:
+        """
+        Update the state of the experiment run
+
+        :returns: the updated experiment run
+        """
+        self.data = await self._get_data()
+        return self
+
+    @handle_generic_sdk_errors
+    async def poll(
+        self,
+        tries: Optional[int] = None,
+        initial_delay: Optional[float] = None,
+        delay: Optional[float] = None,
+        backoff: Optional[float] = None,
+        strategy: Optional[PollStrategy] = None,
+        timeout: Optional[float] = None,
+    ) -> ExperimentRun:
+        """
+        Wait for the experiment run to finish without blocking the event loop.
+
+        By default, the run is checked right away and then with a delay that grows with every check, up to a
+        maximum that depends on the state of the run. Pass a :py:class:`PollStrategy` to change this.
+        The arguments `tries`, `initial_delay`, `delay` and `backoff` keep their previous behavior of a fixed
+        number of checks and override the corresponding settings of `strategy`.
+
+        :param tries: how many retries until the poll loop is cancelled
+        :param initial_delay: initial delay before starting poll loop
+        :param delay: initial delay between retries
+        :param backoff: backoff factor between retries
+        :param strategy: when to check the state of the run (default: :py:class:`PollStrategy`)
+        :param timeout: seconds after which polling is given up (default: the timeout of `strategy`, 1000 seconds)
+        :returns: the finished experiment run
+        :raises: ExceedRetriesError if `tries` are exceeded
+        :raises: PollTimeoutError if the run did not finish within `timeout` seconds
+        """
+        poller = Poller(
+            poll_strategy.resolve(
+                strategy,
+                tries=tries,
+                initial_delay=initial_delay,
+                delay=delay,
+                backoff=backoff,
+                timeout=timeout,
+            )
+        )
+        await asyncio.sleep(poller.initial_delay)
+
+        while True:
+            self.data = await self._get_data()
+            if self.data.status in _TERMINAL_STATUSES:
+                return self
+
+            await asyncio.sleep(poller.next_delay(self.data.status))
+
+    @handle_generic_sdk_errors
+    async def cancel(self) -> ExperimentRun:
+        """
+        Cancel a run that is QUEUED, PENDING, or RUNNING.
+
+        :returns: the cancelled experiment run
+        :raises: ExperimentRunCancelError if the experiment run is not queued, pending or running
+        """
+        try:
+            cancel_exp_runs_response = CancelExperimentRunRequest(
+                experiment_run_id=self.id
+            )
+            await self._client.experiment_run_client.CancelExperimentRun(
+                request=cancel_exp_runs_response
+            )
+            return self
+        except Exception:
+            raise ExperimentRunCancelError()
+
+
+@handle_generic_sdk_errors
+async def list_all(client: TQ42AsyncClient, experiment_id: str) -> List[ExperimentRun]:
+    """
+    List all the runs within an experiment you have permission to view.
+
+    :param client: an async client instance
+    :param experiment_id: id of the experiment
+    :returns: a list of experiment runs
+    """
+    list_exp_run_request = ListExperimentRunsRequest(experiment_id=experiment_id)
+
+    res: ListExperimentRunsResponse = (
+        await client.experiment_run_client.ListExperimentRuns(
+            request=list_exp_run_request
+        )
+    )
+    return PrettyList(
+        [
+            ExperimentRun.from_proto(client=client, msg=experiment_run)
+            for experiment_run in res.experiment_runs
+        ]
+    )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import List
+
+from tq42 import model
+from tq42.model import (
+    StorageProto,
+    StorageType,
+    GetStorageRequest,
+    ListStoragesRequest,
+    ListStoragesResponse,
+)
+from tq42.utils.exception_handling import handle_generic_sdk_errors
+from tq42.utils.pretty_list import PrettyList
+
+from typing import TYPE_CHECKING
+
+# only import the stuff for type hints -> avoid circular imports
+if TYPE_CHECKING:
+    from tq42.client import TQ42AsyncClient
+
+
+class Model(model.Model):
+    """
+    Reference an existing model on an async client.
+    Use :py:meth:`get` to load a model by its id.
+
+    :param client: an async client instance
+    :param id: the id of the existing model
+    :param data: the current state of the model
+    """
+
+    _client: TQ42AsyncClient
+
+    def __init__(self, client: TQ42AsyncClient, id: str, data: StorageProto):
+        self._client = client
+        self.id = id
+        self.data = data
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def get(client: TQ42AsyncClient, id: str) -> Model:
+        """
+        Load an existing model
+
+        :param client: an async client instance
+        :param id: the id of the existing model
+        :returns: the model
+        """
+        res: StorageProto = await client.storage_client.GetStorage(
+            request=GetStorageRequest(storage_id=id)
+        )
+        return Model.from_proto(client=client, msg=res)
+
+    @handle_generic_sdk_errors
+    async def _get(self) -> StorageProto:
+        return await self._client.storage_client.GetStorage(
+            request=GetStorageRequest(storage_id=self.id)
+        )
+
+    async def _refresh(self) -> None:
+        self.data = await self._get()
+
+    @staticmethod
+    def from_proto(client: TQ42AsyncClient, msg: StorageProto) -> Model:
+        """
+        Creates model instance from a protobuf message.
+
+        :meta private:
+        """
+        return Model(client=client, id=msg.id, data=msg)
+
+
+@handle_generic_sdk_errors
+async def list_all(client: TQ42AsyncClient, project_id: str) -> List[Model]:
+    """
+    List all models for a project.
+
+    :param client: an async client instance
+    :param project_id: the id of a project
+    """
+    list_models_request = ListStoragesRequest(
+        project_id=project_id, type=StorageType.MODEL
+    )
+    res: ListStoragesResponse = await client.storage_client.ListStorages(
+        request=list_models_request
+    )
+    return PrettyList(
+        [Model.from_proto(client=client, msg=model) for model in res.storages]
+    )
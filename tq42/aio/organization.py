@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Optional, List
+
+from google.protobuf import empty_pb2
+
+from tq42 import organization
+from tq42.aio.project import Project
+from tq42.organization import (
+    OrganizationProto,
+    ListOrganizationsResponse,
+    GetOrganizationRequest,
+)
+from tq42.utils.exception_handling import handle_generic_sdk_errors
+from tq42.utils.pretty_list import PrettyList
+
+from typing import TYPE_CHECKING
+
+# only import the stuff for type hints -> avoid circular imports
+if TYPE_CHECKING:
+    from tq42.client import TQ42AsyncClient
+
+
+class Organization(organization.Organization):
+    """
+    Reference an existing organization on an async client.
+    Use :py:meth:`get` to load an organization by its id.
+
+    :param client: an async client instance
+    :param id: the id of the existing organization
+    :param data: the current state of the organization
+    """
+
+    _client: TQ42AsyncClient
+
+    def __init__(
+        self, client: TQ42AsyncClient, id: str, data: OrganizationProto
+    ) -> None:
+        self._client = client
+        self.id = id
+        self.data = data
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def get(client: TQ42AsyncClient, id: str) -> Organization:
+        """
+        Load an existing organization
+
+        :param client: an async client instance
+        :param id: the id of the existing organization
+        :returns: the organization
+        """
+        res: OrganizationProto = await client.organization_client.GetOrganization(
+            request=GetOrganizationRequest(organization_id=id)
+        )
+        return Organization.from_proto(client=client, msg=res)
+
+    @handle_generic_sdk_errors
+    async def _get(self) -> OrganizationProto:
+        return await self._client.organization_client.GetOrganization(
+            request=GetOrganizationRequest(organization_id=self.id)
+        )
+
+    @staticmethod
+    def from_proto(client: TQ42AsyncClient, msg: OrganizationProto) -> Organization:
+        """
+        Creates organization instance from a protobuf message.
+
+        :meta private:
+        """
+        return Organization(client=client, id=msg.id, data=msg)
+
+    @handle_generic_sdk_errors
+    async def set(self) -> Organization:
+        """
+        Sets the current organization as the default organization.
+
+        :returns: organization instance
+        """
+        project = await Project.get_default(
+            client=self._client, organization_id=self.id
+        )
+        if project:
+            project.set()
+            return self
+
+        raise KeyError()
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def get_default_org(client: TQ42AsyncClient) -> Optional[Organization]:
+        """
+        Gets the default organization for this user based on the default_org field
+
+        :returns: the default organization if one is set as a default
+        """
+        org_list = await list_all(client=client)
+        if len(org_list) == 0:
+            return None
+
+        orgs_sorted = sorted(org_list, key=lambda o: o.id)
+        return orgs_sorted[0]
+
+
+@handle_generic_sdk_errors
+async def list_all(client: TQ42AsyncClient) -> List[Organization]:
+    """
+    List all the organizations you have permission to view.
+
+    :param client: an async client instance
+    :returns: a list of all organizations
+    """
+    empty = empty_pb2.Empty()
+    res: ListOrganizationsResponse = await client.organization_client.ListOrganizations(
+        request=empty
+    )
+    return PrettyList(
+        [Organization.from_proto(client=client, msg=msg) for msg in res.organizations]
+    )
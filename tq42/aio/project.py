@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Optional, List
+
+from tq42 import project
+from tq42.project import (
+    ProjectProto,
+    GetProjectRequest,
+    UpdateProjectRequest,
+    ListProjectsRequest,
+    ListProjectsResponse,
+)
+from tq42.utils.cache import get_current_value
+from tq42.utils.exception_handling import handle_generic_sdk_errors
+from tq42.utils.pretty_list import PrettyList
+
+from typing import TYPE_CHECKING
+
+# only import the stuff for type hints -> avoid circular imports
+if TYPE_CHECKING:
+    from tq42.client import TQ42AsyncClient
+
+
+class Project(project.Project):
+    """
+    Reference an existing project on an async client.
+    Use :py:meth:`get` to load a project by its id.
+
+    :param client: an async client instance
+    :param id: the id of the existing project
+    :param data: the current state of the project
+    """
+
+    _client: TQ42AsyncClient
+
+    def __init__(self, client: TQ42AsyncClient, id: str, data: ProjectProto) -> None:
+        self._client = client
+        self.id = id
+        self.data = data
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def get(client: TQ42AsyncClient, id: str) -> Project:
+        """
+        Load an existing project
+
+        :param client: an async client instance
+        :param id: the id of the existing project
+        :returns: the project
+        """
+        res: ProjectProto = await client.project_client.GetProject(
+            request=GetProjectRequest(project_id=id)
+        )
+        return Project.from_proto(client=client, msg=res)
+
+    @handle_generic_sdk_errors
+    async def _get(self) -> ProjectProto:
+        return await self._client.project_client.GetProject(
+            request=GetProjectRequest(project_id=self.id)
+        )
+
+    @staticmethod
+    def from_proto(client: TQ42AsyncClient, msg: ProjectProto) -> Project:
+        """
+        Creates Project instance from a protobuf message.
+
+        :meta private:
+        """
+        return Project(client=client, id=msg.id, data=msg)
+
+    @handle_generic_sdk_errors
+    async def update(self, name: str) -> Project:
+        """
+        Update the name of the project
+
+        :param name: new name for the project
+        :returns: the updated project
+        """
+        update_proj_request = UpdateProjectRequest(project_id=self.id, name=name)
+        self.data = await self._client.project_client.UpdateProject(
+            request=update_proj_request
+        )
+        return self
+
+    async def set_friendly_name(self, friendly_name: str) -> Project:
+        """
+        Set a friendly name for a project.
+
+        :param friendly_name: new friendly name for the project
+        :returns: the updated project
+        """
+        return await self.update(name=friendly_name)
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def show(client: TQ42AsyncClient) -> Project:
+        """
+        Returns the current default project.
+
+        :param client: an async client instance
+        :raises: NoDefaultError if no default project is set
+        :returns: the current default project
+        """
+        proj = get_current_value("proj")
+        return await Project.get(client=client, id=proj)
+
+    @staticmethod
+    @handle_generic_sdk_errors
+    async def get_default(
+        client: TQ42AsyncClient, organization_id: str
+    ) -> Optional[Project]:
+        """
+        Gets the default project in an organization
+
+        :param client: an async client instance
+        :param organization_id: the id of the organization
+        :returns: the default project if there is at least one project in the organization
+        """
+        project_list = await list_all(client=client, organization_id=organization_id)
+        if len(project_list) == 0:
+            return None
+
+        projects_sorted = sorted(project_list, key=lambda proj: proj.id)
+        return projects_sorted[0]
+
+
+@handle_generic_sdk_errors
+async def list_all(
+    client: TQ42AsyncClient, organization_id: Optional[str] = None
+) -> List[Project]:
+    """
+    List all the projects you have permission to view within the organization.
+
+    :param client: an async client instance
+    :param organization_id: optionally an id of an organization, defaults to the default organization
+    :returns: a list of projects
+    """
+    if not organization_id:
+        organization_id = get_current_value("org")
+
+    create_list_proj_request = ListProjectsRequest(organization_id=organization_id)
+
+    res: ListProjectsResponse = await client.project_client.ListProjects(
+        request=create_list_proj_request
+    )
+    return PrettyList(
+        [Project.from_proto(client=client, msg=data) for data in res.projects]
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
 from typing import List, Callable, Optional, Awaitable
 
@@ -72,7 +73,7 @@ class Channel:
 
         empty = empty_pb2.Empty()
         res: CreateChannelResponse = await client.channel_client.CreateChannel(
-            request=empty, metadata=client.metadata
+            request=empty
         )
         return Channel(client=client, id=res.channel_id)
 
@@ -88,7 +89,7 @@ class Channel:
         ASK gets into the callback and then we expect a TELL answer
 
         :param callback: Async callback that handles an ASK message and returns a TELL message
-        :param finish_callback: Callback that is called when channel is completed
+        :param finish_callback: Callback or async callback that is called when channel is completed
         :param int max_duration_in_sec: Timeout for whole connection in seconds. `None` -> no timeout for overall flow
         :param int message_timeout_in_sec: Timeout between messages in seconds. `None` -> no timeout between messages
         """
@@ -152,13 +153,14 @@ class Channel:
         await asyncio.wait_for(_handle(), timeout=max_duration_in_sec)
         await call.done_writing()
 
-        finish_callback()
+        # the callback may be a coroutine function, e.g. to await `ExperimentRun.poll_async`
+        finished = finish_callback()
+        if inspect.isawaitable(finished):
+            await finished
 
     async def _establish_connection(self):
-        metadata: tuple = (
-            *self._client.metadata,
-            ("channel-id", self.id),
-        )
+        # the authorization is attached by the call credentials of the channel
+        metadata: tuple = (("channel-id", self.id),)
         call = self._client.channel_client.ConnectChannelCustomer(metadata=metadata)
 
         await call.write(ChannelMessage())
@@ -1,15 +1,39 @@
+import asyncio
 import json
 import os
+import threading
 import webbrowser
+import weakref
+from dataclasses import astuple, dataclass
 from datetime import datetime
+from functools import cached_property
+from typing import Optional, Tuple, Callable, TypeVar, Set, List, Any, Dict, Mapping
 
 import grpc
 from grpc import aio
-import requests
 
-from tq42.utils import file_handling, misc
-from tq42.utils.token_manager import TokenManager
+from tq42.utils import file_handling, http, misc, transport_registry
+from tq42.utils.token_manager import TokenCacheStats, TokenManager
+from tq42.utils.channel_pool import (
+    ChannelPool,
+    AioChannelPool,
+    ChannelSelection,
+    POOLED_CHANNEL_OPTIONS,
+)
+from tq42.utils.call_stats import (
+    AioStatsInterceptor,
+    CallStats,
+    MethodStats,
+    StatsInterceptor,
+)
 from tq42.utils.exception_handling import handle_generic_sdk_errors
+from tq42.utils.rate_limit import (
+    AioRateLimitInterceptor,
+    RateLimit,
+    RateLimiter,
+    RateLimitInterceptor,
+)
+from tq42.utils.run_store import RunStore
 import time
 
 from com.terraquantum.experiment.v3alpha1.experiment import (
@@ -35,6 +59,25 @@ import com.terraquantum.plan.v1.plan.plan_service_pb2_grpc as pb2_plan_grpc
 from tq42.utils.environment import ConfigEnvironment, environment_default_set
 from tq42.exceptions import AuthenticationError
 
+_EXPERIMENT_RUN_SERVICE = (
+    "com.terraquantum.experiment.v3alpha2.experimentrun.ExperimentRunService"
+)
+_STORAGE_SERVICE = "com.terraquantum.storage.v1alpha1.StorageService"
+_PROJECT_SERVICE = "com.terraquantum.project.v2.ProjectService"
+_ORGANIZATION_SERVICE = (
+    "com.terraquantum.organization.v2.organization.OrganizationService"
+)
+_PLAN_SERVICE = "com.terraquantum.plan.v1.plan.PlanService"
+
+# read-only calls can be repeated safely, transient failures are retried quickly instead of failing a long poll
+_idempotent_retry_policy = {
+    "maxAttempts": 5,
+    "initialBackoff": "0.1s",
+    "maxBackoff": "5s",
+    "backoffMultiplier": 2,
+    "retryableStatusCodes": ["UNAVAILABLE"],
+}
+
 _service_config = {
     "methodConfig": [
         {
@@ -51,15 +94,415 @@ _service_config = {
                 "backoffMultiplier": 2,
                 "retryableStatusCodes": ["UNAVAILABLE", "INTERNAL", "DATA_LOSS"],
             },
-        }
-    ]
+        },
+        {
+            "name": [
+                {"service": _EXPERIMENT_RUN_SERVICE, "method": "GetExperimentRun"},
+                {"service": _STORAGE_SERVICE, "method": "GetStorage"},
+                {"service": _PROJECT_SERVICE, "method": "GetProject"},
+                {"service": _PLAN_SERVICE, "method": "CheckFunctionality"},
+            ],
+            "timeout": "30s",
+            "retryPolicy": _idempotent_retry_policy,
+        },
+        {
+            "name": [
+                {"service": _EXPERIMENT_RUN_SERVICE, "method": "ListExperimentRuns"},
+                {"service": _STORAGE_SERVICE, "method": "ListStorages"},
+                {"service": _PROJECT_SERVICE, "method": "ListProjects"},
+                {"service": _ORGANIZATION_SERVICE, "method": "ListOrganizations"},
+            ],
+            "timeout": "60s",
+            "retryPolicy": _idempotent_retry_policy,
+        },
+    ],
+    # every failed call takes one of 10 tokens and every successful call returns a tenth of one. Retries stop while
+    # 5 or fewer tokens are left, e.g. after 5 failures in a row, and every failure takes 10 successful calls to make up
+    # for, so retries cannot amplify an outage
+    "retryThrottling": {"maxTokens": 10, "tokenRatio": 0.1},
 }
 
+T = TypeVar("T")
 
-class TQ42Client:
+# keeps a reference to pending close tasks so they are not garbage collected before they are done
+_closing_tasks: Set[asyncio.Task] = set()
+
+# cached properties holding a stub bound to the API channel of a client
+_API_STUB_ATTRIBUTES = (
+    "organization_client",
+    "project_client",
+    "experiment_client",
+    "storage_client",
+    "experiment_run_client",
+    "plan_client",
+)
+# cached properties holding a stub, they are bound to the channels of a client
+_STUB_ATTRIBUTES = _API_STUB_ATTRIBUTES + ("channel_client",)
+
+_api_channel_options = [
+    ("grpc.enable_retries", 1),
+    ("grpc.service_config", json.dumps(_service_config)),
+]
+
+
+@dataclass(frozen=True)
+class TransportOptions:
+    """
+    Tuning of the connections a client opens to TQ42.
+
+    Example:
+        >>> import grpc
+        ...
+        ... options = TransportOptions(
+        ...     compression=grpc.Compression.Gzip,
+        ...     max_receive_message_length=50_000_000,
+        ...     keepalive_time_ms=30_000,
+        ... )
+        ... with TQ42Client(transport_options=options) as client:
+        ...     ...
+    """
+
+    max_receive_message_length: int = 10_000_000
+    """Maximum size of a response in bytes"""
+    max_send_message_length: Optional[int] = None
+    """Maximum size of a request in bytes (default: no limit)"""
+    compression: Optional[grpc.Compression] = None
+    """Compression of all requests of the client (e.g. `grpc.Compression.Gzip`), single calls can override it"""
+    keepalive_time_ms: Optional[int] = None
+    """Interval of keepalive pings on an open connection (default: no keepalive pings)"""
+    keepalive_timeout_ms: Optional[int] = None
+    """Time to wait for the answer of a keepalive ping before the connection is considered broken"""
+    keepalive_permit_without_calls: bool = False
+    """Send keepalive pings even if there is no call in flight"""
+
+    def channel_options(self) -> List[Tuple[str, Any]]:
+        """
+        :meta private:
+        """
+        options = [("grpc.max_receive_message_length", self.max_receive_message_length)]
+        if self.max_send_message_length is not None:
+            options.append(
+                ("grpc.max_send_message_length", self.max_send_message_length)
+            )
+        if self.keepalive_time_ms is not None:
+            options.append(("grpc.keepalive_time_ms", self.keepalive_time_ms))
+        if self.keepalive_timeout_ms is not None:
+            options.append(("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms))
+        if self.keepalive_permit_without_calls:
+            options.append(("grpc.keepalive_permit_without_calls", 1))
+        return options
+
+
+def _close_aio_channel(channel: aio.Channel) -> None:
+    """
+    Closes an aio channel from synchronous code.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # unlike asyncio.run this leaves the current event loop in place, which new aio channels are bound to
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(channel.close())
+        finally:
+            loop.close()
+        return
+
+    # we are called from within the event loop, so the channel is closed as soon as we return to it
+    task = loop.create_task(channel.close())
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
+
+
+def _close_aio_channel_of_loop(
+    loop: asyncio.AbstractEventLoop, channel: aio.Channel
+) -> None:
+    """
+    Closes an aio channel on the event loop it was created on.
+    """
+    if loop.is_closed():
+        return
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if loop is running:
+        _close_aio_channel(channel)
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(channel.close(), loop)
+    else:
+        loop.run_until_complete(channel.close())
+
+
+class _AccessTokenAuthPlugin(grpc.AuthMetadataPlugin):
+    """
+    Attaches the access token of a token manager to every call on a channel.
+
+    gRPC invokes the plugin on its own thread, so a token refresh never blocks the caller or the event loop.
+    """
+
+    def __init__(self, token_manager: TokenManager):
+        self._token_manager = token_manager
+        # token the cached metadata was built for and the metadata itself
+        self._metadata_cache: Tuple[Optional[str], tuple] = (None, ())
+
+    @property
+    def metadata(self) -> tuple:
+        token = self._token_manager.access_token
+        cached_token, metadata = self._metadata_cache
+        if token != cached_token:
+            metadata = (("authorization", "Bearer " + token),)
+            self._metadata_cache = (token, metadata)
+
+        return metadata
+
+    def __call__(self, context, callback):
+        try:
+            metadata = self.metadata
+        except Exception as e:
+            callback(None, e)
+            return
+
+        callback(metadata, None)
+
+
+class _BaseClient:
+    """
+    State and authentication handling shared by the sync and the async client.
+    """
+
+    def __init__(
+        self,
+        channel_pool_size: int = 1,
+        channel_selection: ChannelSelection = ChannelSelection.ROUND_ROBIN,
+        transport_options: Optional[TransportOptions] = None,
+        call_stats: Optional[CallStats] = None,
+        rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        run_store: Optional[RunStore] = None,
+    ):
+        self._transport_options = transport_options or TransportOptions()
+        self._call_stats = call_stats or CallStats()
+        self._rate_limiter = RateLimiter(rate_limits) if rate_limits else None
+        self._channel_pool_size = channel_pool_size
+        self._channel_selection = channel_selection
+        self._run_store = run_store
+        self._environment = ConfigEnvironment.from_env()
+        self._token_manager = self._create_token_manager()
+        self._auth_plugin = _AccessTokenAuthPlugin(self._token_manager)
+        # channels and stubs are only created once they are used
+        self._create_lock = threading.Lock()
+
+    def _create_token_manager(self) -> TokenManager:
+        return TokenManager(self._environment)
+
+    def _create_once(self, name: str, factory: Callable[[], T]) -> T:
+        """
+        Creates the attribute `name` with `factory` unless another thread already did.
+        """
+        with self._create_lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = factory()
+            return self.__dict__[name]
+
+    def _detach_channels(self) -> tuple:
+        """
+        Removes the channels and the stubs bound to them from the client and returns the channels that were created.
+        The next call creates new channels.
+        """
+        with self._create_lock:
+            for name in _STUB_ATTRIBUTES:
+                self.__dict__.pop(name, None)
+            return (
+                self.__dict__.pop("_api_channel", None),
+                self.__dict__.pop("channels_channel", None),
+            )
+
+    def _detach_api_channel(self) -> None:
+        """
+        Removes the API channel and the stubs bound to it from the client without closing it.
+        The next call creates a new channel.
+        """
+        with self._create_lock:
+            for name in _API_STUB_ATTRIBUTES:
+                self.__dict__.pop(name, None)
+            self.__dict__.pop("_api_channel", None)
+
+    def _create_api_channel(self):
+        raise NotImplementedError()
+
+    def _create_channels_channel(self) -> aio.Channel:
+        return aio.secure_channel(
+            self._environment.channels_host,
+            self._channel_credentials(),
+            options=self._transport_options.channel_options(),
+            compression=self._transport_options.compression,
+            interceptors=self._aio_interceptors(),
+        )
+
+    def _aio_interceptors(self) -> list:
+        # the rate limit is applied first, so the waiting time is not counted as latency of the call
+        interceptors = [AioStatsInterceptor(self._call_stats)]
+        if self._rate_limiter is not None:
+            interceptors.insert(
+                0, AioRateLimitInterceptor(self._rate_limiter, self._call_stats)
+            )
+        return interceptors
+
+    def _instrumented_api_channel(self):
+        """
+        The API channel the stubs are bound to.
+        """
+        return self._api_channel
+
+    def stats(self) -> Dict[str, MethodStats]:
+        """
+        Latency, payload size and status code statistics of the calls made by this client so far.
+
+        :returns: the statistics per method, e.g. `ExperimentRunService/GetExperimentRun`
+        """
+        return self._call_stats.snapshot()
+
+    @property
+    def token_cache_stats(self) -> TokenCacheStats:
+        """
+        How often the access token was served from memory instead of the token storage, e.g.
+        `client.token_cache_stats.hit_rate`. Clients created with `shared_transport=True` share these statistics.
+        """
+        return self._token_manager.cache_stats
+
+    @cached_property
+    def _api_channel(self):
+        return self._create_once("_api_channel", self._create_api_channel)
+
+    @cached_property
+    def channels_channel(self) -> aio.Channel:
+        """
+        :meta private:
+        """
+        return self._create_once("channels_channel", self._create_channels_channel)
+
+    @cached_property
+    def organization_client(self) -> pb2_org_grpc.OrganizationServiceStub:
+        """
+        :meta private:
+        """
+        return pb2_org_grpc.OrganizationServiceStub(self._instrumented_api_channel())
+
+    @cached_property
+    def project_client(self) -> pb2_proj_grpc.ProjectServiceStub:
+        """
+        :meta private:
+        """
+        return pb2_proj_grpc.ProjectServiceStub(self._instrumented_api_channel())
+
+    @cached_property
+    def experiment_client(self) -> pb2_exp_grpc.ExperimentServiceStub:
+        """
+        :meta private:
+        """
+        return pb2_exp_grpc.ExperimentServiceStub(self._instrumented_api_channel())
+
+    @cached_property
+    def storage_client(self) -> pb2_data_grpc.StorageServiceStub:
+        """
+        :meta private:
+        """
+        return pb2_data_grpc.StorageServiceStub(self._instrumented_api_channel())
+
+    @cached_property
+    def experiment_run_client(self) -> pb2_exp_run_grpc.ExperimentRunServiceStub:
+        """
+        :meta private:
+        """
+        return pb2_exp_run_grpc.ExperimentRunServiceStub(
+            self._instrumented_api_channel()
+        )
+
+    @cached_property
+    def plan_client(self) -> pb2_plan_grpc.PlanServiceStub:
+        """
+        :meta private:
+        """
+        return pb2_plan_grpc.PlanServiceStub(self._instrumented_api_channel())
+
+    @cached_property
+    def channel_client(self) -> pb2_channel_grpc.ChannelServiceStub:
+        """
+        :meta private:
+        """
+        return pb2_channel_grpc.ChannelServiceStub(self.channels_channel)
+
+    def _channel_credentials(self) -> grpc.ChannelCredentials:
+        # local credentials send plaintext but still allow the access token to be attached
+        transport_credentials = (
+            grpc.local_channel_credentials()
+            if self._environment.local_address
+            else grpc.ssl_channel_credentials()
+        )
+        return grpc.composite_channel_credentials(
+            transport_credentials,
+            grpc.metadata_call_credentials(self._auth_plugin),
+        )
+
+    def _api_channel_options(self) -> list:
+        options = _api_channel_options + self._transport_options.channel_options()
+        if self._channel_pool_size > 1:
+            return options + POOLED_CHANNEL_OPTIONS
+        return options
+
+    @property
+    def _token_file_path(self):
+        return self._token_manager.token_file_path
+
+    @property
+    def _timestamp_file_path(self):
+        return self._token_manager.timestamp_file_path
+
+    @property
+    def _refresh_token_file_path(self):
+        return self._token_manager.refresh_token_file_path
+
+    @property
+    def run_store(self) -> Optional[RunStore]:
+        """
+        :meta private:
+        """
+        return self._run_store
+
+    @property
+    def api_host(self) -> str:
+        """
+        :meta private:
+        """
+        return self._environment.api_host
+
+    @property
+    def metadata(self):
+        """
+        :meta private:
+        """
+        return self._auth_plugin.metadata
+
+
+class TQ42Client(_BaseClient):
     """
     Create a new instance of the TQ42Client to pass to any resource
 
+    :param channel_pool_size: number of connections to the API that calls are distributed over (default: 1).
+        Increase it for workloads with many concurrent calls.
+    :param channel_selection: how a connection of the pool is picked for a call (default: round robin)
+    :param shared_transport: share the connections to the API with all other clients of this process that use the
+        same environment and channel settings (default: false). Shared connections stay open when the client is
+        closed, use :py:meth:`close_shared_transports` to close them. These clients also share the access token of
+        their environment.
+    :param transport_options: keepalive, compression and message size limits of the connections
+    :param call_stats: collects the statistics returned by :py:meth:`stats`, pass one to add sinks or to log slow calls
+    :param rate_limits: calls per second and calls in flight per service, e.g.
+        `{"experiment_run": RateLimit(calls_per_second=20, max_in_flight=8)}`. Calls over the limit wait on the client.
+    :param run_store: keeps finished experiment runs on disk, so they are only fetched from the API once
+
     Example:
         >>> from tq42.experiment import list_all
         ...
@@ -74,40 +517,144 @@ class TQ42Client:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
-
-    def __init__(self):
-        self._environment = ConfigEnvironment.from_env()
-        self._token_manager = TokenManager(self._environment)
+        self.close()
+
+    def __init__(
+        self,
+        channel_pool_size: int = 1,
+        channel_selection: ChannelSelection = ChannelSelection.ROUND_ROBIN,
+        shared_transport: bool = False,
+        transport_options: Optional[TransportOptions] = None,
+        call_stats: Optional[CallStats] = None,
+        rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        run_store: Optional[RunStore] = None,
+    ):
+        self._shared_transport = shared_transport
+        super().__init__(
+            channel_pool_size=channel_pool_size,
+            channel_selection=channel_selection,
+            transport_options=transport_options,
+            call_stats=call_stats,
+            rate_limits=rate_limits,
+            run_store=run_store,
+        )
+        # aio channel and experiment run stub per event loop, see `aio_experiment_run_client`
+        self._aio_api_channels: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = (
+            weakref.WeakKeyDictionary()
+        )
 
         self.server_port = 443
 
-        # instantiate a channel
-        self._api_channel = grpc.secure_channel(
+    def close(self) -> None:
+        """
+        Close the channels of this client. Shared channels stay open for other clients.
+        """
+        api_channel, channels_channel = self._detach_channels()
+        with self._create_lock:
+            aio_api_channels = list(self._aio_api_channels.items())
+            self._aio_api_channels.clear()
+
+        # the token manager and the channel of a shared transport keep serving the other clients
+        if not self._shared_transport:
+            self._token_manager.close()
+            if api_channel is not None:
+                api_channel.close()
+
+        if channels_channel is not None:
+            _close_aio_channel(channels_channel)
+        for loop, (channel, _) in aio_api_channels:
+            _close_aio_channel_of_loop(loop, channel)
+
+    @staticmethod
+    def close_shared_transports() -> None:
+        """
+        Close the channels shared by all clients created with `shared_transport=True`.
+        Clients that used them create new channels on their next call.
+        """
+        transport_registry.close_shared_channels()
+
+    def _instrumented_api_channel(self) -> grpc.Channel:
+        # the interceptors are added per client, so clients sharing a channel still have their own statistics and limits
+        interceptors = [StatsInterceptor(self._call_stats)]
+        if self._rate_limiter is not None:
+            interceptors.insert(
+                0, RateLimitInterceptor(self._rate_limiter, self._call_stats)
+            )
+        return grpc.intercept_channel(self._api_channel, *interceptors)
+
+    def _create_token_manager(self) -> TokenManager:
+        if self._shared_transport:
+            # the credentials of a shared channel must not depend on the client that happened to create it
+            return transport_registry.get_or_create_token_manager(self._environment)
+        return super()._create_token_manager()
+
+    def _create_api_channel(self) -> grpc.Channel:
+        if self._shared_transport:
+            # all clients of a shared channel use the token manager of its environment
+            key = (
+                astuple(self._environment),
+                self._channel_pool_size,
+                ChannelSelection(self._channel_selection),
+                self._transport_options,
+            )
+            return transport_registry.get_or_create_channel(
+                key, self._create_unshared_api_channel, user=self
+            )
+
+        return self._create_unshared_api_channel()
+
+    def _create_aio_api_channel(self) -> aio.Channel:
+        # only used by the awaitable methods of sync resources, so a single connection is enough
+        return aio.secure_channel(
             self._environment.api_host,
-            grpc.ssl_channel_credentials(),
-            options=[
-                ("grpc.max_receive_message_length", 10_000_000),
-                ("grpc.enable_retries", 1),
-                ("grpc.service_config", json.dumps(_service_config)),
-            ],
-        )
-        self.channels_channel = aio.secure_channel(
-            self._environment.channels_host, grpc.ssl_channel_credentials()
+            self._channel_credentials(),
+            options=_api_channel_options + self._transport_options.channel_options(),
+            compression=self._transport_options.compression,
+            interceptors=self._aio_interceptors(),
         )
 
-        # bind the client and the server
-        self.organization_client = pb2_org_grpc.OrganizationServiceStub(
-            self._api_channel
-        )
-        self.project_client = pb2_proj_grpc.ProjectServiceStub(self._api_channel)
-        self.experiment_client = pb2_exp_grpc.ExperimentServiceStub(self._api_channel)
-        self.storage_client = pb2_data_grpc.StorageServiceStub(self._api_channel)
-        self.experiment_run_client = pb2_exp_run_grpc.ExperimentRunServiceStub(
-            self._api_channel
-        )
-        self.plan_client = pb2_plan_grpc.PlanServiceStub(self._api_channel)
-        self.channel_client = pb2_channel_grpc.ChannelServiceStub(self.channels_channel)
+    @property
+    def aio_experiment_run_client(self) -> pb2_exp_run_grpc.ExperimentRunServiceStub:
+        """
+        Experiment run stub bound to an aio channel, used by the awaitable methods of
+        :py:class:`tq42.experiment_run.ExperimentRun`.
+
+        aio channels only work on the event loop they were created on, so every event loop the client is used from,
+        e.g. by consecutive `asyncio.run` calls, gets its own channel on first use.
+
+        :meta private:
+        """
+        loop = asyncio.get_running_loop()
+        with self._create_lock:
+            # the channels of closed loops cannot be closed anymore, they are only dropped
+            for closed in [
+                other for other in self._aio_api_channels if other.is_closed()
+            ]:
+                del self._aio_api_channels[closed]
+            if loop not in self._aio_api_channels:
+                channel = self._create_aio_api_channel()
+                self._aio_api_channels[loop] = (
+                    channel,
+                    pb2_exp_run_grpc.ExperimentRunServiceStub(channel),
+                )
+            return self._aio_api_channels[loop][1]
+
+    def _create_unshared_api_channel(self) -> grpc.Channel:
+        def create_channel() -> grpc.Channel:
+            return grpc.secure_channel(
+                self._environment.api_host,
+                self._channel_credentials(),
+                options=self._api_channel_options(),
+                compression=self._transport_options.compression,
+            )
+
+        if self._channel_pool_size > 1:
+            return ChannelPool(
+                channel_factory=create_channel,
+                size=self._channel_pool_size,
+                selection=self._channel_selection,
+            )
+        return create_channel()
 
     @handle_generic_sdk_errors
     def login(self):
@@ -129,7 +676,7 @@ class TQ42Client:
 
     @handle_generic_sdk_errors
     def _login_without_user_interaction(self, client_id: str, client_secret: str):
-        response = requests.post(
+        response = http.session().post(
             self._environment.auth_url_token,
             data=self._environment.client_credentials_data(
                 client_id=client_id,
@@ -155,7 +702,7 @@ class TQ42Client:
         When running TQ42 Python commands, your environment needs to have access to your TQ42 account credentials.
         """
         # Send the POST request and print the response
-        response = requests.post(
+        response = http.session().post(
             self._environment.auth_url_code,
             data=self._environment.code_data,
             headers=self._environment.headers,
@@ -179,7 +726,7 @@ class TQ42Client:
 
         while True:
             # Send the POST request to get access token and extract the JSON response
-            response_token = requests.post(
+            response_token = http.session().post(
                 self._environment.auth_url_token,
                 data=data_token,
                 headers=self._environment.headers,
@@ -204,6 +751,7 @@ class TQ42Client:
             backup_save_path=self._token_file_path,
             token=access_token,
         )
+        self._token_manager.invalidate()
 
         print(
             f"Authentication is successful, access token is saved in: {save_location}."
@@ -220,27 +768,89 @@ class TQ42Client:
         )
         current_datetime = datetime.now()
         file_handling.write_to_file(self._timestamp_file_path, current_datetime)
+        self._token_manager.invalidate()
 
-    @property
-    def _token_file_path(self):
-        return self._token_manager.token_file_path
 
-    @property
-    def _timestamp_file_path(self):
-        return self._token_manager.timestamp_file_path
+class TQ42AsyncClient(_BaseClient):
+    """
+    Create a new instance of the TQ42AsyncClient to pass to any resource in :py:mod:`tq42.aio`.
 
-    @property
-    def _refresh_token_file_path(self):
-        return self._token_manager.refresh_token_file_path
+    All stubs are bound to `grpc.aio` channels, so every call returns an awaitable and many calls can be in flight
+    concurrently on a single event loop. Authentication is shared with :py:class:`TQ42Client`,
+    use :py:meth:`TQ42Client.login` to log in.
+
+    :param channel_pool_size: number of connections to the API that calls are distributed over (default: 1)
+    :param channel_selection: how a connection of the pool is picked for a call (default: round robin)
+    :param transport_options: keepalive, compression and message size limits of the connections
+    :param call_stats: collects the statistics returned by :py:meth:`stats`, pass one to add sinks or to log slow calls
+    :param rate_limits: calls per second and calls in flight per service, e.g.
+        `{"experiment_run": RateLimit(calls_per_second=20, max_in_flight=8)}`. Calls over the limit wait on the client.
+    :param run_store: keeps finished experiment runs on disk, so they are only fetched from the API once
+
+    Example:
+        >>> from tq42.aio.experiment import list_all
+        ...
+        ... async with TQ42AsyncClient() as client:
+        ...     print(await list_all(client=client, project_id="some-project-id"))
+    """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __init__(
+        self,
+        channel_pool_size: int = 1,
+        channel_selection: ChannelSelection = ChannelSelection.ROUND_ROBIN,
+        transport_options: Optional[TransportOptions] = None,
+        call_stats: Optional[CallStats] = None,
+        rate_limits: Optional[Mapping[str, RateLimit]] = None,
+        run_store: Optional[RunStore] = None,
+    ):
+        super().__init__(
+            channel_pool_size=channel_pool_size,
+            channel_selection=channel_selection,
+            transport_options=transport_options,
+            call_stats=call_stats,
+            rate_limits=rate_limits,
+            run_store=run_store,
+        )
+
+    def _create_api_channel(self) -> aio.Channel:
+        def create_channel() -> aio.Channel:
+            return aio.secure_channel(
+                self._environment.api_host,
+                self._channel_credentials(),
+                options=self._api_channel_options(),
+                compression=self._transport_options.compression,
+                interceptors=self._aio_interceptors(),
+            )
+
+        if self._channel_pool_size > 1:
+            return AioChannelPool(
+                channel_factory=create_channel,
+                size=self._channel_pool_size,
+                selection=self._channel_selection,
+            )
+        return create_channel()
 
     @property
-    def metadata(self):
+    def aio_experiment_run_client(self) -> pb2_exp_run_grpc.ExperimentRunServiceStub:
         """
+        All stubs of the async client are awaitable.
+
         :meta private:
         """
+        return self.experiment_run_client
 
-        self._token_manager.renew_expiring_token()
-        token = misc.get_token(
-            service_name="tq42_access_token", backup_save_path=self._token_file_path
-        )
-        return (("authorization", "Bearer " + token),)
+    async def close(self) -> None:
+        """
+        Close the underlying channels. Pending calls are cancelled.
+        """
+        self._token_manager.close()
+        # channels that were never used have not been created
+        for channel in self._detach_channels():
+            if channel is not None:
+                await channel.close()
@@ -9,10 +9,10 @@ from urllib.error import HTTPError
 
 from google.protobuf.json_format import MessageToJson
 from tqdm import tqdm
-import requests
 import validators
 
 from tq42.client import TQ42Client
+from tq42.utils import http
 from tq42.utils.exception_handling import handle_generic_sdk_errors
 
 # This is important to re-export it!
@@ -44,6 +44,9 @@ from com.terraquantum.storage.v1alpha1.export_storage_pb2 import (
 
 from tq42.utils.pretty_list import PrettyList
 
+# downloads are written in chunks of 1 MiB instead of byte by byte
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class Dataset:
     """
@@ -81,7 +84,7 @@ class Dataset:
     def _get(self) -> StorageProto:
         get_storage_request = GetStorageRequest(storage_id=self.id)
         storage_data: StorageProto = self._client.storage_client.GetStorage(
-            request=get_storage_request, metadata=self._client.metadata
+            request=get_storage_request
         )
         return storage_data
 
@@ -160,47 +163,72 @@ class Dataset:
         if not file_path.exists():
             raise FileNotFoundError("The specified file does not exist")
 
-        with file_path.open(mode="rb") as f:
-            data = f.read()
-            file_hash = hashlib.md5(data).digest()
-            file_hash_b64 = base64.b64encode(file_hash).decode("utf-8")
+        return Dataset._create_from_bytes(
+            client=client,
+            project_id=project_id,
+            name=name,
+            description=description,
+            data=file_path.read_bytes(),
+            file_name=file_path.name,
+            sensitivity=sensitivity,
+        )
 
-            create_dataset_request = CreateStorageFromFileRequest(
-                project_id=project_id,
-                name=name,
-                description=description,
-                hash_md5=file_hash_b64,
-                file_name=file_path.name,
-                sensitivity=sensitivity,
-            )
+    @staticmethod
+    def _create_from_bytes(
+        client: TQ42Client,
+        project_id: str,
+        name: str,
+        description: str,
+        data: bytes,
+        file_name: str,
+        sensitivity: DatasetSensitivityProto,
+    ) -> StorageProto:
+        file_hash = hashlib.md5(data).digest()
+        file_hash_b64 = base64.b64encode(file_hash).decode("utf-8")
 
-            res: CreateStorageFromFileResponse = (
-                client.storage_client.CreateStorageFromFile(
-                    request=create_dataset_request, metadata=client.metadata
-                )
-            )
+        create_dataset_request = CreateStorageFromFileRequest(
+            project_id=project_id,
+            name=name,
+            description=description,
+            hash_md5=file_hash_b64,
+            file_name=file_name,
+            sensitivity=sensitivity,
+        )
 
-            headers = {
-                "Content-Type": "application/octet-stream",
-                "Content-MD5": file_hash_b64,
-            }
-            file_upload_response = requests.put(
-                url=res.signed_url,
-                headers=headers,
-                data=data,
-            )
+        res: CreateStorageFromFileResponse = (
+            client.storage_client.CreateStorageFromFile(request=create_dataset_request)
+        )
+        Dataset._upload_file(
+            signed_url=res.signed_url,
+            data=data,
+            file_name=file_name,
+            file_hash_b64=file_hash_b64,
+        )
+        return res.storage
 
-            if not file_upload_response.ok:
-                raise HTTPError(
-                    url=res.signed_url,
-                    code=file_upload_response.status_code,
-                    msg=f"Upload of file {file} to storage failed. Please make sure your network is working. "
-                    "If issues persist please get in touch via https://help.terraquantum.io/en",
-                    fp=None,
-                    hdrs=file_upload_response.headers,
-                )
+    @staticmethod
+    def _upload_file(
+        signed_url: str, data: bytes, file_name: str, file_hash_b64: str
+    ) -> None:
+        headers = {
+            "Content-Type": "application/octet-stream",
+            "Content-MD5": file_hash_b64,
+        }
+        file_upload_response = http.session().put(
+            url=signed_url,
+            headers=headers,
+            data=data,
+        )
 
-        return res.storage
+        if not file_upload_response.ok:
+            raise HTTPError(
+                url=signed_url,
+                code=file_upload_response.status_code,
+                msg=f"Upload of file {file_name} to storage failed. Please make sure your network is working. "
+                "If issues persist please get in touch via https://help.terraquantum.io/en",
+                fp=None,
+                hdrs=file_upload_response.headers,
+            )
 
     @staticmethod
     def _create_from_external_bucket(
@@ -220,7 +248,7 @@ class Dataset:
         )
 
         return client.storage_client.CreateStorageFromExternalBucket(
-            request=create_dataset_request, metadata=client.metadata
+            request=create_dataset_request
         )
 
     @handle_generic_sdk_errors
@@ -230,7 +258,7 @@ class Dataset:
         """
         delete_dataset_request = DeleteStorageRequest(storage_id=self.id)
         self.data = self._client.storage_client.DeleteStorage(
-            request=delete_dataset_request, metadata=self._client.metadata
+            request=delete_dataset_request
         )
 
     @handle_generic_sdk_errors
@@ -249,7 +277,7 @@ class Dataset:
         export_storage_request = ExportStorageRequest(storage_id=self.id)
 
         res: ExportStorageResponse = self._client.storage_client.ExportStorage(
-            request=export_storage_request, metadata=self._client.metadata
+            request=export_storage_request
         )
 
         export_dir = os.path.join(directory_path, self.data.name)
@@ -269,15 +297,17 @@ class Dataset:
 
     @staticmethod
     def _download_file_from_url(url: str, file_path: str):
-        response = requests.get(url, stream=True)
-
         if os.path.exists(file_path):
             raise FileExistsError(file_path)
 
-        print("Downloading file to {}".format(file_path))
-        with open(file_path, "wb") as handle:
-            for data in tqdm(response.iter_content()):
-                handle.write(data)
+        # the connection goes back to the pool of the shared session once the response is closed
+        with http.session().get(url, stream=True) as response:
+            print("Downloading file to {}".format(file_path))
+            with open(file_path, "wb") as handle:
+                for data in tqdm(
+                    response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+                ):
+                    handle.write(data)
 
     @staticmethod
     def _get_file_name_from_signed_url(signed_url: str) -> str:
@@ -300,7 +330,7 @@ def list_all(client: TQ42Client, project_id: str) -> List[Dataset]:
         project_id=project_id, type=StorageType.DATASET
     )
     res: ListStoragesResponse = client.storage_client.ListStorages(
-        request=list_datasets_request, metadata=client.metadata
+        request=list_datasets_request
     )
     return PrettyList(
         [Dataset.from_proto(client=client, msg=dataset) for dataset in res.storages]
@@ -4,6 +4,7 @@ from tq42.exceptions.experiment_run_cancel_error import ExperimentRunCancelError
 from tq42.exceptions.invalid_argument_error import InvalidArgumentError
 from tq42.exceptions.no_default_error import NoDefaultError
 from tq42.exceptions.permission_denied_error import PermissionDeniedError
+from tq42.exceptions.poll_timeout_error import PollTimeoutError
 from tq42.exceptions.retries_exceeded_error import ExceedRetriesError
 from tq42.exceptions.tq42_api_error import TQ42APIError
 from tq42.exceptions.unauthenticated_error import UnauthenticatedError
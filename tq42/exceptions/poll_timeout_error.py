@@ -0,0 +1,22 @@
+from typing import Optional
+
+from tq42.exceptions.retries_exceeded_error import ExceedRetriesError
+
+
+class PollTimeoutError(ExceedRetriesError, TimeoutError):
+    """
+    Raised when polling does not finish before its deadline
+
+    Attributes:
+        tries (int): number of times the state was checked
+        timeout (float): seconds after which polling was given up
+    """
+
+    def __init__(self, tries: int, timeout: Optional[float]):
+        super().__init__(tries=tries)
+        self.timeout = timeout
+
+    def __str__(self):
+        return "Polling timed out after {} seconds. Number of retries: {}".format(
+            self.timeout, self.tries
+        )
@@ -72,9 +72,7 @@ class Experiment:
         Gets the data corresponding to this experiment id.
         """
         get_exp_request = GetExperimentRequest(id=self.id)
-        res = self._client.experiment_client.GetExperiment(
-            request=get_exp_request, metadata=self._client.metadata
-        )
+        res = self._client.experiment_client.GetExperiment(request=get_exp_request)
         return res
 
     @staticmethod
@@ -105,7 +103,7 @@ class Experiment:
             update_mask=field_mask, id=self.id, name=name
         )
         self.data = self._client.experiment_client.UpdateExperiment(
-            request=update_proj_request, metadata=self._client.metadata
+            request=update_proj_request
         )
 
         return self
@@ -136,7 +134,7 @@ def list_all(client: TQ42Client, project_id: Optional[str] = None) -> List[Exper
 
     list_experiments_request = ListExperimentsRequest(project_id=project_id)
     res: ListExperimentsResponse = client.experiment_client.ListExperiments(
-        request=list_experiments_request, metadata=client.metadata
+        request=list_experiments_request
     )
     return PrettyList(
         [
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import time
-from typing import Optional, List, Mapping, Any, Union
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Optional,
+    List,
+    Mapping,
+    Any,
+    Union,
+    Iterable,
+    Iterator,
+    Dict,
+    Tuple,
+    Callable,
+)
 
 from com.terraquantum.experiment.v1.experimentrun.experiment_run_pb2 import (
     ExperimentRunStatusProto,
@@ -30,14 +45,79 @@ from com.terraquantum.experiment.v3alpha2.experimentrun.list_experiment_runs_pb2
 from com.terraquantum.experiment.v3alpha2.experimentrun.list_experiment_runs_pb2 import (
     ListExperimentRunsResponse,
 )
+import grpc
 from google.protobuf import struct_pb2
-from google.protobuf.json_format import MessageToJson, ParseDict, MessageToDict
+from google.protobuf.json_format import MessageToJson, MessageToDict
 
-from tq42.client import TQ42Client
+from tq42.client import TQ42AsyncClient, TQ42Client
 from tq42.utils.exception_handling import handle_generic_sdk_errors
-from tq42.exceptions import ExperimentRunCancelError, ExceedRetriesError
+from tq42.exceptions import ExperimentRunCancelError, PollTimeoutError
+from tq42.utils import poll_strategy, struct_codec
+from tq42.utils.poll_strategy import Poller
 from tq42.utils.pretty_list import PrettyList
 
+# important for re-export
+from tq42.utils.parameter_spill import ParameterSpill
+from tq42.utils.poll_strategy import PollStrategy
+
+_TERMINAL_STATUSES = (
+    ExperimentRunStatusProto.COMPLETED,
+    ExperimentRunStatusProto.CANCELLED,
+    ExperimentRunStatusProto.FAILED,
+)
+
+
+def _stored_run(
+    client: Union[TQ42Client, TQ42AsyncClient], id: str
+) -> Optional[ExperimentRunProto]:
+    """
+    The experiment run from the run store of the client, `None` if the client has no store or the run is not stored.
+    """
+    if client.run_store is None:
+        return None
+    return client.run_store.get(client.api_host, id)
+
+
+def _store_run(
+    client: Union[TQ42Client, TQ42AsyncClient], run: ExperimentRunProto
+) -> None:
+    """
+    Keeps the experiment run in the run store of the client if it has one and the run is finished.
+    """
+    if client.run_store is not None and run.status in _TERMINAL_STATUSES:
+        client.run_store.put(client.api_host, run)
+
+
+async def _stored_run_async(
+    client: Union[TQ42Client, TQ42AsyncClient], id: str
+) -> Optional[ExperimentRunProto]:
+    """
+    Like :py:func:`_stored_run`, but reads the store on a worker thread, so a process writing to it does not block
+    the event loop.
+    """
+    if client.run_store is None:
+        return None
+    return await asyncio.to_thread(client.run_store.get, client.api_host, id)
+
+
+async def _store_run_async(
+    client: Union[TQ42Client, TQ42AsyncClient], run: ExperimentRunProto
+) -> None:
+    """
+    Like :py:func:`_store_run`, but writes to the store on a worker thread.
+    """
+    if client.run_store is not None and run.status in _TERMINAL_STATUSES:
+        await asyncio.to_thread(client.run_store.put, client.api_host, run)
+
+
+def _parse_result(result: Union[dict[str, Any], str]) -> dict[str, Any]:
+    if isinstance(result, str):
+        return json.loads(result)
+    elif "results_string" in result:
+        return json.loads(result.get("results_string"))
+
+    return result
+
 
 class ExperimentRun:
     """
@@ -51,8 +131,9 @@ class ExperimentRun:
     _client: TQ42Client
     id: str
     """ID of the experiment run"""
-    data: ExperimentRunProto
-    """Object containing all attributes of the experiment run"""
+    _data: ExperimentRunProto
+    # decoded `result` and `outputs` of `_data`, only set once they were accessed
+    _decoded: Dict[str, Any]
 
     def __init__(
         self, client: TQ42Client, id: str, data: Optional[ExperimentRunProto] = None
@@ -68,6 +149,27 @@ class ExperimentRun:
     def __repr__(self) -> str:
         return f"<ExperimentRun Id={self.id}>"
 
+    @property
+    def data(self) -> ExperimentRunProto:
+        """Object containing all attributes of the experiment run"""
+        return self._data
+
+    @data.setter
+    def data(self, data: ExperimentRunProto) -> None:
+        self._data = data
+        self._decoded = {}
+
+    def _decode_outcome(self, field: str, decode: Callable[[Any], Any]) -> Any:
+        """
+        Decodes only the field `field` of the outcome, once per state of the experiment run.
+        """
+        if field not in self._decoded:
+            fields = self.data.result.outcome.fields
+            self._decoded[field] = decode(
+                MessageToDict(fields[field]) if field in fields else {}
+            )
+        return self._decoded[field]
+
     def __str__(self) -> str:
         return f"ExperimentRun: {MessageToJson(self.data, preserving_proto_field_name=True)}"
 
@@ -87,6 +189,7 @@ class ExperimentRun:
         Get the result of the experiment run if the run is completed.
 
         If the result contains a results_string or if the result is a string, it will be parsed and returned.
+        The result is decoded on first access and kept until the state of the run is updated, e.g. by :py:meth:`check`.
 
         :returns: a dict with the result of the experiment run. If the run is not completed yet, returns `None`.
         """
@@ -94,20 +197,13 @@ class ExperimentRun:
         if not self.completed:
             return None
 
-        result: Union[dict[str, Any], str] = MessageToDict(
-            self.data.result.outcome
-        ).get("result", {})
-        if isinstance(result, str):
-            return json.loads(result)
-        elif "results_string" in result:
-            return json.loads(result.get("results_string"))
-
-        return result
+        return self._decode_outcome("result", _parse_result)
 
     @property
     def outputs(self) -> Optional[dict[str, Any]]:
         """
         Get the outputs of the experiment run if the run is completed.
+        The outputs are decoded on first access and kept until the state of the run is updated.
 
         :returns: a dict with the outputs of the experiment run. If the run is not completed yet, returns `None`.
         """
@@ -115,19 +211,92 @@ class ExperimentRun:
         if not self.completed:
             return None
 
-        return MessageToDict(self.data.result.outcome).get("outputs", {})
+        return self._decode_outcome("outputs", lambda outputs: outputs)
+
+    def result_array(self, *path: str, dtype=None):
+        """
+        Get a number or a list of numbers of the result as a NumPy array, e.g. `run.result_array("x")`.
+
+        The numbers are read straight from the received result, without decoding the rest of it into Python objects.
+        Requires NumPy, install it with `pip install tq42[numpy]`.
+
+        :param path: keys leading from the result to the number or list
+        :param dtype: dtype of the array (default: float64)
+        :returns: the array. If the run is not completed yet, returns `None`.
+        :raises: KeyError if `path` is not part of the result
+        :raises: TypeError if `path` leads to anything but numbers
+        """
+        if not self.completed:
+            return None
+
+        value = self._outcome_value("result", path)
+        if value is None:
+            # results sent as a JSON string cannot be read without parsing them
+            result: Any = self.result
+            for key in path:
+                result = result[key]
+            return struct_codec.import_numpy().asarray(result, dtype=dtype or float)
+
+        return struct_codec.value_to_array(value, dtype)
+
+    def outputs_array(self, *path: str, dtype=None):
+        """
+        Get a number or a list of numbers of the outputs as a NumPy array. See :py:meth:`result_array`.
+
+        :param path: keys leading from the outputs to the number or list
+        :param dtype: dtype of the array (default: float64)
+        :returns: the array. If the run is not completed yet, returns `None`.
+        :raises: KeyError if `path` is not part of the outputs
+        :raises: TypeError if `path` leads to anything but numbers
+        """
+        if not self.completed:
+            return None
+
+        return struct_codec.value_to_array(self._outcome_value("outputs", path), dtype)
+
+    def _outcome_value(
+        self, field: str, path: Iterable[str]
+    ) -> Optional[struct_pb2.Value]:
+        """
+        The value at `path` within the field `field` of the outcome.
+        Returns `None` for results that were sent as a JSON string.
+        """
+        fields = self.data.result.outcome.fields
+        if field not in fields:
+            raise KeyError(field)
+
+        value = fields[field]
+        if field == "result" and (
+            value.HasField("string_value")
+            or "results_string" in value.struct_value.fields
+        ):
+            return None
+
+        for key in path:
+            if (
+                not value.HasField("struct_value")
+                or key not in value.struct_value.fields
+            ):
+                raise KeyError(key)
+            value = value.struct_value.fields[key]
+        return value
 
     @handle_generic_sdk_errors
     def _get_data(self) -> ExperimentRunProto:
         """
         Gets a specific experiment run by id
         """
+        stored = _stored_run(self._client, self.id)
+        if stored is not None:
+            return stored
+
         get_exp_run_request = GetExperimentRunRequest(experiment_run_id=self.id)
 
         res = self._client.experiment_run_client.GetExperimentRun(
-            request=get_exp_run_request, metadata=self._client.metadata
+            request=get_exp_run_request
         )
 
+        _store_run(self._client, res)
         return res
 
     @staticmethod
@@ -148,6 +317,8 @@ class ExperimentRun:
         experiment_id: str,
         compute: HardwareProto,
         parameters: Mapping[str, Any],
+        compression: Optional[grpc.Compression] = None,
+        spill: Optional[ParameterSpill] = None,
     ) -> ExperimentRun:
         """
         Start a new experiment run in an experiment
@@ -158,24 +329,59 @@ class ExperimentRun:
         :param experiment_id: id of the experiment in which the run should be started
         :param compute: the hardware specification on which the run should be started (e.g. `HardwareProto.SMALL`)
         :param parameters: dict with parameters for the algorithm
+        :param compression: compression of the request, overrides the compression configured on the client
+            (e.g. `grpc.Compression.Gzip` for large parameters)
+        :param spill: uploads large parameters to datasets and passes them as inputs instead (default: off),
+            see :py:class:`ParameterSpill`
         :returns: the created experiment run
 
         """
 
+        metadata = struct_codec.encode_struct(parameters)
+        if spill is not None:
+            spill.apply(client, metadata)
+
         request = CreateExperimentRunRequest(
             experiment_id=experiment_id,
             algorithm=algorithm,
             version=version,
             hardware=compute,
-            metadata=ParseDict(parameters, struct_pb2.Struct()),
+            metadata=metadata,
         )
 
         res: ExperimentRunProto = client.experiment_run_client.CreateExperimentRun(
-            request=request, metadata=client.metadata
+            request=request, compression=compression
         )
 
         return ExperimentRun.from_proto(client=client, msg=res)
 
+    @staticmethod
+    def create_many(
+        client: TQ42Client,
+        experiment_id: str,
+        specs: Iterable[Mapping[str, Any]],
+        max_concurrency: int = 16,
+    ) -> List[Union[ExperimentRun, Exception]]:
+        """
+        Start many experiment runs in an experiment at once, e.g. for a parameter sweep.
+        The runs are submitted concurrently over the connection of the client.
+
+        :param client: a client instance
+        :param experiment_id: id of the experiment in which the runs should be started
+        :param specs: one dict per run with the arguments `algorithm`, `version`, `compute`, `parameters` and
+            optionally `compression` and `spill` of :py:meth:`create`
+        :param max_concurrency: number of runs submitted at the same time (default: 16)
+        :returns: the created experiment runs in the order of `specs`. If a run could not be created,
+            the exception raised for it takes its place, the other runs are still created.
+        """
+        return _create_concurrently(
+            lambda spec: ExperimentRun.create(
+                client=client, experiment_id=experiment_id, **spec
+            ),
+            specs,
+            max_concurrency,
+        )
+
     @handle_generic_sdk_errors
     def check(self) -> ExperimentRun:
         """
@@ -188,33 +394,113 @@ class ExperimentRun:
 
     @handle_generic_sdk_errors
     def poll(
-        self, tries=1000, initial_delay=1.0, delay=1.0, backoff=1.0
+        self,
+        tries: Optional[int] = None,
+        initial_delay: Optional[float] = None,
+        delay: Optional[float] = None,
+        backoff: Optional[float] = None,
+        strategy: Optional[PollStrategy] = None,
+        timeout: Optional[float] = None,
     ) -> ExperimentRun:
         """
         Monitor an experiment run until it completes, then automatically display the results (if there are no errors).
 
-        :param tries: how many retries until the poll loop is cancelled (default: 1000)
-        :param initial_delay: initial delay before starting poll loop (default: 1 second)
-        :param delay: initial delay between retries (default: 1 second)
-        :param backoff: backoff factor between retries (default: 1)
+        By default, the run is checked right away and then with a delay that grows with every check, up to a
+        maximum that depends on the state of the run. Pass a :py:class:`PollStrategy` to change this.
+        The arguments `tries`, `initial_delay`, `delay` and `backoff` keep their previous behavior of a fixed
+        number of checks and override the corresponding settings of `strategy`.
+
+        :param tries: how many retries until the poll loop is cancelled
+        :param initial_delay: initial delay before starting poll loop
+        :param delay: initial delay between retries
+        :param backoff: backoff factor between retries
+        :param strategy: when to check the state of the run (default: :py:class:`PollStrategy`)
+        :param timeout: seconds after which polling is given up (default: the timeout of `strategy`, 1000 seconds)
         :returns: the finished experiment run
         :raises: ExceedRetriesError if `tries` are exceeded
+        :raises: PollTimeoutError if the run did not finish within `timeout` seconds
         """
-        time.sleep(initial_delay)
+        poller = Poller(
+            poll_strategy.resolve(
+                strategy,
+                tries=tries,
+                initial_delay=initial_delay,
+                delay=delay,
+                backoff=backoff,
+                timeout=timeout,
+            )
+        )
+        time.sleep(poller.initial_delay)
 
-        for _ in range(tries):
+        while True:
             self.data = self._get_data()
-            if self.data.status in [
-                ExperimentRunStatusProto.COMPLETED,
-                ExperimentRunStatusProto.CANCELLED,
-                ExperimentRunStatusProto.FAILED,
-            ]:
+            if self.data.status in _TERMINAL_STATUSES:
                 return self
 
-            time.sleep(delay)
-            delay *= backoff
+            time.sleep(poller.next_delay(self.data.status))
+
+    @handle_generic_sdk_errors
+    async def _get_data_async(self) -> ExperimentRunProto:
+        """
+        Gets a specific experiment run by id without blocking the event loop
+        """
+        stored = await _stored_run_async(self._client, self.id)
+        if stored is not None:
+            return stored
+
+        res = await self._client.aio_experiment_run_client.GetExperimentRun(
+            request=GetExperimentRunRequest(experiment_run_id=self.id)
+        )
+        await _store_run_async(self._client, res)
+        return res
+
+    @handle_generic_sdk_errors
+    async def check_async(self) -> ExperimentRun:
+        """
+        Update the state of the experiment run without blocking the event loop,
+        e.g. from within the callbacks of :py:meth:`tq42.channel.Channel.connect`.
 
-        raise ExceedRetriesError(tries=tries)
+        :returns: the updated experiment run
+        """
+        self.data = await self._get_data_async()
+        return self
+
+    @handle_generic_sdk_errors
+    async def poll_async(
+        self,
+        tries: Optional[int] = None,
+        initial_delay: Optional[float] = None,
+        delay: Optional[float] = None,
+        backoff: Optional[float] = None,
+        strategy: Optional[PollStrategy] = None,
+        timeout: Optional[float] = None,
+    ) -> ExperimentRun:
+        """
+        Wait for the experiment run to finish without blocking the event loop. Takes the same arguments as
+        :py:meth:`poll`.
+
+        :returns: the finished experiment run
+        :raises: ExceedRetriesError if `tries` are exceeded
+        :raises: PollTimeoutError if the run did not finish within `timeout` seconds
+        """
+        poller = Poller(
+            poll_strategy.resolve(
+                strategy,
+                tries=tries,
+                initial_delay=initial_delay,
+                delay=delay,
+                backoff=backoff,
+                timeout=timeout,
+            )
+        )
+        await asyncio.sleep(poller.initial_delay)
+
+        while True:
+            self.data = await self._get_data_async()
+            if self.data.status in _TERMINAL_STATUSES:
+                return self
+
+            await asyncio.sleep(poller.next_delay(self.data.status))
 
     @handle_generic_sdk_errors
     def cancel(self) -> ExperimentRun:
@@ -229,13 +515,165 @@ class ExperimentRun:
                 experiment_run_id=self.id
             )
             self._client.experiment_run_client.CancelExperimentRun(
-                request=cancel_exp_runs_response, metadata=self._client.metadata
+                request=cancel_exp_runs_response
             )
             return self
         except Exception:
             raise ExperimentRunCancelError()
 
 
+def _create_concurrently(
+    create: Callable[[Any], ExperimentRun],
+    items: Iterable[Any],
+    max_concurrency: int,
+) -> List[Union[ExperimentRun, Exception]]:
+    """
+    Calls `create` for all `items` from a thread pool, returning the created runs or the raised exceptions in order.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency has to be at least 1, got {max_concurrency}")
+
+    items = list(items)
+    if not items:
+        return PrettyList()
+
+    def submit(item: Any) -> Union[ExperimentRun, Exception]:
+        try:
+            return create(item)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(items)),
+        thread_name_prefix="tq42-create-run",
+    ) as executor:
+        return PrettyList(executor.map(submit, items))
+
+
+class RunTemplate:
+    """
+    The parameters many experiment runs have in common, e.g. the runs of a parameter sweep.
+
+    The request creating a run is encoded once when the template is created. Every run created from the template
+    copies this request and only encodes the parameters it overrides, so large shared parameters like a QUBO matrix
+    are not encoded again for every run.
+
+    :param algorithm: algorithm of the runs
+    :param version: version of the algorithm
+    :param compute: hardware the runs should use
+    :param parameters: parameters of the runs, as for :py:meth:`ExperimentRun.create`
+
+    Example:
+        >>> template = RunTemplate(
+        ...     algorithm="TOY",
+        ...     version="0.1.0",
+        ...     compute=HardwareProto.SMALL,
+        ...     parameters={"parameters": {"qubo": qubo, "steps": 100}, "inputs": {}},
+        ... )
+        >>> runs = template.create_many(
+        ...     client=client,
+        ...     experiment_id=experiment_id,
+        ...     overrides=[{"parameters.steps": steps} for steps in (100, 200, 400)],
+        ... )
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        version: str,
+        compute: HardwareProto,
+        parameters: Mapping[str, Any],
+    ):
+        self._request = CreateExperimentRunRequest(
+            algorithm=algorithm,
+            version=version,
+            hardware=compute,
+            metadata=struct_codec.encode_struct(parameters),
+        )
+
+    def request(
+        self,
+        experiment_id: str,
+        overrides: Optional[Mapping[Union[str, Tuple[str, ...]], Any]] = None,
+    ) -> CreateExperimentRunRequest:
+        """
+        Build the request creating a run from the template.
+
+        :param experiment_id: id of the experiment in which the run should be started
+        :param overrides: values replacing the parameters of the template, keyed by their path in `parameters`,
+            e.g. `{"parameters.steps": 200}`. Pass the path as a tuple of keys if a key contains a dot.
+            Missing keys are added.
+        :returns: the request
+        :raises: ValueError if a path leads through a parameter that is not a dict
+        """
+        request = CreateExperimentRunRequest()
+        request.CopyFrom(self._request)
+        request.experiment_id = experiment_id
+
+        for path, value in (overrides or {}).items():
+            keys = path.split(".") if isinstance(path, str) else tuple(path)
+            struct = request.metadata
+            for key in keys[:-1]:
+                parent = struct.fields[key]
+                if parent.WhichOneof("kind") not in (None, "struct_value"):
+                    raise ValueError(
+                        f"Cannot override {path}, the parameter {key} is not a dict"
+                    )
+                struct = parent.struct_value
+            struct_codec.set_value(struct.fields[keys[-1]], value)
+
+        return request
+
+    @handle_generic_sdk_errors
+    def create(
+        self,
+        client: TQ42Client,
+        experiment_id: str,
+        overrides: Optional[Mapping[Union[str, Tuple[str, ...]], Any]] = None,
+        compression: Optional[grpc.Compression] = None,
+    ) -> ExperimentRun:
+        """
+        Start an experiment run from the template.
+
+        :param client: a client instance
+        :param experiment_id: id of the experiment in which the run should be started
+        :param overrides: values replacing the parameters of the template, see :py:meth:`request`
+        :param compression: compression for the request, see :py:meth:`ExperimentRun.create`
+        :returns: the created experiment run
+        """
+        res: ExperimentRunProto = client.experiment_run_client.CreateExperimentRun(
+            request=self.request(experiment_id=experiment_id, overrides=overrides),
+            compression=compression,
+        )
+
+        return ExperimentRun.from_proto(client=client, msg=res)
+
+    def create_many(
+        self,
+        client: TQ42Client,
+        experiment_id: str,
+        overrides: Iterable[Mapping[Union[str, Tuple[str, ...]], Any]],
+        max_concurrency: int = 16,
+    ) -> List[Union[ExperimentRun, Exception]]:
+        """
+        Start one experiment run from the template per entry of `overrides`, see :py:meth:`ExperimentRun.create_many`.
+
+        :param client: a client instance
+        :param experiment_id: id of the experiment in which the runs should be started
+        :param overrides: one dict of overridden parameters per run, see :py:meth:`request`
+        :param max_concurrency: number of runs submitted at the same time (default: 16)
+        :returns: the created experiment runs in the order of `overrides`. If a run could not be created,
+            the exception raised for it takes its place, the other runs are still created.
+        """
+        return _create_concurrently(
+            lambda run_overrides: self.create(
+                client=client, experiment_id=experiment_id, overrides=run_overrides
+            ),
+            overrides,
+            max_concurrency,
+        )
+
+
 @handle_generic_sdk_errors
 def list_all(client: TQ42Client, experiment_id: str) -> List[ExperimentRun]:
     """
@@ -248,7 +686,7 @@ def list_all(client: TQ42Client, experiment_id: str) -> List[ExperimentRun]:
     list_exp_run_request = ListExperimentRunsRequest(experiment_id=experiment_id)
 
     res: ListExperimentRunsResponse = client.experiment_run_client.ListExperimentRuns(
-        request=list_exp_run_request, metadata=client.metadata
+        request=list_exp_run_request
     )
     # TODO: It seems like currently the API returns `experiment_runs` instead of `experimentRuns` as in the protobufs
     return PrettyList(
@@ -257,3 +695,126 @@ def list_all(client: TQ42Client, experiment_id: str) -> List[ExperimentRun]:
             for experiment_run in res.experiment_runs
         ]
     )
+
+
+@handle_generic_sdk_errors
+def _list_run_data(
+    client: TQ42Client, experiment_id: str
+) -> Mapping[str, ExperimentRunProto]:
+    res: ListExperimentRunsResponse = client.experiment_run_client.ListExperimentRuns(
+        request=ListExperimentRunsRequest(experiment_id=experiment_id)
+    )
+    return {run.id: run for run in res.experiment_runs}
+
+
+def _refresh(runs: List[ExperimentRun], executor: ThreadPoolExecutor) -> None:
+    """
+    Updates the state of all `runs` with one ListExperimentRuns call per experiment.
+    Runs that are alone in their experiment or missing from the list are fetched one by one.
+    """
+    by_experiment: Dict[Tuple[int, str], List[ExperimentRun]] = defaultdict(list)
+    for run in runs:
+        by_experiment[(id(run._client), run.data.experiment_id)].append(run)
+
+    listed = {
+        key: executor.submit(_list_run_data, group[0]._client, key[1])
+        for key, group in by_experiment.items()
+        if len(group) > 1 and key[1]
+    }
+
+    remaining: List[ExperimentRun] = []
+    for key, group in by_experiment.items():
+        if key not in listed:
+            remaining.extend(group)
+            continue
+
+        try:
+            data = listed[key].result()
+        except Exception:
+            # e.g. no permission to list the experiment, the runs can still be fetched by id
+            remaining.extend(group)
+            continue
+
+        for run in group:
+            if run.id in data:
+                run.data = data[run.id]
+                _store_run(run._client, run.data)
+            else:
+                remaining.append(run)
+
+    fetched = [(run, executor.submit(run._get_data)) for run in remaining]
+    for run, future in fetched:
+        try:
+            run.data = future.result()
+        except Exception:
+            # a single failing run does not stop waiting for the others, it is fetched again on the next refresh
+            logging.warning(
+                "Refreshing experiment run %s failed", run.id, exc_info=True
+            )
+
+
+def as_completed(
+    runs: Iterable[ExperimentRun],
+    interval: float = 1.0,
+    timeout: Optional[float] = None,
+    max_concurrency: int = 16,
+) -> Iterator[ExperimentRun]:
+    """
+    Wait for many experiment runs and yield each of them as soon as it is COMPLETED, FAILED or CANCELLED.
+
+    All runs are refreshed together every `interval` seconds. Runs of the same experiment are refreshed with a single
+    call, so the number of calls grows with the number of experiments instead of the number of runs.
+
+    :param runs: the experiment runs to wait for
+    :param interval: seconds between refreshing the runs that are not finished yet (default: 1 second)
+    :param timeout: seconds after which waiting is given up (default: wait forever)
+    :param max_concurrency: number of calls made at the same time (default: 16)
+    :returns: an iterator over the finished experiment runs in the order they finished
+    :raises: PollTimeoutError if runs are still not finished after `timeout` seconds
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending: Dict[str, ExperimentRun] = {run.id: run for run in runs}
+    tries = 0
+
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="tq42-wait-runs"
+    ) as executor:
+        while True:
+            for run_id, run in list(pending.items()):
+                if run.data.status in _TERMINAL_STATUSES:
+                    del pending[run_id]
+                    yield run
+
+            if not pending:
+                return
+
+            delay = interval
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise PollTimeoutError(tries=tries, timeout=timeout)
+                delay = min(delay, left)
+
+            time.sleep(delay)
+            _refresh(list(pending.values()), executor)
+            tries += 1
+
+
+def wait_all(
+    runs: Iterable[ExperimentRun],
+    interval: float = 1.0,
+    timeout: Optional[float] = None,
+    max_concurrency: int = 16,
+) -> List[ExperimentRun]:
+    """
+    Wait until all experiment runs are COMPLETED, FAILED or CANCELLED. See :py:func:`as_completed` for the parameters.
+
+    :returns: the finished experiment runs in the order they were passed
+    :raises: PollTimeoutError if runs are still not finished after `timeout` seconds
+    """
+    runs = list(runs)
+    for _ in as_completed(
+        runs, interval=interval, timeout=timeout, max_concurrency=max_concurrency
+    ):
+        pass
+    return PrettyList(runs)
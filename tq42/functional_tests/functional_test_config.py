@@ -46,13 +46,18 @@ class FunctionalTestConfig:
 
     def get_client(self) -> TQ42Client:
         if self._client is None:
-            self._client = TQ42Client()
+            # reuses the connection opened while preparing the defaults
+            self._client = TQ42Client(shared_transport=True)
         return self._client
 
     @staticmethod
     def prepare_defaults():
         auto_pick = False
-        client = TQ42Client()
+        with TQ42Client(shared_transport=True) as client:
+            return FunctionalTestConfig._prepare_defaults(client, auto_pick)
+
+    @staticmethod
+    def _prepare_defaults(client: TQ42Client, auto_pick: bool) -> Args:
         arguments = Args(org="", proj="", exp="", run="", export_path="")
 
         choices = [
@@ -52,8 +52,8 @@ async def test_exp_run_with_channel(functional_test_config):
 
         return Tell(parameters=ask.parameters, headers=ask.headers, results=y)
 
-    def success():
-        poll_result = exp_run.poll()
+    async def success():
+        poll_result = await exp_run.poll_async()
         assert ExperimentRunStatusProto.COMPLETED == poll_result.data.status
 
     await channel.connect(
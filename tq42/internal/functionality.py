@@ -30,7 +30,5 @@ class Functionality:
             organization_id=organization_id,
             functionality=FunctionalityProto(type=functionality_type, version=version),
         )
-        res: empty_pb2.Empty = client.plan_client.CheckFunctionality(
-            request=req, metadata=client.metadata
-        )
+        res: empty_pb2.Empty = client.plan_client.CheckFunctionality(request=req)
         return res
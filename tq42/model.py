@@ -56,7 +56,7 @@ class Model:
     def _get(self) -> StorageProto:
         get_storage_request = GetStorageRequest(storage_id=self.id)
         storage_data: StorageProto = self._client.storage_client.GetStorage(
-            request=get_storage_request, metadata=self._client.metadata
+            request=get_storage_request
         )
         return storage_data
 
@@ -85,7 +85,7 @@ def list_all(client: TQ42Client, project_id: str) -> List[Model]:
         project_id=project_id, type=StorageType.MODEL
     )
     res: ListStoragesResponse = client.storage_client.ListStorages(
-        request=list_models_request, metadata=client.metadata
+        request=list_models_request
     )
     return PrettyList(
         [Model.from_proto(client=client, msg=model) for model in res.storages]
@@ -65,7 +65,7 @@ class Organization:
         """
         get_org_request = GetOrganizationRequest(organization_id=self.id)
         res: OrganizationProto = self._client.organization_client.GetOrganization(
-            request=get_org_request, metadata=self._client.metadata
+            request=get_org_request
         )
         return res
 
@@ -118,7 +118,7 @@ def list_all(client: TQ42Client) -> List[Organization]:
     """
     empty = empty_pb2.Empty()
     res: ListOrganizationsResponse = client.organization_client.ListOrganizations(
-        request=empty, metadata=client.metadata
+        request=empty
     )
     return PrettyList(
         [Organization.from_proto(client=client, msg=msg) for msg in res.organizations]
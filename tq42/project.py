@@ -69,9 +69,7 @@ class Project:
         Gets the data corresponding to this project id.
         """
         get_proj_request = GetProjectRequest(project_id=self.id)
-        res = self._client.project_client.GetProject(
-            request=get_proj_request, metadata=self._client.metadata
-        )
+        res = self._client.project_client.GetProject(request=get_proj_request)
         return res
 
     @staticmethod
@@ -97,7 +95,7 @@ class Project:
             name=name,
         )
         self.data = self._client.project_client.UpdateProject(
-            request=update_proj_request, metadata=self._client.metadata
+            request=update_proj_request
         )
         return self
 
@@ -173,7 +171,7 @@ def list_all(
     create_list_proj_request = ListProjectsRequest(organization_id=organization_id)
 
     res: ListProjectsResponse = client.project_client.ListProjects(
-        request=create_list_proj_request, metadata=client.metadata
+        request=create_list_proj_request
     )
     return PrettyList(
         [Project.from_proto(client=client, msg=data) for data in res.projects]
@@ -0,0 +1,4 @@
+"""
+Helpers to run the SDK against a local stand-in of the TQ42 API.
+"""
+from tq42.testing.fake_server import FakeServer  # noqa: F401
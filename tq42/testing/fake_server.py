@@ -0,0 +1,536 @@
+from __future__ import annotations
+
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import time
+import uuid
+from collections import Counter
+from concurrent import futures
+from typing import Dict, List, Optional
+
+import grpc
+from google.protobuf import empty_pb2
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from com.terraquantum.channel.v1alpha1 import (
+    channel_service_pb2_grpc as pb2_channel_grpc,
+)
+from com.terraquantum.channel.v1alpha1.channel_message_pb2 import (
+    Ask,
+    ChannelMessage,
+    Completion,
+    Parameter,
+)
+from com.terraquantum.channel.v1alpha1.create_channel_pb2 import (
+    CreateChannelResponse,
+)
+from com.terraquantum.experiment.v1.experimentrun.experiment_run_pb2 import (
+    ExperimentRunStatusProto,
+)
+from com.terraquantum.experiment.v3alpha1.experiment import (
+    experiment_service_pb2_grpc as pb2_exp_grpc,
+)
+from com.terraquantum.experiment.v3alpha1.experiment.experiment_pb2 import (
+    ExperimentProto,
+)
+from com.terraquantum.experiment.v3alpha1.experiment.list_experiments_pb2 import (
+    ListExperimentsResponse,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun import (
+    experiment_run_service_pb2_grpc as pb2_exp_run_grpc,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.experiment_run_pb2 import (
+    ExperimentRunProto,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.list_experiment_runs_pb2 import (
+    ListExperimentRunsResponse,
+)
+from com.terraquantum.organization.v2.organization import (
+    organization_service_pb2_grpc as pb2_org_grpc,
+)
+from com.terraquantum.organization.v2.organization.list_organizations_pb2 import (
+    ListOrganizationsResponse,
+)
+from com.terraquantum.organization.v2.organization.organization_pb2 import (
+    OrganizationProto,
+)
+from com.terraquantum.plan.v1.plan import plan_service_pb2_grpc as pb2_plan_grpc
+from com.terraquantum.project.v2 import project_service_pb2_grpc as pb2_proj_grpc
+from com.terraquantum.project.v2.list_projects_pb2 import ListProjectsResponse
+from com.terraquantum.project.v2.project_pb2 import ProjectProto
+from com.terraquantum.storage.v1alpha1 import (
+    storage_service_pb2_grpc as pb2_data_grpc,
+)
+from com.terraquantum.storage.v1alpha1.create_storage_from_file_pb2 import (
+    CreateStorageFromFileResponse,
+)
+from com.terraquantum.storage.v1alpha1.export_storage_pb2 import (
+    ExportStorageResponse,
+)
+from com.terraquantum.storage.v1alpha1.list_storages_pb2 import (
+    ListStoragesResponse,
+)
+from com.terraquantum.storage.v1alpha1.storage_pb2 import (
+    StorageProto,
+    StorageStatusProto,
+    StorageType,
+)
+
+_TERMINAL_RUN_STATUSES = (
+    ExperimentRunStatusProto.COMPLETED,
+    ExperimentRunStatusProto.CANCELLED,
+    ExperimentRunStatusProto.FAILED,
+)
+
+
+def _now() -> Timestamp:
+    timestamp = Timestamp()
+    timestamp.GetCurrentTime()
+    return timestamp
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def _get_or_abort(store: dict, key: str, context: grpc.ServicerContext):
+    if key not in store:
+        context.abort(grpc.StatusCode.NOT_FOUND, f"{key} not found")
+    return store[key]
+
+
+class _FaultInjector(grpc.ServerInterceptor):
+    """
+    Delays every call and makes selected calls fail before they reach the servicer.
+    """
+
+    def __init__(self, server: FakeServer):
+        self._server = server
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        metadata = handler_call_details.invocation_metadata
+        # the handler is looked up on the thread that accepts calls, so the delay is added to the behavior itself
+        for kind in ("unary_unary", "unary_stream", "stream_unary", "stream_stream"):
+            behavior = getattr(handler, kind)
+            if behavior is not None:
+                return handler._replace(
+                    **{kind: self._wrap(method, metadata, behavior)}
+                )
+        return handler
+
+    def _wrap(self, method: str, metadata, behavior):
+        def wrapped(request, context):
+            self._server._before_call(method, metadata, context)
+            return behavior(request, context)
+
+        return wrapped
+
+
+class _OrganizationService(pb2_org_grpc.OrganizationServiceServicer):
+    def __init__(self, server: FakeServer):
+        self._server = server
+
+    def GetOrganization(self, request, context):
+        return _get_or_abort(
+            self._server.organizations, request.organization_id, context
+        )
+
+    def ListOrganizations(self, request, context):
+        return ListOrganizationsResponse(
+            organizations=list(self._server.organizations.values())
+        )
+
+
+class _ProjectService(pb2_proj_grpc.ProjectServiceServicer):
+    def __init__(self, server: FakeServer):
+        self._server = server
+
+    def GetProject(self, request, context):
+        return _get_or_abort(self._server.projects, request.project_id, context)
+
+    def ListProjects(self, request, context):
+        projects = [
+            project
+            for project in self._server.projects.values()
+            if project.organization_id == request.organization_id
+        ]
+        return ListProjectsResponse(projects=projects)
+
+    def UpdateProject(self, request, context):
+        project = _get_or_abort(self._server.projects, request.project_id, context)
+        project.name = request.name
+        project.description = request.description
+        return project
+
+
+class _ExperimentService(pb2_exp_grpc.ExperimentServiceServicer):
+    def __init__(self, server: FakeServer):
+        self._server = server
+
+    def GetExperiment(self, request, context):
+        return _get_or_abort(self._server.experiments, request.id, context)
+
+    def ListExperiments(self, request, context):
+        experiments = [
+            experiment
+            for experiment in self._server.experiments.values()
+            if experiment.project_id == request.project_id
+        ]
+        return ListExperimentsResponse(experiments=experiments)
+
+    def UpdateExperiment(self, request, context):
+        experiment = _get_or_abort(self._server.experiments, request.id, context)
+        experiment.name = request.name
+        experiment.description = request.description
+        return experiment
+
+
+class _ExperimentRunService(pb2_exp_run_grpc.ExperimentRunServiceServicer):
+    def __init__(self, server: FakeServer):
+        self._server = server
+        self._lock = threading.Lock()
+        self._created_at: Dict[str, float] = {}
+
+    def CreateExperimentRun(self, request, context):
+        experiment = _get_or_abort(
+            self._server.experiments, request.experiment_id, context
+        )
+        run = ExperimentRunProto(
+            id=_new_id(),
+            experiment_id=request.experiment_id,
+            project_id=experiment.project_id,
+            status=ExperimentRunStatusProto.QUEUED,
+            hardware=request.hardware,
+            algorithm=request.algorithm,
+            version=request.version,
+            metadata=request.metadata,
+            created_at=_now(),
+        )
+        with self._lock:
+            run.sequential_id = len(self._server.experiment_runs) + 1
+            self._server.experiment_runs[run.id] = run
+            self._created_at[run.id] = time.monotonic()
+        return run
+
+    def _progress(self, run: ExperimentRunProto) -> ExperimentRunProto:
+        # runs complete `run_duration` seconds after they were created and echo their parameters as the result
+        with self._lock:
+            elapsed = time.monotonic() - self._created_at[run.id]
+            if (
+                run.status not in _TERMINAL_RUN_STATUSES
+                and elapsed >= self._server.run_duration
+            ):
+                run.status = ExperimentRunStatusProto.COMPLETED
+                run.finished_at.CopyFrom(_now())
+                run.result.outcome.fields["result"].struct_value.CopyFrom(run.metadata)
+            return run
+
+    def GetExperimentRun(self, request, context):
+        run = _get_or_abort(
+            self._server.experiment_runs, request.experiment_run_id, context
+        )
+        return self._progress(run)
+
+    def ListExperimentRuns(self, request, context):
+        runs = [
+            self._progress(run)
+            for run in list(self._server.experiment_runs.values())
+            if run.experiment_id == request.experiment_id
+        ]
+        return ListExperimentRunsResponse(experiment_runs=runs)
+
+    def CancelExperimentRun(self, request, context):
+        run = _get_or_abort(
+            self._server.experiment_runs, request.experiment_run_id, context
+        )
+        with self._lock:
+            if run.status not in _TERMINAL_RUN_STATUSES:
+                run.status = ExperimentRunStatusProto.CANCELLED
+        return run
+
+
+class _StorageService(pb2_data_grpc.StorageServiceServicer):
+    def __init__(self, server: FakeServer):
+        self._server = server
+
+    def GetStorage(self, request, context):
+        return _get_or_abort(self._server.storages, request.storage_id, context)
+
+    def ListStorages(self, request, context):
+        storages = [
+            storage
+            for storage in self._server.storages.values()
+            if storage.project_id == request.project_id
+            and request.type in (StorageType.STORAGE_TYPE_UNSPECIFIED, storage.type)
+        ]
+        return ListStoragesResponse(storages=storages)
+
+    def CreateStorageFromExternalBucket(self, request, context):
+        storage = StorageProto(
+            id=_new_id(),
+            name=request.name,
+            description=request.description,
+            type=StorageType.DATASET,
+            project_id=request.project_id,
+            status=StorageStatusProto.COMPLETED,
+            created_at=_now(),
+        )
+        self._server.storages[storage.id] = storage
+        return storage
+
+    def CreateStorageFromFile(self, request, context):
+        _get_or_abort(self._server.projects, request.project_id, context)
+        storage = StorageProto(
+            id=_new_id(),
+            name=request.name,
+            description=request.description,
+            type=StorageType.DATASET,
+            project_id=request.project_id,
+            status=StorageStatusProto.COMPLETED,
+            created_at=_now(),
+        )
+        self._server.storages[storage.id] = storage
+        return CreateStorageFromFileResponse(
+            storage=storage,
+            signed_url=f"{self._server.upload_url}/{storage.id}/{request.file_name}",
+        )
+
+    def DeleteStorage(self, request, context):
+        storage = _get_or_abort(self._server.storages, request.storage_id, context)
+        storage.status = StorageStatusProto.DELETED
+        return storage
+
+    def ExportStorage(self, request, context):
+        _get_or_abort(self._server.storages, request.storage_id, context)
+        return ExportStorageResponse()
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    # stands in for the signed urls of the storage bucket, uploaded files are kept in `FakeServer.uploads`
+    fake_server: FakeServer
+
+    def do_PUT(self):
+        storage_id = self.path.strip("/").split("/")[0]
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.fake_server._lock:
+            self.fake_server.uploads[storage_id] = data
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _PlanService(pb2_plan_grpc.PlanServiceServicer):
+    def CheckFunctionality(self, request, context):
+        return empty_pb2.Empty()
+
+
+class _ChannelService(pb2_channel_grpc.ChannelServiceServicer):
+    def __init__(self, server: FakeServer):
+        self._server = server
+
+    def CreateChannel(self, request, context):
+        return CreateChannelResponse(channel_id=_new_id())
+
+    def ConnectChannelCustomer(self, request_iterator, context):
+        # asks `channel_asks` times for the value of a single parameter and completes the channel afterward
+        asks = 0
+        for message in request_iterator:
+            data = message.WhichOneof("data")
+            if data == "acknowledge_data":
+                continue
+            if data == "completion_data":
+                return
+
+            if asks < self._server.channel_asks:
+                asks += 1
+                yield ChannelMessage(
+                    sequential_message_id=2 * asks - 1,
+                    timestamp=_now(),
+                    ask_data=Ask(
+                        parameters=[Parameter(values=[float(asks)])], headers=["x"]
+                    ),
+                )
+            else:
+                yield ChannelMessage(
+                    sequential_message_id=2 * asks + 1,
+                    timestamp=_now(),
+                    completion_data=Completion(),
+                )
+
+
+class FakeServer:
+    """
+    An in-process stand-in for the TQ42 API. It serves the organization, project, experiment, experiment run,
+    storage, plan and channel services from memory, so the SDK can be benchmarked and load tested without the backend.
+
+    It starts with one organization, project and experiment. Experiment runs complete `run_duration` seconds after
+    they were created. Files uploaded to new datasets are received by a local HTTP server and kept in `uploads`.
+
+    :param latency: seconds every call is delayed before it is answered
+    :param failure_rate: share of calls, between 0 and 1, that fail with `failure_code`
+    :param failure_code: status of injected failures
+    :param run_duration: seconds until an experiment run is completed
+    :param channel_asks: number of asks sent on a channel before it is completed
+    :param seed: seed for the injected failures, set it for reproducible runs
+    :param max_workers: number of threads handling calls
+
+    Clients created while the environment variable `TQ42_LOCAL_ADDRESS` is set to :py:attr:`address` talk to the
+    server over plaintext.
+
+    Example:
+        >>> import os
+        ... from tq42.client import TQ42Client
+        ... from tq42.experiment_run import ExperimentRun
+        ...
+        ... with FakeServer(latency=0.01) as server:
+        ...     os.environ["TQ42_LOCAL_ADDRESS"] = server.address
+        ...     with TQ42Client() as client:
+        ...         run = ExperimentRun.create(client=client, experiment_id=server.experiment_id, ...)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        failure_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+        run_duration: float = 0.0,
+        channel_asks: int = 1,
+        seed: Optional[int] = None,
+        max_workers: int = 16,
+    ):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.failure_code = failure_code
+        self.run_duration = run_duration
+        self.channel_asks = channel_asks
+
+        self.calls: Counter = Counter()
+        """Number of calls per method name"""
+        self.last_metadata: Dict[str, tuple] = {}
+        """Metadata of the last call per method name"""
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._scheduled_failures: Dict[str, List[grpc.StatusCode]] = {}
+
+        self.organizations: Dict[str, OrganizationProto] = {}
+        self.projects: Dict[str, ProjectProto] = {}
+        self.experiments: Dict[str, ExperimentProto] = {}
+        self.experiment_runs: Dict[str, ExperimentRunProto] = {}
+        self.storages: Dict[str, StorageProto] = {}
+        self.uploads: Dict[str, bytes] = {}
+        """Files uploaded to a dataset per storage id"""
+
+        organization = OrganizationProto(id=_new_id(), name="fake organization")
+        project = ProjectProto(
+            id=_new_id(), organization_id=organization.id, name="fake project"
+        )
+        experiment = ExperimentProto(
+            id=_new_id(), project_id=project.id, name="fake experiment"
+        )
+        self.organizations[organization.id] = organization
+        self.projects[project.id] = project
+        self.experiments[experiment.id] = experiment
+        self.organization_id = organization.id
+        self.project_id = project.id
+        self.experiment_id = experiment.id
+
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=max_workers),
+            interceptors=[_FaultInjector(self)],
+        )
+        pb2_org_grpc.add_OrganizationServiceServicer_to_server(
+            _OrganizationService(self), self._server
+        )
+        pb2_proj_grpc.add_ProjectServiceServicer_to_server(
+            _ProjectService(self), self._server
+        )
+        pb2_exp_grpc.add_ExperimentServiceServicer_to_server(
+            _ExperimentService(self), self._server
+        )
+        pb2_exp_run_grpc.add_ExperimentRunServiceServicer_to_server(
+            _ExperimentRunService(self), self._server
+        )
+        pb2_data_grpc.add_StorageServiceServicer_to_server(
+            _StorageService(self), self._server
+        )
+        pb2_plan_grpc.add_PlanServiceServicer_to_server(_PlanService(), self._server)
+        pb2_channel_grpc.add_ChannelServiceServicer_to_server(
+            _ChannelService(self), self._server
+        )
+        port = self._server.add_insecure_port("localhost:0")
+        self.address = f"localhost:{port}"
+        """`host:port` the server listens on"""
+
+        # the server receiving uploads is only started once a dataset is created from a file
+        self._upload_server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def upload_url(self) -> str:
+        """
+        Base of the signed urls files are uploaded to.
+        """
+        with self._lock:
+            if self._upload_server is None:
+                handler = type(
+                    "UploadHandler", (_UploadHandler,), {"fake_server": self}
+                )
+                self._upload_server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+                threading.Thread(
+                    target=self._upload_server.serve_forever, daemon=True
+                ).start()
+            return f"http://127.0.0.1:{self._upload_server.server_port}"
+
+    def start(self) -> FakeServer:
+        self._server.start()
+        return self
+
+    def stop(self, grace: Optional[float] = None) -> None:
+        self._server.stop(grace).wait()
+        if self._upload_server is not None:
+            self._upload_server.shutdown()
+            self._upload_server.server_close()
+            self._upload_server = None
+
+    def __enter__(self) -> FakeServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def fail_next(
+        self,
+        method: str,
+        count: int = 1,
+        code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+    ) -> None:
+        """
+        Let the next `count` calls of `method`, e.g. `GetExperimentRun`, fail with `code`.
+        """
+        with self._lock:
+            self._scheduled_failures.setdefault(method, []).extend([code] * count)
+
+    def _before_call(self, method: str, metadata, context: grpc.ServicerContext):
+        with self._lock:
+            self.calls[method] += 1
+            self.last_metadata[method] = tuple(metadata or ())
+            scheduled = self._scheduled_failures.get(method)
+            if scheduled:
+                code = scheduled.pop(0)
+            elif self.failure_rate and self._random.random() < self.failure_rate:
+                code = self.failure_code
+            else:
+                code = None
+
+        if self.latency:
+            time.sleep(self.latency)
+        if code is not None:
+            context.abort(code, f"Injected failure of {method}")
@@ -0,0 +1,24 @@
+import os
+from unittest import mock
+
+import pytest
+
+from tq42.client import TQ42Client
+from tq42.testing import FakeServer
+
+
+@pytest.fixture
+def server():
+    """
+    A FakeServer that all clients created during the test talk to, with a fixed access token.
+    """
+    with FakeServer() as server, mock.patch.dict(
+        os.environ, {"TQ42_LOCAL_ADDRESS": server.address}
+    ), mock.patch("tq42.utils.token_manager.get_token", return_value="local-token"):
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with TQ42Client() as client:
+        yield client
@@ -0,0 +1,202 @@
+import asyncio
+import threading
+from unittest import mock
+from unittest.mock import AsyncMock
+
+from grpc import StatusCode
+from grpc.aio import AioRpcError, Metadata
+from pytest import mark, raises
+
+from com.terraquantum.storage.v1alpha1.storage_pb2 import StorageProto
+from com.terraquantum.experiment.v1.experimentrun.experiment_run_pb2 import (
+    ExperimentRunStatusProto,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.experiment_run_pb2 import (
+    ExperimentRunProto,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.list_experiment_runs_pb2 import (
+    ListExperimentRunsResponse,
+)
+
+from tq42.aio.dataset import Dataset
+from tq42.dataset import DatasetSensitivityProto, ExportStorageResponse
+from tq42.aio.experiment import Experiment, ExperimentProto
+from tq42.aio.experiment_run import ExperimentRun, HardwareProto, list_all
+from tq42.aio.model import Model
+from tq42.aio.organization import Organization, OrganizationProto
+from tq42.aio.project import Project, ProjectProto
+from tq42.client import TQ42AsyncClient
+from tq42.exceptions import InvalidArgumentError
+
+
+def _run(status: ExperimentRunStatusProto) -> ExperimentRunProto:
+    return ExperimentRunProto(id="some-run-id", status=status)
+
+
+@mark.asyncio
+async def test_create_and_poll_experiment_run():
+    client = TQ42AsyncClient()
+    client.experiment_run_client.CreateExperimentRun = AsyncMock(
+        return_value=_run(ExperimentRunStatusProto.QUEUED)
+    )
+    client.experiment_run_client.GetExperimentRun = AsyncMock(
+        side_effect=[
+            _run(ExperimentRunStatusProto.RUNNING),
+            _run(ExperimentRunStatusProto.COMPLETED),
+        ]
+    )
+
+    run = await ExperimentRun.create(
+        client=client,
+        algorithm="TOY",
+        version="0.1.0",
+        experiment_id="some-experiment-id",
+        compute=HardwareProto.SMALL,
+        parameters={"parameters": {"n": 1}, "inputs": {}},
+    )
+    assert run.data.status == ExperimentRunStatusProto.QUEUED
+
+    await run.poll(initial_delay=0, delay=0)
+    assert run.completed
+    assert client.experiment_run_client.GetExperimentRun.await_count == 2
+
+    await client.close()
+
+
+@mark.asyncio
+async def test_concurrent_checks_share_one_loop():
+    client = TQ42AsyncClient()
+
+    async def get_experiment_run(request):
+        await asyncio.sleep(0.05)
+        return ExperimentRunProto(
+            id=request.experiment_run_id, status=ExperimentRunStatusProto.COMPLETED
+        )
+
+    client.experiment_run_client.GetExperimentRun = get_experiment_run
+    runs = [
+        ExperimentRun(client=client, id=str(i), data=ExperimentRunProto(id=str(i)))
+        for i in range(100)
+    ]
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(*[run.check() for run in runs])
+
+    # all calls are in flight at the same time instead of one after another
+    assert loop.time() - start < 1.0
+    assert all(run.completed for run in runs)
+
+    await client.close()
+
+
+@mark.asyncio
+async def test_list_all_experiment_runs():
+    client = TQ42AsyncClient()
+    client.experiment_run_client.ListExperimentRuns = AsyncMock(
+        return_value=ListExperimentRunsResponse(
+            experiment_runs=[ExperimentRunProto(id="a"), ExperimentRunProto(id="b")]
+        )
+    )
+
+    runs = await list_all(client=client, experiment_id="some-experiment-id")
+    assert [run.id for run in runs] == ["a", "b"]
+    assert all(isinstance(run, ExperimentRun) for run in runs)
+
+    await client.close()
+
+
+@mark.asyncio
+async def test_rpc_errors_are_translated():
+    client = TQ42AsyncClient()
+    client.experiment_run_client.GetExperimentRun = AsyncMock(
+        side_effect=AioRpcError(
+            code=StatusCode.NOT_FOUND,
+            initial_metadata=Metadata(),
+            trailing_metadata=Metadata(),
+            details="no details",
+        )
+    )
+
+    with raises(InvalidArgumentError):
+        await ExperimentRun.get(client=client, id="this-run-id-does-not-exist")
+
+    await client.close()
+
+
+@mark.asyncio
+async def test_storage_is_refreshed_asynchronously():
+    client = TQ42AsyncClient()
+    client.storage_client.GetStorage = AsyncMock(
+        return_value=StorageProto(id="storage-id", name="refreshed")
+    )
+
+    for resource in (
+        Dataset(client=client, id="storage-id", data=StorageProto(id="storage-id")),
+        Model(client=client, id="storage-id", data=StorageProto(id="storage-id")),
+    ):
+        await resource._refresh()
+        assert resource.data.name == "refreshed"
+
+    await client.close()
+
+
+@mark.asyncio
+async def test_create_dataset_from_file(server, tmp_path):
+    file = tmp_path / "data.csv"
+    file.write_bytes(b"a,b\n1,2\n")
+
+    async with TQ42AsyncClient() as client:
+        dataset = await Dataset.create(
+            client=client,
+            project_id=server.project_id,
+            name="data",
+            description="some data",
+            sensitivity=DatasetSensitivityProto.GENERAL,
+            file=str(file),
+        )
+
+    assert isinstance(dataset, Dataset)
+    assert server.uploads[dataset.id] == b"a,b\n1,2\n"
+
+
+@mark.asyncio
+async def test_export_dataset_downloads_off_the_event_loop(tmp_path):
+    client = TQ42AsyncClient()
+    client.storage_client.ExportStorage = AsyncMock(
+        return_value=ExportStorageResponse(
+            signed_urls=["https://storage.example.com/bucket/first.csv?signature=1"]
+        )
+    )
+    dataset = Dataset(
+        client=client, id="storage-id", data=StorageProto(id="storage-id", name="data")
+    )
+    loop_thread = threading.get_ident()
+    download_threads = []
+
+    def download(url: str, file_path: str):
+        download_threads.append(threading.get_ident())
+
+    with mock.patch.object(Dataset, "_download_file_from_url", side_effect=download):
+        paths = await dataset.export(directory_path=str(tmp_path))
+
+    assert paths == [str(tmp_path / "data" / "first.csv")]
+    assert download_threads and loop_thread not in download_threads
+
+    await client.close()
+
+
+@mark.asyncio
+async def test_resources_are_loaded_asynchronously(server):
+    async with TQ42AsyncClient() as client:
+        organization = Organization(
+            client=client, id=server.organization_id, data=OrganizationProto()
+        )
+        project = Project(client=client, id=server.project_id, data=ProjectProto())
+        experiment = Experiment(
+            client=client, id=server.experiment_id, data=ExperimentProto()
+        )
+
+        assert (await organization._get()).id == server.organization_id
+        assert (await project._get()).id == server.project_id
+        assert (await experiment._get_data()).id == server.experiment_id
@@ -0,0 +1,97 @@
+import grpc
+import pytest
+from pytest import mark
+
+from tq42.aio.experiment_run import ExperimentRun as AioExperimentRun
+from tq42.client import TQ42AsyncClient, TQ42Client
+from tq42.exceptions import InvalidArgumentError
+from tq42.experiment_run import ExperimentRun, HardwareProto
+from tq42.testing import FakeServer
+from tq42.utils.call_stats import CallRecord, CallStats
+
+_GET_RUN = "ExperimentRunService/GetExperimentRun"
+
+
+def _record(duration: float, code=grpc.StatusCode.OK) -> CallRecord:
+    return CallRecord(
+        method=_GET_RUN,
+        duration=duration,
+        code=code,
+        request_bytes=10,
+        response_bytes=100 if code == grpc.StatusCode.OK else 0,
+    )
+
+
+def test_percentiles_and_totals():
+    stats = CallStats()
+    for i in range(1, 101):
+        stats.record(_record(i / 1000))
+    stats.record(_record(1.0, code=grpc.StatusCode.UNAVAILABLE))
+
+    method_stats = stats.snapshot()[_GET_RUN]
+
+    assert method_stats.calls == 101
+    assert method_stats.errors == 1
+    assert method_stats.p50 == pytest.approx(0.05, rel=0.2)
+    assert method_stats.p99 == pytest.approx(0.1, rel=0.2)
+    assert method_stats.max == 1.0
+    assert method_stats.request_bytes == 1010
+    assert method_stats.response_bytes == 10000
+    assert method_stats.status_codes == {"OK": 100, "UNAVAILABLE": 1}
+
+
+def test_sinks_and_slow_calls(caplog):
+    received = []
+
+    def broken_sink(record):
+        raise ValueError()
+
+    stats = CallStats(sinks=[broken_sink, received.append], slow_call_threshold=0.5)
+    stats.record(_record(0.1))
+    stats.record(_record(0.6))
+
+    assert len(received) == 2
+    assert "Slow call ExperimentRunService/GetExperimentRun took 0.600s" in caplog.text
+
+
+def _create_run(client, server: FakeServer):
+    return dict(
+        client=client,
+        algorithm="TOY",
+        version="0.1.0",
+        experiment_id=server.experiment_id,
+        compute=HardwareProto.SMALL,
+        parameters={"parameters": {"n": 1}, "inputs": {}},
+    )
+
+
+def test_client_records_calls(server):
+    with TQ42Client(shared_transport=True) as client:
+        run = ExperimentRun.create(**_create_run(client, server))
+        run.check()
+        with pytest.raises(InvalidArgumentError):
+            ExperimentRun(client=client, id="unknown-id")
+
+        stats = client.stats()
+        # clients sharing the channel keep their own statistics
+        assert TQ42Client(shared_transport=True).stats() == {}
+
+    TQ42Client.close_shared_transports()
+    assert stats["ExperimentRunService/CreateExperimentRun"].calls == 1
+    assert stats["ExperimentRunService/CreateExperimentRun"].request_bytes > 0
+    assert stats[_GET_RUN].calls == 2
+    assert stats[_GET_RUN].status_codes == {"OK": 1, "NOT_FOUND": 1}
+    assert stats[_GET_RUN].response_bytes > 0
+
+
+@mark.asyncio
+async def test_async_client_records_calls(server):
+    async with TQ42AsyncClient() as client:
+        run = await AioExperimentRun.create(**_create_run(client, server))
+        await run.check()
+
+        stats = client.stats()
+
+    assert stats["ExperimentRunService/CreateExperimentRun"].calls == 1
+    assert stats[_GET_RUN].calls == 1
+    assert stats[_GET_RUN].status_codes == {"OK": 1}
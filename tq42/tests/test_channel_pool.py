@@ -0,0 +1,102 @@
+import threading
+import time
+from concurrent import futures
+
+import grpc
+import pytest
+
+from com.terraquantum.experiment.v3alpha2.experimentrun import (
+    experiment_run_service_pb2_grpc as pb2_exp_run_grpc,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.experiment_run_pb2 import (
+    ExperimentRunProto,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.get_experiment_run_request_pb2 import (
+    GetExperimentRunRequest,
+)
+
+from tq42.utils.channel_pool import (
+    ChannelPool,
+    ChannelSelection,
+    POOLED_CHANNEL_OPTIONS,
+)
+
+
+class _ExperimentRunService(pb2_exp_run_grpc.ExperimentRunServiceServicer):
+    def __init__(self):
+        self.release = threading.Event()
+        self.peers = set()
+
+    def GetExperimentRun(self, request, context):
+        self.peers.add(context.peer())
+        self.release.wait(timeout=5)
+        return ExperimentRunProto(id=request.experiment_run_id)
+
+
+@pytest.fixture
+def blocking_server():
+    """
+    The service of a server whose GetExperimentRun calls wait until `service.release` is set, and its address.
+    """
+    service = _ExperimentRunService()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=16))
+    pb2_exp_run_grpc.add_ExperimentRunServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield service, f"localhost:{port}"
+    server.stop(grace=None)
+
+
+def _pool(address: str, size: int, selection: ChannelSelection) -> ChannelPool:
+    return ChannelPool(
+        channel_factory=lambda: grpc.insecure_channel(
+            address, options=POOLED_CHANNEL_OPTIONS
+        ),
+        size=size,
+        selection=selection,
+    )
+
+
+def test_pool_needs_at_least_one_channel():
+    with pytest.raises(ValueError):
+        ChannelPool(channel_factory=lambda: None, size=0)
+
+
+def test_round_robin_uses_a_connection_per_channel(blocking_server):
+    service, address = blocking_server
+    service.release.set()
+
+    with _pool(address, size=4, selection=ChannelSelection.ROUND_ROBIN) as pool:
+        stub = pb2_exp_run_grpc.ExperimentRunServiceStub(pool)
+        for i in range(8):
+            res = stub.GetExperimentRun(
+                GetExperimentRunRequest(experiment_run_id=str(i))
+            )
+            assert res.id == str(i)
+
+        assert pool.in_flight == [0, 0, 0, 0]
+
+    assert len(service.peers) == 4
+
+
+def test_least_loaded_spreads_calls_in_flight(blocking_server):
+    service, address = blocking_server
+
+    with _pool(address, size=3, selection=ChannelSelection.LEAST_LOADED) as pool:
+        stub = pb2_exp_run_grpc.ExperimentRunServiceStub(pool)
+        calls = [
+            stub.GetExperimentRun.future(
+                GetExperimentRunRequest(experiment_run_id=str(i))
+            )
+            for i in range(6)
+        ]
+        assert pool.in_flight == [2, 2, 2]
+
+        service.release.set()
+        assert [call.result().id for call in calls] == [str(i) for i in range(6)]
+
+        # done callbacks of futures run shortly after the result is available
+        deadline = time.monotonic() + 5
+        while pool.in_flight != [0, 0, 0] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.in_flight == [0, 0, 0]
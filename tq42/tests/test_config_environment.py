@@ -83,6 +83,14 @@ class TestConfigEnvironment(unittest.TestCase):
         self.assertEqual("client_id", env.client_id)
         self.assertEqual("scope", env.scope)
 
+    @mock.patch.dict("os.environ", {"TQ42_LOCAL_ADDRESS": "localhost:50051"})
+    def test_local_address(self):
+        env = ConfigEnvironment.from_env()
+
+        self.assertEqual("localhost:50051", env.api_host)
+        self.assertEqual("localhost:50051", env.channels_host)
+        self.assertEqual("https://auth.terraquantum.io/oauth/token", env.auth_url_token)
+
     def test_default_environment(self):
         env = ConfigEnvironment.from_env()
 
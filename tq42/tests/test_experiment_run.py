@@ -0,0 +1,125 @@
+import json
+import sys
+import unittest
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from google.protobuf import struct_pb2
+from google.protobuf.json_format import MessageToDict, ParseDict
+
+from com.terraquantum.experiment.v1.experimentrun.experiment_run_pb2 import (
+    ExperimentRunStatusProto,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.experiment_run_pb2 import (
+    ExperimentRunProto,
+)
+
+from tq42.experiment_run import ExperimentRun
+
+
+def _completed(outcome: dict) -> ExperimentRunProto:
+    data = ExperimentRunProto(id="id", status=ExperimentRunStatusProto.COMPLETED)
+    data.result.outcome.CopyFrom(ParseDict(outcome, struct_pb2.Struct()))
+    return data
+
+
+class TestExperimentRunResult(unittest.TestCase):
+    def setUp(self):
+        self.run = ExperimentRun(
+            client=MagicMock(),
+            id="id",
+            data=_completed({"result": {"x": [1, 2]}, "outputs": {"y": "z"}}),
+        )
+
+    def test_result_is_decoded_once(self):
+        with mock.patch(
+            "tq42.experiment_run.MessageToDict", side_effect=MessageToDict
+        ) as decode_mock:
+            for _ in range(10):
+                self.assertEqual(self.run.result, {"x": [1.0, 2.0]})
+
+        decode_mock.assert_called_once()
+
+    def test_only_the_requested_field_is_decoded(self):
+        with mock.patch(
+            "tq42.experiment_run.MessageToDict", side_effect=MessageToDict
+        ) as decode_mock:
+            self.assertEqual(self.run.outputs, {"y": "z"})
+
+        decode_mock.assert_called_once_with(
+            self.run.data.result.outcome.fields["outputs"]
+        )
+
+    def test_replacing_the_data_decodes_again(self):
+        self.assertEqual(self.run.result, {"x": [1.0, 2.0]})
+
+        self.run.data = _completed({"result": {"results_string": json.dumps({"x": 3})}})
+
+        self.assertEqual(self.run.result, {"x": 3})
+        self.assertEqual(self.run.outputs, {})
+
+    def test_unfinished_runs_have_no_result(self):
+        self.run.data = ExperimentRunProto(
+            id="id", status=ExperimentRunStatusProto.RUNNING
+        )
+
+        self.assertIsNone(self.run.result)
+        self.assertIsNone(self.run.outputs)
+
+
+class TestExperimentRunArrays(unittest.TestCase):
+    def setUp(self):
+        self.run = ExperimentRun(
+            client=MagicMock(),
+            id="id",
+            data=_completed(
+                {
+                    "result": {
+                        "x": [0.0, -1.5, 2.25],
+                        "y": 3,
+                        "matrix": [[1, 2], [3, 4]],
+                        "labels": ["a", "b"],
+                    },
+                    "outputs": {"counts": {"shots": [10, 0, 5]}},
+                }
+            ),
+        )
+
+    def test_lists_of_numbers(self):
+        x = self.run.result_array("x")
+
+        self.assertEqual(x.dtype, np.float64)
+        np.testing.assert_array_equal(x, [0.0, -1.5, 2.25])
+        np.testing.assert_array_equal(self.run.result_array("y"), 3.0)
+
+    def test_nested_lists_and_dtypes(self):
+        matrix = self.run.result_array("matrix", dtype=np.int64)
+        shots = self.run.outputs_array("counts", "shots", dtype=np.int32)
+
+        np.testing.assert_array_equal(matrix, [[1, 2], [3, 4]])
+        self.assertEqual(matrix.dtype, np.int64)
+        np.testing.assert_array_equal(shots, [10, 0, 5])
+        self.assertEqual(shots.dtype, np.int32)
+
+    def test_results_sent_as_json(self):
+        self.run.data = _completed(
+            {"result": {"results_string": json.dumps({"x": [1, 2]})}}
+        )
+
+        np.testing.assert_array_equal(self.run.result_array("x"), [1.0, 2.0])
+
+    def test_invalid_paths(self):
+        with self.assertRaises(KeyError):
+            self.run.result_array("missing")
+        with self.assertRaises(KeyError):
+            self.run.result_array("x", "nested")
+        with self.assertRaises(TypeError):
+            self.run.result_array("labels")
+
+    def test_numpy_is_optional(self):
+        with mock.patch.dict(sys.modules, {"numpy": None}), self.assertRaisesRegex(
+            ImportError, r"tq42\[numpy\]"
+        ):
+            self.run.result_array("x")
@@ -0,0 +1,158 @@
+import grpc
+import pytest
+from pytest import mark
+
+from tq42.aio.experiment_run import ExperimentRun as AsyncExperimentRun
+from tq42.client import TQ42AsyncClient, TQ42Client
+from tq42.exceptions import (
+    InvalidArgumentError,
+    PermissionDeniedError,
+    PollTimeoutError,
+)
+from tq42.experiment_run import (
+    ExperimentRun,
+    HardwareProto,
+    as_completed,
+    list_all,
+    wait_all,
+)
+from tq42.testing import FakeServer
+from tq42.utils.run_store import RunStore
+
+
+def _specs(count: int):
+    return [
+        {
+            "algorithm": "TOY",
+            "version": "0.1.0",
+            "compute": HardwareProto.SMALL,
+            "parameters": {"parameters": {"n": n}, "inputs": {}},
+        }
+        for n in range(count)
+    ]
+
+
+def test_create_many_keeps_the_order_of_the_specs(server, client):
+    runs = ExperimentRun.create_many(
+        client=client,
+        experiment_id=server.experiment_id,
+        specs=_specs(20),
+        max_concurrency=4,
+    )
+
+    assert [run.data.metadata["parameters"]["n"] for run in runs] == list(range(20))
+    assert server.calls["CreateExperimentRun"] == 20
+
+
+def test_create_many_reports_failed_runs_in_place(server, client):
+    server.fail_next("CreateExperimentRun", code=grpc.StatusCode.INVALID_ARGUMENT)
+    specs = _specs(5)
+    specs[2] = {**specs[2], "unknown_argument": True}
+
+    runs = ExperimentRun.create_many(
+        client=client, experiment_id=server.experiment_id, specs=specs
+    )
+
+    assert isinstance(runs[2], TypeError)
+    failed = [run for run in runs if isinstance(run, InvalidArgumentError)]
+    created = [run for run in runs if isinstance(run, ExperimentRun)]
+    assert len(failed) == 1
+    assert len(created) == 3
+
+
+def test_create_many_rejects_invalid_concurrency(client):
+    with pytest.raises(ValueError):
+        ExperimentRun.create_many(
+            client=client, experiment_id="id", specs=_specs(1), max_concurrency=0
+        )
+
+
+def test_list_all_translates_errors(server, client):
+    server.fail_next("ListExperimentRuns", code=grpc.StatusCode.PERMISSION_DENIED)
+
+    with pytest.raises(PermissionDeniedError):
+        list_all(client=client, experiment_id=server.experiment_id)
+
+
+def _create_runs(client: TQ42Client, server: FakeServer, count: int):
+    return ExperimentRun.create_many(
+        client=client, experiment_id=server.experiment_id, specs=_specs(count)
+    )
+
+
+def test_wait_all_lists_runs_of_the_same_experiment(server, client):
+    server.run_duration = 0.3
+    runs = _create_runs(client, server, 50)
+
+    finished = wait_all(runs, interval=0.1)
+
+    assert finished == runs
+    assert all(run.completed for run in runs)
+    assert server.calls["GetExperimentRun"] == 0
+    assert 1 <= server.calls["ListExperimentRuns"] <= 5
+
+
+def test_as_completed_gets_single_runs(server, client):
+    server.run_duration = 0.2
+    runs = _create_runs(client, server, 1)
+
+    assert list(as_completed(runs, interval=0.1)) == runs
+    assert server.calls["ListExperimentRuns"] == 0
+    assert server.calls["GetExperimentRun"] >= 1
+
+
+def test_as_completed_falls_back_to_get_if_listing_fails(server, client):
+    server.run_duration = 0.2
+    runs = _create_runs(client, server, 3)
+    server.fail_next("ListExperimentRuns", count=100, code=grpc.StatusCode.NOT_FOUND)
+
+    assert sorted(run.id for run in as_completed(runs, interval=0.1)) == sorted(
+        run.id for run in runs
+    )
+    assert server.calls["GetExperimentRun"] >= 3
+
+
+def test_as_completed_retries_runs_that_failed_to_refresh(server, client):
+    server.run_duration = 0.2
+    runs = _create_runs(client, server, 3)
+    server.fail_next("ListExperimentRuns", count=100, code=grpc.StatusCode.NOT_FOUND)
+    server.fail_next("GetExperimentRun", code=grpc.StatusCode.NOT_FOUND)
+
+    assert sorted(run.id for run in as_completed(runs, interval=0.1)) == sorted(
+        run.id for run in runs
+    )
+
+
+def test_wait_all_stores_listed_runs(server, tmp_path):
+    server.run_duration = 0.2
+    store = RunStore(path=str(tmp_path / "runs.sqlite3"))
+    with TQ42Client(run_store=store) as client:
+        runs = wait_all(_create_runs(client, server, 3), interval=0.1)
+
+    assert server.calls["GetExperimentRun"] == 0
+    assert all(store.get(client.api_host, run.id) == run.data for run in runs)
+
+
+def test_as_completed_yields_finished_runs_first(server, client):
+    runs = _create_runs(client, server, 2)
+    runs[0].check()
+    server.run_duration = 60
+
+    completed = as_completed(runs, interval=0.05, timeout=0.2)
+
+    assert next(completed) is runs[0]
+    with pytest.raises(PollTimeoutError):
+        next(completed)
+
+
+@mark.asyncio
+async def test_create_many_async(server):
+    async with TQ42AsyncClient() as client:
+        runs = await AsyncExperimentRun.create_many(
+            client=client,
+            experiment_id=server.experiment_id,
+            specs=_specs(10),
+            max_concurrency=3,
+        )
+
+    assert [run.data.metadata["parameters"]["n"] for run in runs] == list(range(10))
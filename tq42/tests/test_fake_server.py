@@ -0,0 +1,128 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest import mark
+
+from com.terraquantum.experiment.v1.experimentrun.experiment_run_pb2 import (
+    ExperimentRunStatusProto,
+)
+
+from tq42.channel import Ask, Channel, Tell
+from tq42.client import TQ42Client
+from tq42.exceptions import InvalidArgumentError
+from tq42.experiment_run import ExperimentRun, HardwareProto
+from tq42.testing import FakeServer
+
+
+def _create_run(client: TQ42Client, server: FakeServer) -> ExperimentRun:
+    return ExperimentRun.create(
+        client=client,
+        algorithm="TOY",
+        version="0.1.0",
+        experiment_id=server.experiment_id,
+        compute=HardwareProto.SMALL,
+        parameters={"parameters": {"n": 1}, "inputs": {}},
+    )
+
+
+def test_experiment_run_completes_over_plaintext(server, client):
+    run = _create_run(client, server)
+    run.poll(initial_delay=0, delay=0)
+
+    assert run.data.status == ExperimentRunStatusProto.COMPLETED
+    assert run.result == {"parameters": {"n": 1.0}, "inputs": {}}
+    assert ("authorization", "Bearer local-token") in server.last_metadata[
+        "CreateExperimentRun"
+    ]
+
+
+def test_injected_failures_are_retried(server, client):
+    run = _create_run(client, server)
+    server.fail_next("GetExperimentRun", count=2)
+
+    run.check()
+
+    assert server.calls["GetExperimentRun"] == 3
+
+
+def test_unknown_ids_are_not_found(server, client):
+    with pytest.raises(InvalidArgumentError):
+        ExperimentRun(client=client, id="unknown-id")
+
+
+def test_calls_after_closing_shared_transports(server):
+    with TQ42Client(shared_transport=True) as client:
+        run = _create_run(client, server)
+        TQ42Client.close_shared_transports()
+
+        run.check()
+        TQ42Client.close_shared_transports()
+
+    assert run.data.status == ExperimentRunStatusProto.COMPLETED
+    assert server.calls["GetExperimentRun"] == 1
+
+
+@mark.asyncio
+async def test_channel_round_trip(server, client):
+    channel = await Channel.create(client=client)
+    asks = []
+
+    async def callback(ask: Ask) -> Tell:
+        asks.append(ask)
+        return Tell(parameters=ask.parameters, headers=ask.headers, results=[0.0])
+
+    await channel.connect(callback=callback, finish_callback=lambda: None)
+
+    assert len(asks) == server.channel_asks
+
+
+def test_check_async_from_consecutive_event_loops(server, client):
+    run = _create_run(client, server)
+
+    def check_twice():
+        asyncio.run(run.check_async())
+        asyncio.run(run.check_async())
+
+    # asyncio.run clears the event loop of its thread, so it runs in a thread that no other test uses
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(check_twice).result()
+
+    assert run.completed
+    assert server.calls["GetExperimentRun"] == 2
+
+
+@mark.asyncio
+async def test_poll_async_does_not_block_the_event_loop(server, client):
+    server.run_duration = 0.3
+    run = _create_run(client, server)
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    await run.poll_async(initial_delay=0, delay=0.05)
+    ticker.cancel()
+
+    assert run.completed
+    assert len(ticks) > 10
+    assert server.calls["GetExperimentRun"] >= 2
+
+
+@mark.asyncio
+async def test_channel_finish_callback_can_poll_the_run(server, client):
+    run = _create_run(client, server)
+    channel = await Channel.create(client=client)
+
+    async def callback(ask: Ask) -> Tell:
+        return Tell(parameters=ask.parameters, headers=ask.headers, results=[0.0])
+
+    async def finish():
+        await run.poll_async()
+
+    await channel.connect(callback=callback, finish_callback=finish)
+
+    assert run.completed
@@ -0,0 +1,63 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tq42.utils import http
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures = 0
+    client_ports = set()
+
+    def do_GET(self):
+        _Handler.client_ports.add(self.client_address[1])
+        if _Handler.failures:
+            _Handler.failures -= 1
+            self.send_response(503)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _Handler.failures = 0
+    _Handler.client_ports = set()
+    http.configure(http.HttpOptions(backoff_factor=0))
+    yield f"http://127.0.0.1:{server.server_port}/"
+    http.configure(http.HttpOptions())
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_reused(url):
+    assert http.session() is http.session()
+
+    for _ in range(5):
+        assert http.session().get(url).ok
+
+    assert len(_Handler.client_ports) == 1
+
+
+def test_transient_errors_are_retried(url):
+    _Handler.failures = 2
+
+    assert http.session().get(url).status_code == 200
+
+
+def test_last_response_is_returned_once_retries_are_used_up(url):
+    _Handler.failures = 10
+    http.configure(http.HttpOptions(retries=1, backoff_factor=0))
+
+    assert http.session().get(url).status_code == 503
+    assert _Handler.failures == 8
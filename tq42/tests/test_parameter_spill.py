@@ -0,0 +1,76 @@
+import json
+
+
+from tq42.experiment_run import ExperimentRun, HardwareProto, ParameterSpill
+
+
+def _spec(qubo: list, inputs: dict = None) -> dict:
+    return {
+        "algorithm": "TOY",
+        "version": "0.1.0",
+        "compute": HardwareProto.SMALL,
+        "parameters": {
+            "parameters": {"qubo": qubo, "steps": 100},
+            "inputs": inputs or {},
+        },
+    }
+
+
+def test_large_parameters_are_passed_as_inputs(server, client):
+    qubo = [float(i) for i in range(500)]
+
+    run = ExperimentRun.create(
+        client=client,
+        experiment_id=server.experiment_id,
+        spill=ParameterSpill(project_id=server.project_id, threshold=1000),
+        **_spec(qubo),
+    )
+
+    parameters = run.data.metadata["parameters"]
+    storage_id = run.data.metadata["inputs"]["qubo"]["storage_id"]
+    assert "qubo" not in parameters
+    assert parameters["steps"] == 100
+    assert json.loads(server.uploads[storage_id]) == qubo
+
+
+def test_small_parameters_and_existing_inputs_are_kept(server, client):
+    spill = ParameterSpill(project_id=server.project_id, threshold=1000)
+
+    small = ExperimentRun.create(
+        client=client, experiment_id=server.experiment_id, spill=spill, **_spec([1.0])
+    )
+    with_input = ExperimentRun.create(
+        client=client,
+        experiment_id=server.experiment_id,
+        spill=spill,
+        **_spec([0.0] * 500, inputs={"qubo": {"storage_id": "id"}}),
+    )
+
+    assert list(small.data.metadata["parameters"]["qubo"]) == [1.0]
+    assert len(with_input.data.metadata["parameters"]["qubo"]) == 500
+    assert server.calls["CreateStorageFromFile"] == 0
+
+
+def test_equal_parameters_are_uploaded_once(server, client):
+    spill = ParameterSpill(project_id=server.project_id, threshold=1000)
+    specs = [{**_spec([0.5] * 500), "spill": spill} for _ in range(8)]
+
+    runs = ExperimentRun.create_many(
+        client=client, experiment_id=server.experiment_id, specs=specs
+    )
+    # another process finds the dataset by the hash of its content
+    other = ExperimentRun.create(
+        client=client,
+        experiment_id=server.experiment_id,
+        **{
+            **specs[0],
+            "spill": ParameterSpill(project_id=server.project_id, threshold=1000),
+        },
+    )
+
+    storage_ids = {
+        run.data.metadata["inputs"]["qubo"]["storage_id"] for run in runs + [other]
+    }
+    assert len(storage_ids) == 1
+    assert server.calls["CreateStorageFromFile"] == 1
+    assert len(server.uploads) == 1
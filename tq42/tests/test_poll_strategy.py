@@ -0,0 +1,127 @@
+import math
+import unittest
+from unittest import mock
+from unittest.mock import MagicMock
+
+from com.terraquantum.experiment.v1.experimentrun.experiment_run_pb2 import (
+    ExperimentRunStatusProto,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.experiment_run_pb2 import (
+    ExperimentRunProto,
+)
+
+from tq42.exceptions import ExceedRetriesError, PollTimeoutError
+from tq42.experiment_run import ExperimentRun, PollStrategy
+from tq42.utils.poll_strategy import Poller, resolve
+
+QUEUED = ExperimentRunStatusProto.QUEUED
+RUNNING = ExperimentRunStatusProto.RUNNING
+COMPLETED = ExperimentRunStatusProto.COMPLETED
+
+
+def _run(*statuses: int) -> ExperimentRun:
+    run = ExperimentRun(client=MagicMock(), id="id", data=ExperimentRunProto(id="id"))
+    run._get_data = MagicMock(
+        side_effect=[ExperimentRunProto(id="id", status=status) for status in statuses]
+    )
+    return run
+
+
+class TestPollStrategy(unittest.TestCase):
+    def test_delay_grows_up_to_the_maximum_of_the_status(self):
+        strategy = PollStrategy(
+            delay=1, backoff=2, jitter=0, max_delays={QUEUED: 5}, max_delay=3
+        )
+
+        self.assertEqual(
+            [strategy.delay_for(QUEUED, attempt) for attempt in range(5)],
+            [1, 2, 4, 5, 5],
+        )
+        self.assertEqual(strategy.delay_for(RUNNING, 4), 3)
+
+    def test_jitter_stays_within_its_share(self):
+        strategy = PollStrategy(delay=1, jitter=0.2)
+
+        for _ in range(100):
+            self.assertTrue(0.8 <= strategy.delay_for(RUNNING, 0) <= 1.2)
+
+    def test_delay_starts_over_when_the_status_changes(self):
+        poller = Poller(PollStrategy(delay=1, backoff=2, jitter=0, max_delays={}))
+
+        delays = [poller.next_delay(status) for status in (QUEUED, QUEUED, RUNNING)]
+
+        self.assertEqual(delays, [1, 2, 1])
+
+    def test_legacy_arguments_poll_like_before(self):
+        strategy = resolve(
+            None, tries=5, initial_delay=None, delay=2, backoff=None, timeout=None
+        )
+
+        self.assertEqual(strategy.max_tries, 5)
+        self.assertEqual(strategy.initial_delay, 1.0)
+        self.assertEqual(strategy.delay, 2)
+        self.assertEqual(strategy.backoff, 1.0)
+        self.assertEqual(strategy.jitter, 0)
+        self.assertEqual(strategy.max_delay, math.inf)
+
+    def test_default_gives_up_and_checks_running_runs_often(self):
+        strategy = PollStrategy(jitter=0)
+
+        self.assertEqual(strategy.timeout, 1000.0)
+        self.assertLessEqual(strategy.delay_for(RUNNING, 10), 2.0)
+        self.assertIsNone(PollStrategy.fixed().timeout)
+
+    def test_invalid_strategies_are_rejected(self):
+        with self.assertRaises(ValueError):
+            PollStrategy(backoff=0.5)
+        with self.assertRaises(ValueError):
+            PollStrategy(jitter=1)
+
+
+@mock.patch("tq42.experiment_run.time.sleep")
+class TestPoll(unittest.TestCase):
+    def test_checks_right_away_by_default(self, sleep_mock):
+        run = _run(COMPLETED)
+
+        run.poll()
+
+        sleep_mock.assert_called_once_with(0.0)
+        self.assertTrue(run.completed)
+
+    def test_queued_runs_are_checked_less_often(self, sleep_mock):
+        run = _run(*[QUEUED] * 20, COMPLETED)
+
+        run.poll(strategy=PollStrategy(jitter=0))
+
+        delays = [call.args[0] for call in sleep_mock.call_args_list[1:]]
+        self.assertEqual(max(delays), 20.0)
+        self.assertGreater(sum(delays), 200)
+
+    def test_legacy_tries_are_exceeded(self, sleep_mock):
+        run = _run(*[RUNNING] * 3)
+
+        with self.assertRaises(ExceedRetriesError) as cm:
+            run.poll(tries=3, initial_delay=0, delay=0)
+
+        self.assertEqual(cm.exception.tries, 3)
+        self.assertEqual(run._get_data.call_count, 3)
+
+    def test_stuck_runs_are_given_up_by_default(self, _):
+        run = _run(*[QUEUED] * 3)
+
+        with mock.patch(
+            "tq42.utils.poll_strategy.time.monotonic", side_effect=[0, 10, 20, 1001]
+        ), self.assertRaises(PollTimeoutError):
+            run.poll()
+
+    def test_timeout_is_measured_in_wall_time(self, _):
+        run = _run(*[RUNNING] * 3)
+
+        with mock.patch(
+            "tq42.utils.poll_strategy.time.monotonic", side_effect=[0, 1, 2, 11]
+        ), self.assertRaises(PollTimeoutError) as cm:
+            run.poll(timeout=10)
+
+        self.assertIsInstance(cm.exception, ExceedRetriesError)
+        self.assertIsInstance(cm.exception, TimeoutError)
+        self.assertEqual(cm.exception.tries, 2)
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest import mark
+
+from tq42.aio.experiment_run import ExperimentRun as AioExperimentRun
+from tq42.client import TQ42AsyncClient, TQ42Client
+from tq42.experiment_run import ExperimentRun, HardwareProto
+from tq42.testing import FakeServer
+from tq42.utils.rate_limit import RateLimit, RateLimiter
+
+_GET_RUN = "ExperimentRunService/GetExperimentRun"
+
+
+@pytest.fixture
+def server(server):
+    server.latency = 0.05
+    return server
+
+
+def _create_run(client, server: FakeServer):
+    return dict(
+        client=client,
+        algorithm="TOY",
+        version="0.1.0",
+        experiment_id=server.experiment_id,
+        compute=HardwareProto.SMALL,
+        parameters={"parameters": {"n": 1}, "inputs": {}},
+    )
+
+
+def test_unknown_service():
+    with pytest.raises(ValueError):
+        RateLimiter({"experiment_runs": RateLimit(calls_per_second=1)})
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        RateLimit(calls_per_second=0)
+    with pytest.raises(ValueError):
+        RateLimit(max_in_flight=0)
+
+
+def test_calls_per_second(server):
+    server.latency = 0
+    limits = {"experiment_run": RateLimit(calls_per_second=20, burst=1)}
+    with TQ42Client(rate_limits=limits) as client:
+        run = ExperimentRun.create(**_create_run(client, server))
+
+        start = time.perf_counter()
+        for _ in range(5):
+            run.check()
+
+        # the first call used up the burst, every further call waits 1/20s
+        assert time.perf_counter() - start >= 0.2
+        assert client.stats()[_GET_RUN].queue_wait_p95 >= 0.04
+        # services without a limit are not delayed
+        assert "ProjectService/GetProject" not in client.stats()
+
+
+def test_max_in_flight(server):
+    limits = {"experiment_run": RateLimit(max_in_flight=2)}
+    with TQ42Client(rate_limits=limits) as client:
+        run = ExperimentRun.create(**_create_run(client, server))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: run.check(), range(8)))
+
+        # 8 calls of 50ms, 2 at a time
+        assert time.perf_counter() - start >= 0.2
+        assert client.stats()[_GET_RUN].queue_wait_p99 >= 0.05
+
+
+@mark.asyncio
+async def test_max_in_flight_async(server):
+    limits = {"experiment_run": RateLimit(max_in_flight=2)}
+    async with TQ42AsyncClient(rate_limits=limits) as client:
+        run = await AioExperimentRun.create(**_create_run(client, server))
+
+        start = time.perf_counter()
+        await asyncio.gather(*[run.check() for _ in range(8)])
+
+        assert time.perf_counter() - start >= 0.2
+        assert client.stats()[_GET_RUN].calls == 8
+
+
+def test_max_in_flight_on_consecutive_event_loops(server):
+    limits = {"experiment_run": RateLimit(max_in_flight=2)}
+    with TQ42Client(rate_limits=limits) as client:
+        run = ExperimentRun.create(**_create_run(client, server))
+
+        async def check_concurrently():
+            await asyncio.gather(*[run.check_async() for _ in range(4)])
+
+        def check_twice():
+            asyncio.run(check_concurrently())
+            asyncio.run(check_concurrently())
+
+        # asyncio.run clears the event loop of its thread, so it runs in a thread that no other test uses
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(check_twice).result()
+
+        assert client.stats()[_GET_RUN].calls == 8
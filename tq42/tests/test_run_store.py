@@ -0,0 +1,142 @@
+import asyncio
+import multiprocessing
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import pytest
+from pytest import mark
+
+from com.terraquantum.experiment.v1.experimentrun.experiment_run_pb2 import (
+    ExperimentRunStatusProto,
+)
+from tq42.aio.experiment_run import ExperimentRun as AioExperimentRun
+from tq42.client import TQ42AsyncClient, TQ42Client
+from tq42.experiment_run import ExperimentRun, ExperimentRunProto, HardwareProto
+from tq42.testing import FakeServer
+from tq42.utils.run_store import RunStore
+
+
+def _run(id: str, size: int = 0) -> ExperimentRunProto:
+    return ExperimentRunProto(
+        id=id, status=ExperimentRunStatusProto.COMPLETED, error_message="x" * size
+    )
+
+
+def _put_runs(path: str, prefix: str) -> None:
+    store = RunStore(path=path)
+    for index in range(50):
+        store.put("host", _run(f"{prefix}-{index}"))
+
+
+def test_stored_runs_are_returned_per_host(tmp_path):
+    store = RunStore(path=str(tmp_path / "runs.sqlite3"))
+    store.put("host", _run("a"))
+
+    assert store.get("host", "a") == _run("a")
+    assert store.get("other-host", "a") is None
+    assert store.get("host", "b") is None
+
+
+def test_least_recently_used_runs_are_evicted(tmp_path):
+    store = RunStore(path=str(tmp_path / "runs.sqlite3"), max_size=3500)
+    with mock.patch("tq42.utils.run_store.time.time", side_effect=range(0, 1000, 100)):
+        for id in "abc":
+            store.put("host", _run(id, size=1000))
+        # reading "a" makes "b" the least recently used run
+        store.get("host", "a")
+        store.put("host", _run("d", size=1000))
+
+    assert [store.get("host", id) is not None for id in "abcd"] == [
+        True,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_processes_write_to_the_same_store(tmp_path):
+    path = str(tmp_path / "runs.sqlite3")
+    with ProcessPoolExecutor(
+        max_workers=4, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        list(executor.map(_put_runs, [path] * 4, ["p0", "p1", "p2", "p3"]))
+
+    store = RunStore(path=path)
+    assert all(
+        store.get("host", f"p{process}-{index}") is not None
+        for process in range(4)
+        for index in range(50)
+    )
+
+
+def test_unusable_store_falls_back_to_the_api(tmp_path):
+    store = RunStore(path=str(tmp_path))
+
+    store.put("host", _run("a"))
+    assert store.get("host", "a") is None
+
+
+@pytest.fixture
+def store_path(tmp_path) -> str:
+    return str(tmp_path / "runs.sqlite3")
+
+
+def _create_run(client: TQ42Client, server: FakeServer) -> ExperimentRun:
+    return ExperimentRun.create(
+        client=client,
+        algorithm="TOY",
+        version="0.1.0",
+        experiment_id=server.experiment_id,
+        compute=HardwareProto.SMALL,
+        parameters={"parameters": {"n": 1}, "inputs": {}},
+    )
+
+
+def test_finished_runs_are_loaded_from_the_store(server, store_path):
+    with TQ42Client(run_store=RunStore(path=store_path)) as client:
+        run_id = _create_run(client, server).poll(initial_delay=0).id
+    with TQ42Client(run_store=RunStore(path=store_path)) as client:
+        run = ExperimentRun(client=client, id=run_id)
+
+    assert run.data.status == ExperimentRunStatusProto.COMPLETED
+    assert run.result == {"parameters": {"n": 1.0}, "inputs": {}}
+    assert server.calls["GetExperimentRun"] == 1
+
+
+def test_unfinished_runs_are_not_stored(server, store_path):
+    server.run_duration = 60
+    with TQ42Client(run_store=RunStore(path=store_path)) as client:
+        run_id = _create_run(client, server).id
+        ExperimentRun(client=client, id=run_id)
+        ExperimentRun(client=client, id=run_id)
+
+    assert server.calls["GetExperimentRun"] == 2
+
+
+@mark.asyncio
+async def test_store_does_not_block_the_event_loop(server, store_path):
+    with TQ42Client() as client:
+        run_id = _create_run(client, server).poll(initial_delay=0).id
+
+    # another process writing to the store makes storing the run wait for the busy timeout
+    writer = sqlite3.connect(store_path, isolation_level=None)
+    RunStore(path=store_path).clear()
+    writer.execute("BEGIN IMMEDIATE")
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    async with TQ42AsyncClient(
+        run_store=RunStore(path=store_path, busy_timeout=0.5)
+    ) as client:
+        run = await AioExperimentRun.get(client=client, id=run_id)
+    ticker.cancel()
+    writer.close()
+
+    assert run.data.status == ExperimentRunStatusProto.COMPLETED
+    assert len(ticks) > 10
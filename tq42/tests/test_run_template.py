@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from google.protobuf import struct_pb2
+from google.protobuf.json_format import MessageToDict, ParseDict
+
+from tq42.experiment_run import HardwareProto, RunTemplate
+
+
+def _template(**parameters) -> RunTemplate:
+    return RunTemplate(
+        algorithm="TOY",
+        version="0.1.0",
+        compute=HardwareProto.SMALL,
+        parameters={
+            "parameters": {"qubo": np.eye(3), "steps": 100, **parameters},
+            "inputs": {},
+        },
+    )
+
+
+def test_overrides_replace_only_their_paths():
+    template = _template(options={"seed": 1, "tolerance": 0.1})
+
+    request = template.request(
+        experiment_id="experiment",
+        overrides={
+            "parameters.steps": 200,
+            "parameters.options.seed": [1, 2],
+            ("parameters", "dotted.key"): "value",
+        },
+    )
+
+    assert request.experiment_id == "experiment"
+    assert request.algorithm == "TOY"
+    assert MessageToDict(request.metadata)["parameters"] == {
+        "qubo": np.eye(3).tolist(),
+        "steps": 200,
+        "options": {"seed": [1, 2], "tolerance": 0.1},
+        "dotted.key": "value",
+    }
+
+
+def test_requests_do_not_change_the_template():
+    template = _template()
+
+    template.request(experiment_id="a", overrides={"parameters.qubo": {"a": 1}})
+    request = template.request(experiment_id="b")
+
+    assert request.metadata == ParseDict(
+        {"parameters": {"qubo": np.eye(3).tolist(), "steps": 100}, "inputs": {}},
+        struct_pb2.Struct(),
+    )
+
+
+def test_override_through_a_parameter_that_is_no_dict():
+    with pytest.raises(ValueError):
+        _template().request(experiment_id="a", overrides={"parameters.steps.x": 1})
+
+
+def test_create_many_from_template(server, client):
+    runs = _template().create_many(
+        client=client,
+        experiment_id=server.experiment_id,
+        overrides=[{"parameters.steps": steps} for steps in range(10)],
+        max_concurrency=4,
+    )
+
+    assert [run.data.metadata["parameters"]["steps"] for run in runs] == list(range(10))
+    assert all(len(run.data.metadata["parameters"]["qubo"]) == 3 for run in runs)
+    assert server.calls["CreateExperimentRun"] == 10
@@ -0,0 +1,70 @@
+from concurrent import futures
+
+import grpc
+import pytest
+
+from com.terraquantum.experiment.v3alpha2.experimentrun import (
+    experiment_run_service_pb2_grpc as pb2_exp_run_grpc,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.create_experiment_run_request_pb2 import (
+    CreateExperimentRunRequest,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.experiment_run_pb2 import (
+    ExperimentRunProto,
+)
+from com.terraquantum.experiment.v3alpha2.experimentrun.get_experiment_run_request_pb2 import (
+    GetExperimentRunRequest,
+)
+
+from tq42.client import _api_channel_options
+
+
+class _FlakyExperimentRunService(pb2_exp_run_grpc.ExperimentRunServiceServicer):
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.attempts = 0
+
+    def _respond(self, context):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            context.abort(grpc.StatusCode.UNAVAILABLE, "try again")
+        return ExperimentRunProto(id="run")
+
+    def GetExperimentRun(self, request, context):
+        return self._respond(context)
+
+    def CreateExperimentRun(self, request, context):
+        return self._respond(context)
+
+
+@pytest.fixture
+def flaky_service():
+    service = _FlakyExperimentRunService(failures=2)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    pb2_exp_run_grpc.add_ExperimentRunServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    with grpc.insecure_channel(
+        f"localhost:{port}", options=_api_channel_options
+    ) as channel:
+        yield service, pb2_exp_run_grpc.ExperimentRunServiceStub(channel)
+    server.stop(grace=None)
+
+
+def test_read_calls_are_retried_when_unavailable(flaky_service):
+    service, stub = flaky_service
+
+    res = stub.GetExperimentRun(GetExperimentRunRequest(experiment_run_id="run"))
+
+    assert res.id == "run"
+    assert service.attempts == 3
+
+
+def test_create_is_not_retried(flaky_service):
+    service, stub = flaky_service
+
+    with pytest.raises(grpc.RpcError) as e:
+        stub.CreateExperimentRun(CreateExperimentRunRequest())
+
+    assert e.value.code() == grpc.StatusCode.UNAVAILABLE
+    assert service.attempts == 1
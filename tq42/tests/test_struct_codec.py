@@ -0,0 +1,96 @@
+import math
+import unittest
+
+import numpy as np
+from google.protobuf import struct_pb2
+from google.protobuf.json_format import ParseDict, ParseError
+
+from tq42.utils.struct_codec import encode_struct, list_value_to_array
+
+
+class TestEncodeStruct(unittest.TestCase):
+    def assertEncodesLikeParseDict(self, value: dict):
+        self.assertEqual(encode_struct(value), ParseDict(value, struct_pb2.Struct()))
+
+    def test_plain_python_values(self):
+        self.assertEncodesLikeParseDict(
+            {
+                "parameters": {
+                    "n": 1,
+                    "r": 1.5,
+                    "msg": "text",
+                    "flag": True,
+                    "nothing": None,
+                    "x": [0.0, -1, 2**60, 3.5],
+                    "mixed": [1, "a", None, [2, 3], {"b": False}],
+                    "pair": (1, 2),
+                    "empty_list": [],
+                    "empty_dict": {},
+                },
+                "inputs": {},
+            }
+        )
+
+    def test_numpy_arrays(self):
+        qubo = np.random.default_rng(0).normal(size=(20, 20))
+        encoded = encode_struct(
+            {
+                "qubo": qubo,
+                "ints": np.arange(5, dtype=np.int32),
+                "cube": np.ones((2, 3, 4), dtype=np.uint8),
+                "empty": np.array([]),
+            }
+        )
+
+        self.assertEqual(
+            encoded,
+            ParseDict(
+                {
+                    "qubo": qubo.tolist(),
+                    "ints": list(range(5)),
+                    "cube": np.ones((2, 3, 4)).tolist(),
+                    "empty": [],
+                },
+                struct_pb2.Struct(),
+            ),
+        )
+        np.testing.assert_array_equal(
+            list_value_to_array(encoded.fields["qubo"].list_value), qubo
+        )
+
+    def test_numpy_scalars_and_other_dtypes(self):
+        encoded = encode_struct(
+            {
+                "f": np.float32(0.5),
+                "i": np.int64(3),
+                "b": np.bool_(True),
+                "zero_dim": np.array(2.0),
+                "flags": np.array([True, False]),
+                "labels": np.array(["a", "b"]),
+                "nan": np.array([math.nan]),
+            }
+        )
+
+        self.assertEqual(encoded.fields["f"].number_value, 0.5)
+        self.assertEqual(encoded.fields["i"].number_value, 3)
+        self.assertTrue(encoded.fields["b"].bool_value)
+        self.assertEqual(encoded.fields["zero_dim"].number_value, 2.0)
+        self.assertEqual(
+            [v.bool_value for v in encoded.fields["flags"].list_value.values],
+            [True, False],
+        )
+        self.assertEqual(
+            [v.string_value for v in encoded.fields["labels"].list_value.values],
+            ["a", "b"],
+        )
+        self.assertTrue(
+            math.isnan(encoded.fields["nan"].list_value.values[0].number_value)
+        )
+
+    def test_unsupported_values(self):
+        with self.assertRaises(ParseError):
+            encode_struct({"a": [object()]})
+        with self.assertRaises(ParseError):
+            encode_struct({"a": {1: 2}})
+        with self.assertRaises(ParseError):
+            encode_struct({"a": np.array([1j])})
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
 from google.protobuf.json_format import ParseDict
+import grpc
 from grpc import StatusCode
 from grpc._channel import _InactiveRpcError as InactiveRpcError, _RPCState as RPCState
 
@@ -8,7 +9,7 @@ from com.terraquantum.project.v2 import project_pb2 as proj_def
 from com.terraquantum.project.v2 import list_projects_pb2
 from com.terraquantum.organization.v2.organization import organization_pb2 as org_def
 
-from tq42.client import TQ42Client
+from tq42.client import TQ42Client, TransportOptions
 from tq42.organization import Organization
 from tq42.project import Project
 from tq42.exceptions import NoDefaultError, InvalidArgumentError
@@ -39,6 +40,74 @@ class TestAPI(unittest.TestCase):
         # Assert that the __exit__ method is called after exiting the context
         self.assertEqual(client.__exit__(None, None, None), None)
 
+    @patch("os.makedirs")
+    def test_client_creates_channels_on_first_use(self, makedirs_mock):
+        client = TQ42Client()
+        self.assertNotIn("_api_channel", client.__dict__)
+        self.assertNotIn("channels_channel", client.__dict__)
+        self.assertEqual(0, makedirs_mock.call_count)
+
+        self.assertIs(client.experiment_run_client, client.experiment_run_client)
+        self.assertIn("_api_channel", client.__dict__)
+        self.assertNotIn("channels_channel", client.__dict__)
+
+        self.assertIsNotNone(client.channel_client)
+        self.assertIn("channels_channel", client.__dict__)
+
+    def test_close_closes_channels(self):
+        client = TQ42Client()
+        api_channel = MagicMock()
+        client.__dict__["_api_channel"] = api_channel
+
+        with client:
+            self.assertIs(api_channel, client._api_channel)
+
+        api_channel.close.assert_called_once()
+        self.assertNotIn("_api_channel", client.__dict__)
+
+        # closing twice does nothing
+        client.close()
+        api_channel.close.assert_called_once()
+
+    def test_shared_transport(self):
+        try:
+            with TQ42Client(shared_transport=True) as first:
+                channel = first._api_channel
+            with TQ42Client(shared_transport=True) as second:
+                self.assertIs(channel, second._api_channel)
+
+            self.assertIsNot(channel, TQ42Client()._api_channel)
+            self.assertIsNot(
+                channel,
+                TQ42Client(shared_transport=True, channel_pool_size=2)._api_channel,
+            )
+        finally:
+            TQ42Client.close_shared_transports()
+
+        with TQ42Client(shared_transport=True) as third:
+            self.assertIsNot(channel, third._api_channel)
+        TQ42Client.close_shared_transports()
+
+    @patch("grpc.secure_channel")
+    def test_transport_options(self, secure_channel_mock):
+        options = TransportOptions(
+            max_receive_message_length=50_000_000,
+            max_send_message_length=20_000_000,
+            compression=grpc.Compression.Gzip,
+            keepalive_time_ms=30_000,
+        )
+        TQ42Client(transport_options=options)._api_channel
+
+        channel_options = dict(secure_channel_mock.call_args[1]["options"])
+        self.assertEqual(50_000_000, channel_options["grpc.max_receive_message_length"])
+        self.assertEqual(20_000_000, channel_options["grpc.max_send_message_length"])
+        self.assertEqual(30_000, channel_options["grpc.keepalive_time_ms"])
+        self.assertNotIn("grpc.keepalive_timeout_ms", channel_options)
+        self.assertEqual(1, channel_options["grpc.enable_retries"])
+        self.assertEqual(
+            grpc.Compression.Gzip, secure_channel_mock.call_args[1]["compression"]
+        )
+
     @patch("tq42.project.get_current_value")
     def test_proj_show_no_proj_set(self, get_current_value_mock):
         get_current_value_mock.side_effect = KeyError("key error")
@@ -1,5 +1,14 @@
+import base64
+import gc
+import json
 import os
+import threading
+import time
 import unittest
+import weakref
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -7,22 +16,59 @@ from unittest import mock
 
 from keyring.errors import InitError, NoKeyringError, PasswordSetError, KeyringLocked
 
-from tq42.client import TQ42Client
+from tq42.client import TQ42Client, _AccessTokenAuthPlugin
 from tq42.utils import dirs, file_handling
 from tq42.utils.environment import ConfigEnvironment
 from tq42.utils.misc import (
     save_token,
     get_token,
+    reset_token_backend,
+    token_backend,
 )
 from tq42.utils.token_manager import TokenManager
 
 
+def _jwt(expires_in: float) -> str:
+    claims = json.dumps({"exp": time.time() + expires_in}).encode()
+    payload = base64.urlsafe_b64encode(claims).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+def _access_token_in_process(config_dir: str, calls_file: str) -> str:
+    def post(*args, **kwargs):
+        with open(calls_file, "a") as file:
+            file.write("x")
+        time.sleep(0.5)
+        return mock.Mock(json=lambda: {"access_token": "fresh_token"})
+
+    def get(service_name, backup_save_path):
+        return file_handling.read_file(backup_save_path)
+
+    def save(service_name, backup_save_path, token):
+        file_handling.write_to_file(backup_save_path, token)
+
+    with mock.patch(
+        "tq42.utils.http.session", return_value=mock.Mock(post=post)
+    ), mock.patch("tq42.utils.token_manager.get_token", get), mock.patch(
+        "tq42.utils.token_manager.save_token", save
+    ):
+        token_manager = TokenManager(ConfigEnvironment.from_env())
+        token_manager._config_dir = config_dir
+        return token_manager.access_token
+
+
 class TestUtils(unittest.TestCase):
     def setUp(self):
+        reset_token_backend()
         self.client = TQ42Client()
 
-    @mock.patch("requests.post")
-    def test_renew_expiring_token(self, post_mock):
+    def tearDown(self):
+        reset_token_backend()
+
+    @mock.patch("tq42.utils.http.session")
+    def test_renew_expiring_token(self, session_mock):
+        post_mock = session_mock.return_value.post
+
         @dataclass
         class MockResponse:
             json_data: Any
@@ -60,6 +106,242 @@ class TestUtils(unittest.TestCase):
         # new token timestamp should NOT renew token
         self.assertFalse(success)
 
+    @mock.patch("tq42.utils.token_manager.get_token")
+    def test_metadata_is_served_from_memory(self, get_token_mock):
+        get_token_mock.return_value = "cached_token"
+        file_handling.write_to_file(self.client._timestamp_file_path, datetime.now())
+        client = TQ42Client()
+
+        metadata = client.metadata
+        for _ in range(99):
+            self.assertIs(metadata, client.metadata)
+
+        self.assertEqual(1, get_token_mock.call_count)
+        self.assertEqual((("authorization", "Bearer cached_token"),), metadata)
+        self.assertEqual(99, client.token_cache_stats.hits)
+        self.assertEqual(1, client.token_cache_stats.misses)
+        self.assertAlmostEqual(0.99, client.token_cache_stats.hit_rate)
+
+        # a new token results in new metadata
+        client._token_manager.invalidate()
+        get_token_mock.return_value = "new_token"
+        self.assertEqual((("authorization", "Bearer new_token"),), client.metadata)
+
+    @mock.patch("tq42.utils.token_manager.save_token")
+    @mock.patch("tq42.utils.token_manager.get_token")
+    @mock.patch("tq42.utils.http.session")
+    def test_concurrent_renew_requests_a_single_token(
+        self, session_mock, get_token_mock, save_token_mock
+    ):
+        post_mock = session_mock.return_value.post
+
+        def slow_post(*args, **kwargs):
+            time.sleep(0.1)
+            return mock.Mock(json=lambda: {"access_token": "fresh_token"})
+
+        post_mock.side_effect = slow_post
+        get_token_mock.return_value = "refresh_token"
+
+        # force expire timestamp
+        file_handling.write_to_file(
+            self.client._timestamp_file_path, "2022-07-21 13:48:26.580403"
+        )
+        token_manager = TokenManager(ConfigEnvironment.from_env())
+
+        barrier = threading.Barrier(64)
+
+        def access_token(_):
+            barrier.wait()
+            return token_manager.access_token
+
+        with ThreadPoolExecutor(max_workers=64) as executor:
+            tokens = list(executor.map(access_token, range(64)))
+
+        self.assertEqual(1, post_mock.call_count)
+        self.assertEqual(["fresh_token"] * 64, tokens)
+
+    @mock.patch("tq42.utils.token_manager.save_token")
+    @mock.patch("tq42.utils.token_manager.get_token")
+    @mock.patch("tq42.utils.http.session")
+    def test_jwt_expiry_decides_about_renewal(
+        self, session_mock, get_token_mock, save_token_mock
+    ):
+        post_mock = session_mock.return_value.post
+
+        def slow_post(*args, **kwargs):
+            time.sleep(0.2)
+            return mock.Mock(json=lambda: {"access_token": "fresh_token"})
+
+        post_mock.side_effect = slow_post
+
+        # a valid token is used regardless of the age of the timestamp file
+        get_token_mock.return_value = valid_token = _jwt(expires_in=3600)
+        file_handling.write_to_file(
+            self.client._timestamp_file_path, "2022-07-21 13:48:26.580403"
+        )
+        token_manager = TokenManager(ConfigEnvironment.from_env())
+        self.assertEqual(valid_token, token_manager.access_token)
+        self.assertEqual(0, post_mock.call_count)
+        token_manager.close()
+
+        # a token that expires soon is still served while a new one is requested in the background
+        get_token_mock.return_value = expiring_token = _jwt(expires_in=300)
+        token_manager = TokenManager(ConfigEnvironment.from_env())
+        start = time.perf_counter()
+        self.assertEqual(expiring_token, token_manager.access_token)
+        self.assertLess(time.perf_counter() - start, 0.2)
+        self.assertEqual(expiring_token, token_manager.access_token)
+        token_manager._background_refresh.join()
+        self.assertEqual(1, post_mock.call_count)
+        self.assertEqual("fresh_token", token_manager.access_token)
+
+        # an expired token has to be replaced before it can be used
+        get_token_mock.return_value = _jwt(expires_in=-60)
+        token_manager = TokenManager(ConfigEnvironment.from_env())
+        self.assertEqual("fresh_token", token_manager.access_token)
+        self.assertEqual(2, post_mock.call_count)
+
+    @mock.patch("tq42.utils.token_manager.save_token")
+    @mock.patch("tq42.utils.token_manager.get_token")
+    @mock.patch("tq42.utils.http.session")
+    def test_renewal_is_scheduled_ahead_of_expiry(
+        self, session_mock, get_token_mock, save_token_mock
+    ):
+        post_mock = session_mock.return_value.post
+        post_mock.return_value = mock.Mock(json=lambda: {"access_token": "fresh_token"})
+        # the renewal is due 0.1s from now
+        get_token_mock.return_value = _jwt(expires_in=600.1)
+        token_manager = TokenManager(ConfigEnvironment.from_env())
+        token_manager.access_token
+
+        for _ in range(50):
+            if post_mock.call_count:
+                break
+            time.sleep(0.02)
+        token_manager._background_refresh.join()
+
+        self.assertEqual(1, post_mock.call_count)
+        self.assertEqual("fresh_token", token_manager._access_token)
+
+    @mock.patch("tq42.utils.token_manager.get_token")
+    def test_token_cache_stats_count_concurrent_reads(self, get_token_mock):
+        get_token_mock.return_value = "cached_token"
+        file_handling.write_to_file(self.client._timestamp_file_path, datetime.now())
+        client = TQ42Client()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in executor.map(lambda _: client.metadata, range(4000)):
+                pass
+
+        stats = client.token_cache_stats
+        self.assertEqual(4000, stats.hits + stats.misses)
+
+    @mock.patch("tq42.utils.token_manager.save_token")
+    @mock.patch("tq42.utils.token_manager.get_token")
+    @mock.patch("tq42.utils.http.session")
+    def test_failed_renewal_backs_off(
+        self, session_mock, get_token_mock, save_token_mock
+    ):
+        post_mock = session_mock.return_value.post
+        post_mock.return_value = mock.Mock(
+            json=lambda: {"error": "invalid_grant", "error_description": "expired"}
+        )
+        get_token_mock.return_value = expiring_token = _jwt(expires_in=300)
+        token_manager = TokenManager(ConfigEnvironment.from_env())
+
+        self.assertFalse(token_manager.renew_expiring_token(ahead=600))
+        for _ in range(20):
+            self.assertEqual(expiring_token, token_manager.access_token)
+        self.assertFalse(token_manager.renew_expiring_token(ahead=600))
+
+        self.assertEqual(1, post_mock.call_count)
+        save_token_mock.assert_not_called()
+
+        # a new login asks the auth server again
+        token_manager.invalidate()
+        self.assertEqual(expiring_token, token_manager.access_token)
+        token_manager._background_refresh.join()
+        self.assertEqual(2, post_mock.call_count)
+
+    @mock.patch("tq42.utils.token_manager.get_token")
+    def test_scheduled_renewals_share_one_thread(self, get_token_mock):
+        get_token_mock.return_value = _jwt(expires_in=86400)
+        threads = threading.active_count()
+
+        managers = [TokenManager(ConfigEnvironment.from_env()) for _ in range(300)]
+        for token_manager in managers:
+            token_manager.access_token
+        self.assertLessEqual(threading.active_count(), threads + 1)
+
+        # managers that are no longer used are not kept alive by their scheduled renewal
+        reference = weakref.ref(managers[0])
+        del managers, token_manager
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_processes_share_a_single_renewal(self):
+        with tempfile.TemporaryDirectory() as config_dir:
+            calls_file = os.path.join(config_dir, "calls")
+            token_manager = TokenManager(ConfigEnvironment.from_env())
+            token_manager._config_dir = config_dir
+            file_handling.write_to_file(token_manager.token_file_path, "old_token")
+            file_handling.write_to_file(
+                token_manager.timestamp_file_path, "2022-07-21 13:48:26.580403"
+            )
+
+            with ProcessPoolExecutor(
+                max_workers=4, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                tokens = list(
+                    executor.map(
+                        _access_token_in_process, [config_dir] * 4, [calls_file] * 4
+                    )
+                )
+
+            self.assertEqual(["fresh_token"] * 4, tokens)
+            self.assertEqual("x", file_handling.read_file(calls_file))
+            self.assertEqual(
+                "fresh_token", file_handling.read_file(token_manager.token_file_path)
+            )
+            # the temporary files of the atomic writes are gone
+            self.assertEqual(
+                ["calls", "timestamp", "token", "token.lock"],
+                sorted(os.listdir(config_dir)),
+            )
+
+    def test_auth_plugin_attaches_metadata(self):
+        self.client._token_manager._access_token = "token"
+        self.client._token_manager._token_timestamp_loaded = True
+        callback = mock.Mock()
+
+        _AccessTokenAuthPlugin(self.client._token_manager)(
+            context=None, callback=callback
+        )
+
+        callback.assert_called_once_with((("authorization", "Bearer token"),), None)
+
+    @mock.patch("tq42.utils.token_manager.get_token")
+    def test_shared_transport_does_not_depend_on_its_first_client(self, get_token_mock):
+        get_token_mock.return_value = token = _jwt(expires_in=3600)
+        first = TQ42Client(shared_transport=True)
+        channel = first._api_channel
+        first.metadata
+        first.close()
+        first_ref = weakref.ref(first)
+        del first
+        gc.collect()
+
+        second = TQ42Client(shared_transport=True)
+        try:
+            self.assertIs(channel, second._api_channel)
+            self.assertIsNone(first_ref())
+            # closing the first client did not cancel the renewal of the shared token
+            self.assertIsNotNone(second._token_manager._scheduled_refresh)
+            self.assertEqual((("authorization", "Bearer " + token),), second.metadata)
+        finally:
+            second._token_manager.invalidate()
+            TQ42Client.close_shared_transports()
+
     def test_save_get_token_with_keyring_enabled(self):
         # keyring is working on Mac Sonoma 14.4 and Windows 11
         token_file_path = os.path.join(dirs.testdata(), "keyring_test.json")
@@ -131,3 +413,28 @@ class TestUtils(unittest.TestCase):
         )
         os.remove(token_file_path)
         self.assertEqual(token, "test_token")
+
+    @mock.patch("keyring.get_password")
+    def test_unavailable_keyring_is_only_probed_once(self, mock_get_password):
+        token_file_path = os.path.join(dirs.testdata(), "keyring_test.json")
+        file_handling.write_to_file(token_file_path, "test_token")
+        mock_get_password.side_effect = NoKeyringError()
+
+        for _ in range(10):
+            token = get_token(
+                service_name="tq42_access_token", backup_save_path=token_file_path
+            )
+            self.assertEqual(token, "test_token")
+
+        os.remove(token_file_path)
+        self.assertEqual(1, mock_get_password.call_count)
+        self.assertEqual("file", token_backend())
+
+    @mock.patch("keyring.get_password")
+    def test_working_keyring_is_remembered(self, mock_get_password):
+        mock_get_password.return_value = "keyring_token"
+
+        token = get_token(service_name="tq42_access_token", backup_save_path="")
+
+        self.assertEqual(token, "keyring_token")
+        self.assertEqual("keyring", token_backend())
@@ -0,0 +1,287 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Dict, Iterable, Optional, Union
+
+import grpc
+from grpc import aio
+
+# latencies are counted in buckets growing by ~19% from 0.1ms, the last bucket holds everything above ~55min
+_BUCKET_BASE = 1e-4
+_BUCKET_GROWTH = 2**0.25
+_BUCKET_COUNT = 100
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    """
+    A single finished call.
+    """
+
+    method: str
+    """Service and method of the call, e.g. `ExperimentRunService/GetExperimentRun`"""
+    duration: float
+    """Seconds from starting the call until its response or error arrived"""
+    code: grpc.StatusCode
+    """Status the call finished with"""
+    request_bytes: int
+    """Serialized size of the request"""
+    response_bytes: int
+    """Serialized size of the response, 0 if the call failed"""
+
+
+@dataclass(frozen=True)
+class MethodStats:
+    """
+    Statistics of all calls of a single method.
+    """
+
+    calls: int
+    """Number of finished calls"""
+    errors: int
+    """Number of calls that did not finish with OK"""
+    p50: float
+    """Median latency in seconds"""
+    p95: float
+    """95th percentile of the latency in seconds"""
+    p99: float
+    """99th percentile of the latency in seconds"""
+    max: float
+    """Highest latency in seconds"""
+    request_bytes: int
+    """Total serialized size of all requests"""
+    response_bytes: int
+    """Total serialized size of all responses"""
+    status_codes: Dict[str, int] = field(default_factory=dict)
+    """Number of calls per status code name"""
+    queue_wait_p50: float = 0.0
+    """Median time in seconds calls waited for the rate limit of their service"""
+    queue_wait_p95: float = 0.0
+    """95th percentile of the time in seconds calls waited for the rate limit of their service"""
+    queue_wait_p99: float = 0.0
+    """99th percentile of the time in seconds calls waited for the rate limit of their service"""
+
+
+CallStatsSink = Callable[[CallRecord], None]
+
+
+class _LatencyHistogram:
+    def __init__(self):
+        self._counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        if seconds <= _BUCKET_BASE:
+            index = 0
+        else:
+            index = min(
+                _BUCKET_COUNT - 1,
+                math.ceil(math.log(seconds / _BUCKET_BASE, _BUCKET_GROWTH)),
+            )
+        self._counts[index] += 1
+        self.count += 1
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper bound of the bucket the `q`-th share of the calls falls into.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(q * self.count))
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(_BUCKET_BASE * _BUCKET_GROWTH**index, self.max)
+        return self.max
+
+
+class _MethodAccumulator:
+    def __init__(self):
+        self.latency = _LatencyHistogram()
+        self.queue_wait = _LatencyHistogram()
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status_codes: Dict[str, int] = {}
+
+    def add(self, record: CallRecord) -> None:
+        self.latency.add(record.duration)
+        if record.code != grpc.StatusCode.OK:
+            self.errors += 1
+        self.request_bytes += record.request_bytes
+        self.response_bytes += record.response_bytes
+        self.status_codes[record.code.name] = (
+            self.status_codes.get(record.code.name, 0) + 1
+        )
+
+    def snapshot(self) -> MethodStats:
+        return MethodStats(
+            calls=self.latency.count,
+            errors=self.errors,
+            p50=self.latency.percentile(0.5),
+            p95=self.latency.percentile(0.95),
+            p99=self.latency.percentile(0.99),
+            max=self.latency.max,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            status_codes=dict(self.status_codes),
+            queue_wait_p50=self.queue_wait.percentile(0.5),
+            queue_wait_p95=self.queue_wait.percentile(0.95),
+            queue_wait_p99=self.queue_wait.percentile(0.99),
+        )
+
+
+class CallStats:
+    """
+    Collects latency, payload size and status of the unary calls of a client.
+
+    :param sinks: callables that additionally receive every :py:class:`CallRecord`, e.g. to export it to a metrics system
+    :param slow_call_threshold: calls taking at least this many seconds are logged as a warning (default: off)
+    """
+
+    def __init__(
+        self,
+        sinks: Optional[Iterable[CallStatsSink]] = None,
+        slow_call_threshold: Optional[float] = None,
+    ):
+        self.sinks = list(sinks or [])
+        self.slow_call_threshold = slow_call_threshold
+        self._lock = threading.Lock()
+        self._methods: Dict[str, _MethodAccumulator] = {}
+
+    def _accumulator(self, method: str) -> _MethodAccumulator:
+        accumulator = self._methods.get(method)
+        if accumulator is None:
+            accumulator = self._methods[method] = _MethodAccumulator()
+        return accumulator
+
+    def record(self, record: CallRecord) -> None:
+        with self._lock:
+            self._accumulator(record.method).add(record)
+
+        if (
+            self.slow_call_threshold is not None
+            and record.duration >= self.slow_call_threshold
+        ):
+            logging.warning(
+                f"Slow call {record.method} took {record.duration:.3f}s ({record.code.name})"
+            )
+
+        for sink in self.sinks:
+            try:
+                sink(record)
+            except Exception:
+                logging.exception(f"Call stats sink {sink} failed")
+
+    def record_queue_wait(self, method: str, seconds: float) -> None:
+        """
+        Records the time a call of `method` waited for the rate limit of its service before it was started.
+        """
+        with self._lock:
+            self._accumulator(method).queue_wait.add(seconds)
+
+    def snapshot(self) -> Dict[str, MethodStats]:
+        """
+        Statistics per method of all calls recorded so far.
+        """
+        with self._lock:
+            return {
+                method: accumulator.snapshot()
+                for method, accumulator in self._methods.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
+
+
+def method_name(method: Union[str, bytes]) -> str:
+    # `/com.terraquantum.project.v2.ProjectService/GetProject` -> `ProjectService/GetProject`
+    if isinstance(method, bytes):
+        method = method.decode()
+    service, _, name = method.strip("/").rpartition("/")
+    return f"{service.rpartition('.')[2]}/{name}"
+
+
+class StatsInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """
+    Records every unary call of a sync channel in a :py:class:`CallStats`.
+    """
+
+    def __init__(self, stats: CallStats):
+        self._stats = stats
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        start = time.perf_counter()
+        request_bytes = request.ByteSize()
+        call = continuation(client_call_details, request)
+        # blocking calls are already done here, futures report once they are
+        call.add_done_callback(
+            partial(
+                self._record,
+                method_name(client_call_details.method),
+                start,
+                request_bytes,
+            )
+        )
+        return call
+
+    def _record(self, method: str, start: float, request_bytes: int, call) -> None:
+        duration = time.perf_counter() - start
+        code = call.code()
+        response_bytes = call.result().ByteSize() if code == grpc.StatusCode.OK else 0
+        self._stats.record(
+            CallRecord(
+                method=method,
+                duration=duration,
+                code=code,
+                request_bytes=request_bytes,
+                response_bytes=response_bytes,
+            )
+        )
+
+
+class AioStatsInterceptor(aio.UnaryUnaryClientInterceptor):
+    """
+    Records every unary call of an aio channel in a :py:class:`CallStats`.
+    """
+
+    def __init__(self, stats: CallStats):
+        self._stats = stats
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = method_name(client_call_details.method)
+        start = time.perf_counter()
+        request_bytes = request.ByteSize()
+        call = await continuation(client_call_details, request)
+
+        code, response_bytes = grpc.StatusCode.OK, 0
+        try:
+            response = await call
+            response_bytes = response.ByteSize()
+        except aio.AioRpcError as e:
+            code = e.code()
+        except asyncio.CancelledError:
+            code = grpc.StatusCode.CANCELLED
+            raise
+        finally:
+            self._stats.record(
+                CallRecord(
+                    method=method,
+                    duration=time.perf_counter() - start,
+                    code=code,
+                    request_bytes=request_bytes,
+                    response_bytes=response_bytes,
+                )
+            )
+
+        # the call is done, awaiting it again returns the response or raises the error
+        return call
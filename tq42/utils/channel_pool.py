@@ -0,0 +1,301 @@
+import itertools
+import threading
+from enum import Enum
+from typing import Callable, List, Optional
+
+import grpc
+from grpc import aio
+
+
+class ChannelSelection(str, Enum):
+    """
+    How a channel pool picks the channel for the next call.
+    """
+
+    ROUND_ROBIN = "round_robin"
+    """Use the channels one after another"""
+    LEAST_LOADED = "least_loaded"
+    """Use the channel with the fewest calls in flight"""
+
+
+# channels with identical arguments share their connection by default, a local subchannel pool gives each
+# channel in the pool a connection of its own
+POOLED_CHANNEL_OPTIONS = [("grpc.use_local_subchannel_pool", 1)]
+
+
+class _ChannelSelector:
+    """
+    Picks channel indices and keeps track of the number of calls in flight on each channel.
+    """
+
+    def __init__(self, size: int, selection: ChannelSelection):
+        if size < 1:
+            raise ValueError(f"A channel pool needs at least one channel, got {size}")
+
+        self._size = size
+        self._selection = ChannelSelection(selection)
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self.in_flight: List[int] = [0] * size
+
+    def acquire(self) -> int:
+        with self._lock:
+            if self._selection == ChannelSelection.LEAST_LOADED:
+                index = min(range(self._size), key=self.in_flight.__getitem__)
+            else:
+                index = next(self._counter) % self._size
+            self.in_flight[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self.in_flight[index] -= 1
+
+
+class _PooledUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(
+        self,
+        selector: _ChannelSelector,
+        callables: List[grpc.UnaryUnaryMultiCallable],
+    ):
+        self._selector = selector
+        self._callables = callables
+
+    def __call__(self, request, *args, **kwargs):
+        index = self._selector.acquire()
+        try:
+            return self._callables[index](request, *args, **kwargs)
+        finally:
+            self._selector.release(index)
+
+    def with_call(self, request, *args, **kwargs):
+        index = self._selector.acquire()
+        try:
+            return self._callables[index].with_call(request, *args, **kwargs)
+        finally:
+            self._selector.release(index)
+
+    def future(self, request, *args, **kwargs):
+        index = self._selector.acquire()
+        try:
+            future = self._callables[index].future(request, *args, **kwargs)
+        except Exception:
+            self._selector.release(index)
+            raise
+
+        future.add_done_callback(lambda _: self._selector.release(index))
+        return future
+
+
+class _PooledStreamingMultiCallable:
+    """
+    Streaming calls are bound to a single channel for their whole lifetime, so they are only distributed.
+    """
+
+    def __init__(self, selector: _ChannelSelector, callables: list):
+        self._selector = selector
+        self._callables = callables
+
+    def _pick(self):
+        index = self._selector.acquire()
+        self._selector.release(index)
+        return self._callables[index]
+
+    def __call__(self, *args, **kwargs):
+        return self._pick()(*args, **kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self._pick().with_call(*args, **kwargs)
+
+    def future(self, *args, **kwargs):
+        return self._pick().future(*args, **kwargs)
+
+
+class ChannelPool(grpc.Channel):
+    """
+    A group of channels to the same target that can be used like a single channel.
+    Every channel has its own HTTP/2 connection, so the number of concurrent calls is no longer capped by the
+    maximum number of concurrent streams of a single connection.
+
+    :param channel_factory: creates a new channel, it is called `size` times
+    :param size: number of channels in the pool
+    :param selection: how the channel for a call is picked
+    """
+
+    def __init__(
+        self,
+        channel_factory: Callable[[], grpc.Channel],
+        size: int,
+        selection: ChannelSelection = ChannelSelection.ROUND_ROBIN,
+    ):
+        self._selector = _ChannelSelector(size=size, selection=selection)
+        self.channels: List[grpc.Channel] = [channel_factory() for _ in range(size)]
+
+    @property
+    def in_flight(self) -> List[int]:
+        """
+        Number of unary calls currently in flight on each channel.
+        """
+        return list(self._selector.in_flight)
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self.channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self.channels:
+            channel.unsubscribe(callback)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _PooledUnaryUnaryMultiCallable(
+            self._selector,
+            [channel.unary_unary(method, *args, **kwargs) for channel in self.channels],
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return _PooledStreamingMultiCallable(
+            self._selector,
+            [
+                channel.unary_stream(method, *args, **kwargs)
+                for channel in self.channels
+            ],
+        )
+
+    def stream_unary(self, method, *args, **kwargs):
+        return _PooledStreamingMultiCallable(
+            self._selector,
+            [
+                channel.stream_unary(method, *args, **kwargs)
+                for channel in self.channels
+            ],
+        )
+
+    def stream_stream(self, method, *args, **kwargs):
+        return _PooledStreamingMultiCallable(
+            self._selector,
+            [
+                channel.stream_stream(method, *args, **kwargs)
+                for channel in self.channels
+            ],
+        )
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _AioPooledUnaryUnaryMultiCallable(aio.UnaryUnaryMultiCallable):
+    def __init__(
+        self,
+        selector: _ChannelSelector,
+        callables: List[aio.UnaryUnaryMultiCallable],
+    ):
+        self._selector = selector
+        self._callables = callables
+
+    def __call__(self, request, *args, **kwargs):
+        index = self._selector.acquire()
+        try:
+            call = self._callables[index](request, *args, **kwargs)
+        except Exception:
+            self._selector.release(index)
+            raise
+
+        call.add_done_callback(lambda _: self._selector.release(index))
+        return call
+
+
+class AioChannelPool(aio.Channel):
+    """
+    The `grpc.aio` counterpart of :py:class:`ChannelPool`.
+
+    :param channel_factory: creates a new aio channel, it is called `size` times
+    :param size: number of channels in the pool
+    :param selection: how the channel for a call is picked
+    """
+
+    def __init__(
+        self,
+        channel_factory: Callable[[], aio.Channel],
+        size: int,
+        selection: ChannelSelection = ChannelSelection.ROUND_ROBIN,
+    ):
+        self._selector = _ChannelSelector(size=size, selection=selection)
+        self.channels: List[aio.Channel] = [channel_factory() for _ in range(size)]
+
+    @property
+    def in_flight(self) -> List[int]:
+        """
+        Number of unary calls currently in flight on each channel.
+        """
+        return list(self._selector.in_flight)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _AioPooledUnaryUnaryMultiCallable(
+            self._selector,
+            [channel.unary_unary(method, *args, **kwargs) for channel in self.channels],
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return _PooledStreamingMultiCallable(
+            self._selector,
+            [
+                channel.unary_stream(method, *args, **kwargs)
+                for channel in self.channels
+            ],
+        )
+
+    def stream_unary(self, method, *args, **kwargs):
+        return _PooledStreamingMultiCallable(
+            self._selector,
+            [
+                channel.stream_unary(method, *args, **kwargs)
+                for channel in self.channels
+            ],
+        )
+
+    def stream_stream(self, method, *args, **kwargs):
+        return _PooledStreamingMultiCallable(
+            self._selector,
+            [
+                channel.stream_stream(method, *args, **kwargs)
+                for channel in self.channels
+            ],
+        )
+
+    async def close(self, grace: Optional[float] = None):
+        for channel in self.channels:
+            await channel.close(grace)
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        # the pool is as ready as its best connected channel
+        states = [channel.get_state(try_to_connect) for channel in self.channels]
+        for state in (
+            grpc.ChannelConnectivity.READY,
+            grpc.ChannelConnectivity.CONNECTING,
+            grpc.ChannelConnectivity.IDLE,
+            grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+        ):
+            if state in states:
+                return state
+        return states[0]
+
+    async def wait_for_state_change(self, last_observed_state):
+        await self.channels[0].wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        for channel in self.channels:
+            await channel.channel_ready()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
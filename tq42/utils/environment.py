@@ -29,13 +29,22 @@ class ConfigEnvironment:
     base_url: str
     client_id: str
     scope: str
+    local_address: Optional[str] = None
+    """
+    `host:port` of a server on this machine, e.g. :py:class:`tq42.testing.FakeServer`.
+    If set, the API and the channels are reached there over plaintext instead of TLS.
+    """
 
     @property
     def api_host(self):
+        if self.local_address:
+            return self.local_address
         return "api.{}".format(self.base_url)
 
     @property
     def channels_host(self):
+        if self.local_address:
+            return self.local_address
         return f"channels.{self.base_url}"
 
     @property
@@ -95,8 +104,14 @@ class ConfigEnvironment:
         base_url = os.getenv("TQ42_BASE_URL", _DEFAULT_BASE_URL)
         client_id = os.getenv("TQ42_CLIENT_ID", _DEFAULT_CLIENT_ID)
         scope = os.getenv("TQ42_SCOPE", _DEFAULT_SCOPE)
-
-        return ConfigEnvironment(base_url=base_url, client_id=client_id, scope=scope)
+        local_address = os.getenv("TQ42_LOCAL_ADDRESS")
+
+        return ConfigEnvironment(
+            base_url=base_url,
+            client_id=client_id,
+            scope=scope,
+            local_address=local_address,
+        )
 
 
 def get_environment() -> str:
@@ -1,3 +1,4 @@
+import inspect
 import logging
 import traceback
 
@@ -13,32 +14,42 @@ from typing import Any, Callable, TypeVar, cast
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def _raise_for_rpc_status(e) -> None:
+    """
+    Translates the status code of a failed RPC into the matching SDK exception.
+    Returns without raising if the status code has no SDK specific exception.
+    """
+    status_code = e.code()
+    if status_code == StatusCode.PERMISSION_DENIED:
+        raise exceptions.PermissionDeniedError() from None
+
+    if status_code == StatusCode.UNAUTHENTICATED:
+        raise exceptions.UnauthenticatedError() from None
+
+    if status_code in [
+        StatusCode.INVALID_ARGUMENT,
+        StatusCode.NOT_FOUND,
+        StatusCode.UNKNOWN,
+    ]:
+        # offending command will be third from the last
+        # last lines are: traceback.extract_stack() and the calling decorator
+        index = -3 if len(traceback.extract_stack()) > 2 else 0
+        raise exceptions.InvalidArgumentError(
+            command=traceback.extract_stack()[index].line, details=e.details()
+        ) from None
+
+
 def handle_generic_sdk_errors(func: F) -> F:
+    if inspect.iscoroutinefunction(func):
+        return _handle_generic_sdk_errors_async(func)
+
     @wraps(func)
     def wrapped(*args, **kwargs):
         try:
             return func(*args, **kwargs)
 
         except InactiveRpcError as e:
-            status_code = e.code()
-            if status_code == StatusCode.PERMISSION_DENIED:
-                raise exceptions.PermissionDeniedError() from None
-
-            if status_code == StatusCode.UNAUTHENTICATED:
-                raise exceptions.UnauthenticatedError() from None
-
-            if status_code in [
-                StatusCode.INVALID_ARGUMENT,
-                StatusCode.NOT_FOUND,
-                StatusCode.UNKNOWN,
-            ]:
-                # offending command will be second from the last
-                # last line is: traceback.extract_stack()
-                index = -2 if len(traceback.extract_stack()) > 1 else 0
-                raise exceptions.InvalidArgumentError(
-                    command=traceback.extract_stack()[index].line, details=e.details()
-                ) from None
-
+            _raise_for_rpc_status(e)
             raise e
         except AioRpcError:
             raise ConnectionError(
@@ -71,3 +82,40 @@ def handle_generic_sdk_errors(func: F) -> F:
             raise e
 
     return cast(F, wrapped)
+
+
+def _handle_generic_sdk_errors_async(func: F) -> F:
+    """
+    Coroutine counterpart of `handle_generic_sdk_errors`.
+    Unary calls on `grpc.aio` channels fail with `AioRpcError`, which is translated like `InactiveRpcError`.
+    """
+
+    @wraps(func)
+    async def wrapped(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+
+        except AioRpcError as e:
+            _raise_for_rpc_status(e)
+            raise e
+        except KeyError:
+            raise exceptions.NoDefaultError(
+                command=traceback.extract_stack()[0].line
+            ) from None
+        except (
+            exceptions.AuthenticationError,
+            exceptions.PermissionDeniedError,
+            exceptions.UnauthenticatedError,
+            exceptions.InvalidArgumentError,
+            exceptions.NoDefaultError,
+            exceptions.ExceedRetriesError,
+            exceptions.ExperimentRunCancelError,
+        ) as e:
+            raise e from None
+        except Exception as e:
+            logging.debug(
+                "Error {} is raised in SDK and not specifically handled".format(e)
+            )
+            raise e
+
+    return cast(F, wrapped)
@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 
 def read_file(file: str) -> str:
@@ -14,5 +15,22 @@ def read_file(file: str) -> str:
 
 def write_to_file(filepath, content):
     content = str(content)
-    with open(filepath, "w") as file:
-        file.write(content)
+    # the config directory is only created once something is written to it
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # the content is written to a temporary file that replaces the target in one step,
+    # so other processes read either the old or the new content but never a partially written file
+    fd, temporary_path = tempfile.mkstemp(
+        dir=directory or None, prefix=f".{os.path.basename(filepath)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, filepath)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
@@ -0,0 +1,81 @@
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# transient server errors and rate limiting are retried, other errors are returned to the caller
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+@dataclass(frozen=True)
+class HttpOptions:
+    """
+    Settings of the HTTP connections used for authentication and for transferring files from and to datasets.
+
+    :param pool_maxsize: connections kept open per host
+    :param connect_timeout: seconds to wait for a connection
+    :param read_timeout: seconds to wait for data from the server
+    :param retries: attempts after a failed connection or a transient server error. POST requests are only retried if
+        the connection could not be established.
+    :param backoff_factor: retries wait `backoff_factor * 2 ** (retry - 1)` seconds
+    """
+
+    pool_maxsize: int = 10
+    connect_timeout: float = 10.0
+    read_timeout: float = 60.0
+    retries: int = 3
+    backoff_factor: float = 0.5
+
+
+class _Session(requests.Session):
+    def __init__(self, options: HttpOptions):
+        super().__init__()
+        self._timeout = (options.connect_timeout, options.read_timeout)
+
+        adapter = HTTPAdapter(
+            pool_maxsize=options.pool_maxsize,
+            max_retries=Retry(
+                total=options.retries,
+                backoff_factor=options.backoff_factor,
+                status_forcelist=_RETRY_STATUS_CODES,
+                # the response of the last attempt is returned instead of raising
+                raise_on_status=False,
+            ),
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", self._timeout)
+        return super().request(*args, **kwargs)
+
+
+_lock = threading.Lock()
+_options = HttpOptions()
+_session: Optional[_Session] = None
+
+
+def session() -> requests.Session:
+    """
+    The HTTP session shared by the whole process. Its connections are kept alive and reused.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _Session(_options)
+        return _session
+
+
+def configure(options: HttpOptions) -> None:
+    """
+    Changes the settings of the shared HTTP session. Open connections are closed.
+    """
+    global _options, _session
+    with _lock:
+        _options = options
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -1,33 +1,80 @@
-import keyring
-from keyring.errors import NoKeyringError, InitError, PasswordSetError, KeyringLocked
+import threading
+from typing import Optional
 
 from tq42.utils import file_handling
 
+_KEYRING_BACKEND = "keyring"
+_FILE_BACKEND = "file"
+
+# where tokens are stored is decided once per process, hosts without a keyring only read and write files
+_backend: Optional[str] = None
+_backend_lock = threading.Lock()
+
+
+def _keyring():
+    # importing keyring and discovering its backend is slow, so it is only done if the keyring may be used
+    import keyring
+    import keyring.errors
+
+    return keyring
+
+
+def _set_backend(backend: str) -> None:
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+def token_backend() -> Optional[str]:
+    """
+    The token storage of this process, `"keyring"` or `"file"`. `None` until a token was saved or looked up.
+    """
+    return _backend
+
+
+def reset_token_backend() -> None:
+    """
+    Forgets the token storage of this process, the next access tries the keyring again.
+    """
+    _set_backend(None)
+
 
 def save_token(service_name: str, backup_save_path: str, token: str) -> str:
-    try:
-        save_location = "keyring"
-        keyring.set_password(
-            service_name=service_name,
-            username="username",
-            password=token,
-        )
-        return save_location
+    if _backend != _FILE_BACKEND:
+        keyring = _keyring()
+        try:
+            keyring.set_password(
+                service_name=service_name,
+                username="username",
+                password=token,
+            )
+            _set_backend(_KEYRING_BACKEND)
+            return "keyring"
+        except (keyring.errors.NoKeyringError, keyring.errors.InitError):
+            _set_backend(_FILE_BACKEND)
+        except keyring.errors.PasswordSetError:
+            # the keyring works in general, only this token could not be stored
+            pass
 
-    except (NoKeyringError, InitError, PasswordSetError):
-        file_handling.write_to_file(backup_save_path, token)
-        return backup_save_path
+    file_handling.write_to_file(backup_save_path, token)
+    return backup_save_path
 
 
 def get_token(service_name: str, backup_save_path: str) -> str:
-    try:
-        token = keyring.get_password(
-            service_name=service_name,
-            username="username",
-        )
-        if token is None:
-            raise NoKeyringError
-
-        return token
-    except (NoKeyringError, InitError, KeyringLocked):
-        return file_handling.read_file(backup_save_path)
+    if _backend != _FILE_BACKEND:
+        keyring = _keyring()
+        try:
+            token = keyring.get_password(
+                service_name=service_name,
+                username="username",
+            )
+            _set_backend(_KEYRING_BACKEND)
+            # tokens that could not be stored in the keyring are in the file
+            if token is not None:
+                return token
+        except (keyring.errors.NoKeyringError, keyring.errors.InitError):
+            _set_backend(_FILE_BACKEND)
+        except keyring.errors.KeyringLocked:
+            pass
+
+    return file_handling.read_file(backup_save_path)
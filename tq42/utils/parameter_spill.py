@@ -0,0 +1,105 @@
+import hashlib
+import threading
+from typing import Dict, Optional
+
+from google.protobuf import struct_pb2
+from google.protobuf.json_format import MessageToJson
+
+from tq42.client import TQ42Client
+from tq42.dataset import (
+    Dataset,
+    DatasetSensitivityProto,
+    list_all as list_all_datasets,
+)
+from com.terraquantum.storage.v1alpha1.storage_pb2 import StorageStatusProto
+
+# datasets of spilled parameters are named after the hash of their content, so they can be found again
+_DATASET_NAME_PREFIX = "tq42-parameter-"
+
+
+class ParameterSpill:
+    """
+    Moves large parameters of :py:meth:`tq42.experiment_run.ExperimentRun.create` into datasets,
+    so the request creating the run stays small.
+
+    Every entry of `parameters["parameters"]` with an encoded size of at least `threshold` bytes is uploaded as a JSON
+    file to a new dataset of the project and passed as `parameters["inputs"][name] = {"storage_id": ...}` instead.
+    Entries that already have an input of the same name are kept. Equal values are only uploaded once, also across
+    processes, because the datasets are named after the hash of their content.
+
+    Only use it with algorithms that read these parameters from their inputs.
+
+    :param project_id: id of the project the datasets are created in
+    :param threshold: encoded size in bytes from which a parameter is moved (default: 1 MiB)
+    :param sensitivity: sensitivity of the created datasets (default: `DatasetSensitivityProto.SENSITIVE`)
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        threshold: int = 1024 * 1024,
+        sensitivity: DatasetSensitivityProto = DatasetSensitivityProto.SENSITIVE,
+    ):
+        self.project_id = project_id
+        self.threshold = threshold
+        self.sensitivity = sensitivity
+        self._lock = threading.Lock()
+        # storage id per content hash, the datasets of the project are listed once the first parameter is moved
+        self._storage_ids: Optional[Dict[str, str]] = None
+        self._upload_locks: Dict[str, threading.Lock] = {}
+
+    def apply(self, client: TQ42Client, metadata: struct_pb2.Struct) -> None:
+        """
+        Moves the large parameters of the encoded `metadata` of a run into datasets.
+
+        :meta private:
+        """
+        if "parameters" not in metadata.fields:
+            return
+
+        parameters = metadata.fields["parameters"].struct_value.fields
+        for name in list(parameters):
+            value = parameters[name]
+            if value.ByteSize() < self.threshold:
+                continue
+
+            inputs = metadata.fields["inputs"].struct_value.fields
+            if name in inputs:
+                continue
+
+            storage_id = self._upload(client, value)
+            inputs[name].struct_value.fields["storage_id"].string_value = storage_id
+            del parameters[name]
+
+    def _upload(self, client: TQ42Client, value: struct_pb2.Value) -> str:
+        data = MessageToJson(value, indent=None).encode()
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            if self._storage_ids is None:
+                self._storage_ids = self._existing_storage_ids(client)
+            upload_lock = self._upload_locks.setdefault(digest, threading.Lock())
+
+        # equal values moved at the same time, e.g. by `create_many`, are uploaded by the first caller only
+        with upload_lock:
+            storage_id = self._storage_ids.get(digest)
+            if storage_id is None:
+                storage = Dataset._create_from_bytes(
+                    client=client,
+                    project_id=self.project_id,
+                    name=f"{_DATASET_NAME_PREFIX}{digest}",
+                    description="Experiment run parameter uploaded by the TQ42 SDK",
+                    data=data,
+                    file_name=f"{digest}.json",
+                    sensitivity=self.sensitivity,
+                )
+                storage_id = self._storage_ids[digest] = storage.id
+        return storage_id
+
+    def _existing_storage_ids(self, client: TQ42Client) -> Dict[str, str]:
+        return {
+            dataset.data.name[len(_DATASET_NAME_PREFIX) :]: dataset.id
+            for dataset in list_all_datasets(client=client, project_id=self.project_id)
+            if dataset.data.name.startswith(_DATASET_NAME_PREFIX)
+            and dataset.data.status == StorageStatusProto.COMPLETED
+        }
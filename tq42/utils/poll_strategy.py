@@ -0,0 +1,192 @@
+import dataclasses
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional
+
+from com.terraquantum.experiment.v1.experimentrun.experiment_run_pb2 import (
+    ExperimentRunStatusProto,
+)
+
+from tq42.exceptions import ExceedRetriesError, PollTimeoutError
+
+# queued runs take a while to start, while running and cancelling runs are checked often to notice their end quickly
+_DEFAULT_MAX_DELAYS = {
+    ExperimentRunStatusProto.QUEUED: 20.0,
+    ExperimentRunStatusProto.PENDING: 1.5,
+    ExperimentRunStatusProto.RUNNING: 1.5,
+    ExperimentRunStatusProto.CANCEL_PENDING: 1.5,
+}
+
+# about as long as the previous default of 1000 checks one second apart
+_DEFAULT_TIMEOUT = 1000.0
+
+
+@dataclass(frozen=True)
+class PollStrategy:
+    """
+    When to check the state of an experiment run while waiting for it to finish.
+
+    The delay between two checks starts at `delay` and grows by `backoff` with every check, up to the maximum delay
+    of the state the run is in. Whenever the state changes, the delay starts at `delay` again.
+
+    :param initial_delay: seconds before the first check (default: check right away)
+    :param delay: seconds between the first checks of a state (default: 1 second)
+    :param backoff: factor the delay grows by with every check (default: 1.5)
+    :param max_delay: highest delay for states without an entry in `max_delays` (default: 10 seconds)
+    :param max_delays: highest delay per `ExperimentRunStatusProto` (default: 20 seconds while QUEUED,
+        1.5 seconds while PENDING, RUNNING or CANCEL_PENDING)
+    :param jitter: share by which every delay is randomly shortened or lengthened,
+        so that many polling clients do not check at the same time (default: 0.1)
+    :param timeout: seconds after which polling is given up, `None` waits forever (default: 1000 seconds)
+    :param max_tries: number of checks after which polling is given up (default: unlimited)
+    """
+
+    initial_delay: float = 0.0
+    delay: float = 1.0
+    backoff: float = 1.5
+    max_delay: float = 10.0
+    max_delays: Mapping[int, float] = field(
+        default_factory=lambda: dict(_DEFAULT_MAX_DELAYS)
+    )
+    jitter: float = 0.1
+    timeout: Optional[float] = _DEFAULT_TIMEOUT
+    max_tries: Optional[int] = None
+
+    def __post_init__(self):
+        if self.backoff < 1:
+            raise ValueError(f"backoff has to be at least 1, got {self.backoff}")
+        if not 0 <= self.jitter < 1:
+            raise ValueError(f"jitter has to be in [0, 1), got {self.jitter}")
+
+    @staticmethod
+    def fixed(
+        tries: int = 1000,
+        initial_delay: float = 1.0,
+        delay: float = 1.0,
+        backoff: float = 1.0,
+    ) -> "PollStrategy":
+        """
+        The strategy of the `tries`, `initial_delay`, `delay` and `backoff` arguments of `poll`:
+        checks `tries` times with a delay growing by `backoff`, regardless of the state and without a cap.
+        """
+        return PollStrategy(
+            initial_delay=initial_delay,
+            delay=delay,
+            backoff=backoff,
+            max_delay=math.inf,
+            max_delays={},
+            jitter=0.0,
+            timeout=None,
+            max_tries=tries,
+        )
+
+    def with_overrides(
+        self,
+        tries: Optional[int] = None,
+        initial_delay: Optional[float] = None,
+        delay: Optional[float] = None,
+        backoff: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> "PollStrategy":
+        """
+        A copy of the strategy with the given arguments of `poll` applied.
+
+        :meta private:
+        """
+        overrides: Dict[str, float] = {
+            name: value
+            for name, value in (
+                ("max_tries", tries),
+                ("initial_delay", initial_delay),
+                ("delay", delay),
+                ("backoff", backoff),
+                ("timeout", timeout),
+            )
+            if value is not None
+        }
+        return dataclasses.replace(self, **overrides) if overrides else self
+
+    def delay_for(self, status: int, attempt: int) -> float:
+        """
+        Seconds to wait before the next check after the run was found in `status` for `attempt` checks in a row.
+        """
+        delay = min(
+            self.max_delays.get(status, self.max_delay),
+            self.delay * self.backoff**attempt,
+        )
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return delay
+
+
+def resolve(
+    strategy: Optional[PollStrategy],
+    tries: Optional[int],
+    initial_delay: Optional[float],
+    delay: Optional[float],
+    backoff: Optional[float],
+    timeout: Optional[float],
+) -> PollStrategy:
+    """
+    The strategy of a `poll` call. Without a strategy, passing any of the legacy arguments polls like before.
+    """
+    if strategy is None:
+        legacy = any(arg is not None for arg in (tries, initial_delay, delay, backoff))
+        strategy = PollStrategy.fixed() if legacy else PollStrategy()
+    return strategy.with_overrides(
+        tries=tries,
+        initial_delay=initial_delay,
+        delay=delay,
+        backoff=backoff,
+        timeout=timeout,
+    )
+
+
+class Poller:
+    """
+    Tracks a single `poll` call and decides how long to wait after each check.
+    """
+
+    def __init__(self, strategy: PollStrategy):
+        self._strategy = strategy
+        self._deadline = (
+            None if strategy.timeout is None else time.monotonic() + strategy.timeout
+        )
+        self._status: Optional[int] = None
+        self._attempt = 0
+        self.tries = 0
+
+    @property
+    def initial_delay(self) -> float:
+        return self._bounded(self._strategy.initial_delay)
+
+    def next_delay(self, status: int) -> float:
+        """
+        Counts a check that found the run in `status` and returns the seconds until the next check.
+
+        :raises: ExceedRetriesError if the strategy allows no further check
+        """
+        self.tries += 1
+        if (
+            self._strategy.max_tries is not None
+            and self.tries >= self._strategy.max_tries
+        ):
+            raise ExceedRetriesError(tries=self.tries)
+
+        if status != self._status:
+            self._status = status
+            self._attempt = 0
+        delay = self._strategy.delay_for(status, self._attempt)
+        self._attempt += 1
+        return self._bounded(delay)
+
+    def _bounded(self, delay: float) -> float:
+        # the last check happens right at the deadline, polling is given up once that check did not find the run done
+        if self._deadline is None:
+            return delay
+        left = self._deadline - time.monotonic()
+        if left <= 0:
+            raise PollTimeoutError(tries=self.tries, timeout=self._strategy.timeout)
+        return min(delay, left)
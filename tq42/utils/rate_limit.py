@@ -0,0 +1,216 @@
+import asyncio
+import re
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+import grpc
+from grpc import aio
+
+from tq42.utils.call_stats import CallStats, method_name
+
+SERVICES = (
+    "organization",
+    "project",
+    "experiment",
+    "storage",
+    "experiment_run",
+    "plan",
+    "channel",
+)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Limits the unary calls a client makes to a single service.
+    Calls over the limit wait on the client instead of being rejected by the API.
+
+    :param calls_per_second: sustained number of calls started per second (default: unlimited)
+    :param burst: number of calls that may be started at once before `calls_per_second` applies
+        (default: one second worth of calls)
+    :param max_in_flight: number of calls running at the same time (default: unlimited)
+    """
+
+    calls_per_second: Optional[float] = None
+    burst: Optional[int] = None
+    max_in_flight: Optional[int] = None
+
+    def __post_init__(self):
+        if self.calls_per_second is not None and self.calls_per_second <= 0:
+            raise ValueError(
+                f"calls_per_second has to be positive, got {self.calls_per_second}"
+            )
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise ValueError(
+                f"max_in_flight has to be at least 1, got {self.max_in_flight}"
+            )
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns the seconds the caller has to wait until it is available.
+        Tokens may be reserved ahead of time, so waiting callers are served in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._last) * self._rate
+            )
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+
+class _ServiceLimiter:
+    def __init__(self, limit: RateLimit):
+        self._bucket = (
+            _TokenBucket(
+                rate=limit.calls_per_second,
+                burst=max(1, limit.burst or int(limit.calls_per_second)),
+            )
+            if limit.calls_per_second
+            else None
+        )
+        self._max_in_flight = limit.max_in_flight
+        self._semaphore = (
+            threading.BoundedSemaphore(limit.max_in_flight)
+            if limit.max_in_flight
+            else None
+        )
+        # asyncio semaphores bind to the loop they are first used on, so the aio interceptor creates one per loop
+        self._async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def acquire(self) -> None:
+        if self._bucket is not None:
+            wait = self._bucket.reserve()
+            if wait:
+                time.sleep(wait)
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+
+    def release(self) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    async def acquire_async(self) -> None:
+        if self._bucket is not None:
+            wait = self._bucket.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+        if self._max_in_flight:
+            await self._async_semaphore().acquire()
+
+    def release_async(self) -> None:
+        if self._max_in_flight:
+            self._async_semaphore().release()
+
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores[loop] = asyncio.Semaphore(
+                self._max_in_flight
+            )
+        return semaphore
+
+
+def _service_key(method: str) -> str:
+    # `ExperimentRunService/GetExperimentRun` -> `experiment_run`
+    service = method.partition("/")[0].removesuffix("Service")
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", service).lower()
+
+
+class RateLimiter:
+    """
+    The rate limits of a client per service.
+
+    :param limits: limit per service name, e.g. `{"experiment_run": RateLimit(calls_per_second=10)}`
+    """
+
+    def __init__(self, limits: Mapping[str, RateLimit]):
+        unknown = set(limits) - set(SERVICES)
+        if unknown:
+            raise ValueError(
+                f"Unknown services {sorted(unknown)}, expected any of {list(SERVICES)}"
+            )
+        self._limiters: Dict[str, _ServiceLimiter] = {
+            service: _ServiceLimiter(limit) for service, limit in limits.items()
+        }
+
+    def for_method(self, method: str) -> Optional[_ServiceLimiter]:
+        return self._limiters.get(_service_key(method))
+
+
+class RateLimitInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """
+    Delays the unary calls of a sync channel until the rate limits allow them and records the time they waited.
+    """
+
+    def __init__(self, limiter: RateLimiter, stats: CallStats):
+        self._limiter = limiter
+        self._stats = stats
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = method_name(client_call_details.method)
+        limiter = self._limiter.for_method(method)
+        if limiter is None:
+            return continuation(client_call_details, request)
+
+        start = time.perf_counter()
+        limiter.acquire()
+        self._stats.record_queue_wait(method, time.perf_counter() - start)
+
+        try:
+            call = continuation(client_call_details, request)
+        except Exception:
+            limiter.release()
+            raise
+
+        call.add_done_callback(lambda _: limiter.release())
+        return call
+
+
+class AioRateLimitInterceptor(aio.UnaryUnaryClientInterceptor):
+    """
+    The `grpc.aio` counterpart of :py:class:`RateLimitInterceptor`.
+    """
+
+    def __init__(self, limiter: RateLimiter, stats: CallStats):
+        self._limiter = limiter
+        self._stats = stats
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = method_name(client_call_details.method)
+        limiter = self._limiter.for_method(method)
+        if limiter is None:
+            return await continuation(client_call_details, request)
+
+        start = time.perf_counter()
+        await limiter.acquire_async()
+        self._stats.record_queue_wait(method, time.perf_counter() - start)
+
+        try:
+            call = await continuation(client_call_details, request)
+            # the call only counts as in flight until its response arrived
+            try:
+                await call
+            except aio.AioRpcError:
+                pass
+            return call
+        finally:
+            limiter.release_async()
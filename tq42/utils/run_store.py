@@ -0,0 +1,177 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from com.terraquantum.experiment.v3alpha2.experimentrun.experiment_run_pb2 import (
+    ExperimentRunProto,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiment_runs (
+    host TEXT NOT NULL,
+    id TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (host, id)
+);
+CREATE INDEX IF NOT EXISTS experiment_runs_accessed ON experiment_runs (accessed);
+"""
+
+# reading a run only marks it as used again after this many seconds, so frequent reads stay read only
+_ACCESS_RESOLUTION = 60.0
+
+
+class RunStore:
+    """
+    A store on disk for experiment runs that are COMPLETED, FAILED or CANCELLED.
+    These runs never change, so a client created with a store loads them from disk instead of the API once they were
+    fetched. The store is an SQLite database that can be shared by the processes and threads of the user.
+
+    When the stored runs exceed `max_size`, the runs that were not used for the longest time are removed.
+    If the database cannot be used, e.g. because the disk is full, runs are fetched from the API as without a store.
+
+    :param path: the database file (default: `~/.config/tq42/experiment_runs.sqlite3`)
+    :param max_size: bytes of serialized runs to keep (default: 256 MiB)
+    :param busy_timeout: seconds to wait for other processes writing to the database (default: 5)
+
+    Example:
+        >>> client = TQ42Client(run_store=RunStore())
+        ... run = ExperimentRun(client=client, id="some-finished-run-id")
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_size: int = 256 * 1024 * 1024,
+        busy_timeout: float = 5.0,
+    ):
+        self.path = path or os.path.expanduser("~/.config/tq42/experiment_runs.sqlite3")
+        self.max_size = max_size
+        self.busy_timeout = busy_timeout
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        # a connection must not be used by a forked process
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # transactions are started explicitly, so writers take the database lock before reading the sizes
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+        except sqlite3.Error:
+            connection.close()
+            raise
+
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+    def get(self, host: str, id: str) -> Optional[ExperimentRunProto]:
+        """
+        Returns the stored experiment run or `None` if it is not stored.
+
+        :param host: the API the run was fetched from
+        :param id: id of the experiment run
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT data, accessed FROM experiment_runs WHERE host = ? AND id = ?",
+                    (host, id),
+                ).fetchone()
+                if row is None:
+                    return None
+
+                data, accessed = row
+                if accessed < now - _ACCESS_RESOLUTION:
+                    connection.execute(
+                        "UPDATE experiment_runs SET accessed = ? WHERE host = ? AND id = ?",
+                        (now, host, id),
+                    )
+        except sqlite3.Error:
+            logging.warning("Reading the experiment run store failed", exc_info=True)
+            return None
+
+        return ExperimentRunProto.FromString(data)
+
+    def put(self, host: str, run: ExperimentRunProto) -> None:
+        """
+        Stores a finished experiment run and removes the least recently used runs beyond `max_size`.
+
+        :param host: the API the run was fetched from
+        :param run: the experiment run
+        """
+        data = run.SerializeToString()
+        if len(data) > self.max_size:
+            return
+
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO experiment_runs (host, id, data, size, accessed) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (host, run.id, data, len(data), time.time()),
+                    )
+                    self._evict(connection)
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error:
+            logging.warning("Writing the experiment run store failed", exc_info=True)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM experiment_runs"
+        ).fetchone()
+        if total <= self.max_size:
+            return
+
+        evicted = []
+        for rowid, size in connection.execute(
+            "SELECT rowid, size FROM experiment_runs ORDER BY accessed, rowid"
+        ).fetchall():
+            if total <= self.max_size:
+                break
+            evicted.append((rowid,))
+            total -= size
+        connection.executemany("DELETE FROM experiment_runs WHERE rowid = ?", evicted)
+
+    def clear(self) -> None:
+        """
+        Removes all stored experiment runs.
+        """
+        with self._lock:
+            self._connect().execute("DELETE FROM experiment_runs")
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database. It is opened again when the store is used.
+        """
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
@@ -0,0 +1,206 @@
+import struct
+import sys
+from typing import Any, Mapping, Optional, Sequence
+
+from google.protobuf import struct_pb2
+from google.protobuf.json_format import ParseError
+
+# a `Value` holding a number is serialized as field 1 of its `ListValue` (tag 0x0a, length 9)
+# followed by its `number_value` (tag 0x11) and the little endian double
+_NUMBER_ITEM_HEADER = b"\x0a\x09\x11"
+_NUMBER_ITEM_SIZE = len(_NUMBER_ITEM_HEADER) + 8
+_pack_number_item = struct.Struct("<3sd").pack
+# a nested list is serialized as a `Value` (tag 0x0a) holding its `list_value` (tag 0x32)
+_VALUE_TAG = b"\x0a"
+_LIST_VALUE_TAG = b"\x32"
+
+
+def import_numpy():
+    """
+    Imports NumPy, which is an optional dependency of the SDK.
+
+    :raises: ImportError with installation instructions if NumPy is not installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for this feature, install it with `pip install tq42[numpy]`"
+        ) from None
+    return numpy
+
+
+def _number_item_dtype(np):
+    return np.dtype([("header", "u1", (len(_NUMBER_ITEM_HEADER),)), ("value", "<f8")])
+
+
+def _numbers_from_wire(list_value: struct_pb2.ListValue, np) -> Optional[Any]:
+    """
+    Reads a list of numbers straight from the serialized `ListValue`.
+    Returns `None` if the list holds anything but numbers.
+    """
+    wire = list_value.SerializeToString()
+    count = len(list_value.values)
+    if len(wire) != count * _NUMBER_ITEM_SIZE:
+        return None
+
+    items = np.frombuffer(wire, dtype=_number_item_dtype(np))
+    if not (items["header"] == np.frombuffer(_NUMBER_ITEM_HEADER, dtype="u1")).all():
+        return None
+    return items["value"]
+
+
+def list_value_to_array(list_value: struct_pb2.ListValue, dtype=None):
+    """
+    Converts a `ListValue` of numbers, or of equally long lists of numbers, into a NumPy array.
+
+    :param list_value: the list to convert
+    :param dtype: dtype of the array (default: float64, the type numbers are transferred as)
+    :raises: TypeError if the list holds anything but numbers or lists of numbers
+    :raises: ValueError if nested lists differ in length
+    """
+    np = import_numpy()
+    dtype = np.dtype(dtype or np.float64)
+
+    values = _numbers_from_wire(list_value, np)
+    if values is not None:
+        return values.astype(dtype)
+
+    kinds = {value.WhichOneof("kind") for value in list_value.values}
+    if kinds == {"list_value"}:
+        rows = [
+            list_value_to_array(value.list_value, dtype) for value in list_value.values
+        ]
+        if len({row.shape for row in rows}) > 1:
+            raise ValueError(
+                "Nested lists of different length cannot be converted to an array"
+            )
+        return np.stack(rows)
+    if kinds <= {"number_value", "bool_value"}:
+        return np.array(
+            [
+                value.number_value
+                if value.HasField("number_value")
+                else value.bool_value
+                for value in list_value.values
+            ],
+            dtype=dtype,
+        )
+    raise TypeError(
+        f"Only lists of numbers can be converted to an array, found {sorted(map(str, kinds))}"
+    )
+
+
+def value_to_array(value: struct_pb2.Value, dtype=None):
+    """
+    Converts a `Value` holding a number or a list of numbers into a NumPy array.
+    """
+    np = import_numpy()
+    kind = value.WhichOneof("kind")
+    if kind == "list_value":
+        return list_value_to_array(value.list_value, dtype)
+    if kind == "number_value":
+        return np.array(value.number_value, dtype=dtype or np.float64)
+    raise TypeError(
+        f"Only numbers and lists of numbers can be converted to an array, found {kind}"
+    )
+
+
+def _varint(number: int) -> bytes:
+    encoded = bytearray()
+    while number > 0x7F:
+        encoded.append(number & 0x7F | 0x80)
+        number >>= 7
+    encoded.append(number)
+    return bytes(encoded)
+
+
+def _array_to_wire(array, np) -> bytes:
+    """
+    Serializes a numeric array as the items of a `ListValue`, nested lists for every dimension but the last.
+    """
+    if array.ndim == 1:
+        items = np.empty(len(array), dtype=_number_item_dtype(np))
+        items["header"] = np.frombuffer(_NUMBER_ITEM_HEADER, dtype="u1")
+        items["value"] = array
+        return items.tobytes()
+
+    rows = []
+    for row in array:
+        row_items = _array_to_wire(row, np)
+        list_value = _LIST_VALUE_TAG + _varint(len(row_items)) + row_items
+        rows.append(_VALUE_TAG + _varint(len(list_value)) + list_value)
+    return b"".join(rows)
+
+
+def _fill_struct(message: struct_pb2.Struct, mapping: Mapping, path: str) -> None:
+    message.SetInParent()
+    for key, value in mapping.items():
+        if not isinstance(key, str):
+            raise ParseError(f"Key {key!r} is not a string at {path}")
+        _fill_value(message.fields[key], value, f"{path}.{key}")
+
+
+def _fill_list(message: struct_pb2.ListValue, values: Sequence, path: str) -> None:
+    message.SetInParent()
+    if values and all(type(value) in (float, int) for value in values):
+        message.MergeFromString(
+            b"".join(
+                [_pack_number_item(_NUMBER_ITEM_HEADER, value) for value in values]
+            )
+        )
+        return
+
+    for index, value in enumerate(values):
+        _fill_value(message.values.add(), value, f"{path}[{index}]")
+
+
+def _fill_value(message: struct_pb2.Value, value: Any, path: str) -> None:
+    # NumPy values can only be passed if the caller imported NumPy already
+    np = sys.modules.get("numpy")
+    if np is not None:
+        if isinstance(value, np.ndarray):
+            if value.ndim > 0 and value.dtype.kind in "iuf":
+                message.list_value.SetInParent()
+                message.list_value.MergeFromString(_array_to_wire(value, np))
+                return
+            value = value.tolist()
+        elif isinstance(value, np.generic):
+            value = value.item()
+
+    if value is None:
+        message.null_value = struct_pb2.NULL_VALUE
+    elif isinstance(value, bool):
+        message.bool_value = value
+    elif isinstance(value, (int, float)):
+        message.number_value = value
+    elif isinstance(value, str):
+        message.string_value = value
+    elif isinstance(value, Mapping):
+        _fill_struct(message.struct_value, value, path)
+    elif isinstance(value, (list, tuple)):
+        _fill_list(message.list_value, value, path)
+    else:
+        raise ParseError(f"Value {value} has unexpected type {type(value)} at {path}")
+
+
+def encode_struct(mapping: Mapping[str, Any]) -> struct_pb2.Struct:
+    """
+    Encodes a dict into a `Struct` like `ParseDict` does. Additionally, NumPy arrays and scalars are accepted,
+    and numeric arrays and lists of numbers are written in bulk instead of one `Value` at a time.
+
+    :raises: ParseError if a value cannot be represented in a `Struct`
+    """
+    message = struct_pb2.Struct()
+    _fill_struct(message, mapping, "Struct")
+    return message
+
+
+def set_value(message: struct_pb2.Value, value: Any) -> None:
+    """
+    Replaces the content of a `Value` with `value`, encoded like :py:func:`encode_struct` does.
+
+    :raises: ParseError if the value cannot be represented in a `Struct`
+    """
+    message.Clear()
+    _fill_value(message, value, "Value")
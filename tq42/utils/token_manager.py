@@ -1,12 +1,129 @@
+import base64
+import heapq
+import itertools
+import json
+import logging
 import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Optional
 
-from tq42.utils import file_handling
+from tq42.utils import file_handling, http
 from tq42.utils.environment import ConfigEnvironment
+from tq42.utils.file_lock import FileLock
 from tq42.utils.misc import get_token, save_token
 from datetime import datetime
-import requests
 
+_ACCESS_TOKEN_KEY = "tq42_access_token"
 _REFRESH_TOKEN_KEY = "tq42_refresh_token"
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+# tokens are renewed in the background this long before they expire
+_REFRESH_AHEAD_SECONDS = 600
+# tokens this close to their expiry are not sent any more, the call waits for a new one instead
+_EXPIRY_MARGIN_SECONDS = 30
+# after the auth server did not return a new token, e.g. because the refresh token expired, it is asked again this late
+_FAILED_RENEWAL_BACKOFF_SECONDS = 60
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """
+    Reads the `exp` claim of a JWT without verifying it.
+
+    :returns: the expiry as seconds since the epoch or `None` if the token is not a JWT with an expiry
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return float(claims["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
+
+
+class _RefreshScheduler:
+    """
+    A single thread per process that starts the scheduled renewals of all token managers.
+    It only keeps weak references to the managers, so managers that are no longer used are not kept alive
+    and do not hold a thread until their token expires.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        # (due time, sequence number, weak reference to the manager)
+        self._queue: list = []
+        self._sequence = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def schedule(self, manager: "TokenManager", due: float) -> int:
+        """
+        Schedules :py:meth:`TokenManager.refresh_in_background` of `manager` at the time `due`.
+
+        :returns: the id of the renewal, a renewal is only started if its manager still has this id scheduled
+        """
+        with self._condition:
+            sequence = next(self._sequence)
+            heapq.heappush(self._queue, (due, sequence, weakref.ref(manager)))
+            # threads are not inherited by forked processes
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, name="tq42-token-refresh-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+            return sequence
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue or self._queue[0][0] > time.time():
+                    timeout = self._queue[0][0] - time.time() if self._queue else None
+                    self._condition.wait(timeout)
+                _, sequence, manager_ref = heapq.heappop(self._queue)
+
+            manager = manager_ref()
+            if manager is not None and manager._is_scheduled(sequence):
+                manager.refresh_in_background()
+
+
+_scheduler = _RefreshScheduler()
+
+
+@dataclass
+class TokenCacheStats:
+    """
+    Counts how often the access token was served from memory instead of the token storage.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    # the token is read by the threads of the callers, of gRPC and of the renewals at the same time
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of the reads of the access token that were served from memory, between 0 and 1.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            if total == 0:
+                return 0.0
+            return self.hits / total
 
 
 class TokenManager:
@@ -14,8 +131,24 @@ class TokenManager:
         self._config_dir = os.path.expanduser("~/.config/tq42")
         self._environment = environment
 
-        if not os.path.exists(self._config_dir):
-            os.makedirs(self._config_dir)
+        # the access token and its timestamp are only read from disk once and then kept in memory
+        self._access_token: Optional[str] = None
+        self._expires_at: Optional[float] = None
+        self._token_timestamp: Optional[datetime] = None
+        self._token_timestamp_loaded = False
+        self.cache_stats = TokenCacheStats()
+
+        # makes sure only one thread at a time requests a new access token
+        self._refresh_lock = threading.Lock()
+        self._refresh_generation = 0
+        # no new token is requested before this time after a renewal failed
+        self._retry_renewal_at = 0.0
+
+        # tokens with an expiry are renewed on a background thread before they expire
+        self._background_lock = threading.Lock()
+        self._background_refresh: Optional[threading.Thread] = None
+        # id of the renewal scheduled with the process wide scheduler, `None` if none is scheduled
+        self._scheduled_refresh: Optional[int] = None
 
     @property
     def token_file_path(self):
@@ -29,39 +162,210 @@ class TokenManager:
     def refresh_token_file_path(self):
         return os.path.join(self._config_dir, "refresh_token")
 
-    def renew_expiring_token(self):
-        token_timestamp = file_handling.read_file(self.timestamp_file_path)
-        if token_timestamp == "":
+    @property
+    def lock_file_path(self):
+        return os.path.join(self._config_dir, "token.lock")
+
+    @property
+    def access_token(self) -> str:
+        """
+        The current access token.
+        A token that is about to expire is renewed in the background while it is still served, only an expired token
+        makes the caller wait for a new one.
+        """
+        token = self._access_token
+        if token:
+            self.cache_stats.record_hit()
+        else:
+            self.cache_stats.record_miss()
+            token = get_token(
+                service_name=_ACCESS_TOKEN_KEY, backup_save_path=self.token_file_path
+            )
+            # an empty token means we are not logged in (yet), so look it up again next time
+            if token:
+                self._set_access_token(token)
+
+        if self._is_expiring():
+            self.renew_expiring_token()
+            token = self._access_token or token
+        elif self._is_expiring(ahead=_REFRESH_AHEAD_SECONDS):
+            self.refresh_in_background()
+
+        return token
+
+    def _set_access_token(self, token: str) -> None:
+        self._access_token = token
+        self._expires_at = _jwt_expiry(token)
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        with self._background_lock:
+            self._scheduled_refresh = None
+            if self._expires_at is None:
+                return
+
+            self._scheduled_refresh = _scheduler.schedule(
+                self, self._expires_at - _REFRESH_AHEAD_SECONDS
+            )
+
+    def _is_scheduled(self, sequence: int) -> bool:
+        # waits for `_schedule_refresh` to store the id of a renewal that is due right away
+        with self._background_lock:
+            return self._scheduled_refresh == sequence
+
+    def refresh_in_background(self) -> None:
+        """
+        Renews a token that expires within the next minutes on a background thread, unless a renewal is already
+        running or the last renewal failed less than a minute ago.
+        """
+        if time.time() < self._retry_renewal_at:
+            return
+
+        with self._background_lock:
+            if (
+                self._background_refresh is not None
+                and self._background_refresh.is_alive()
+            ):
+                return
+
+            self._background_refresh = threading.Thread(
+                target=self._renew_in_background,
+                name="tq42-token-refresh",
+                daemon=True,
+            )
+            self._background_refresh.start()
+
+    def _renew_in_background(self) -> None:
+        try:
+            self.renew_expiring_token(ahead=_REFRESH_AHEAD_SECONDS)
+        except Exception:
+            # the next call that needs the token tries again
+            logging.warning("Renewing the access token failed", exc_info=True)
+
+    def close(self) -> None:
+        """
+        Cancels the scheduled renewal of the access token.
+        """
+        with self._background_lock:
+            self._scheduled_refresh = None
+
+    def invalidate(self) -> None:
+        """
+        Drops the in-memory copies so the next access reads the token storage again.
+        """
+        self.close()
+        self._retry_renewal_at = 0.0
+        self._access_token = None
+        self._expires_at = None
+        self._token_timestamp = None
+        self._token_timestamp_loaded = False
+
+    def _get_token_timestamp(self) -> Optional[datetime]:
+        if not self._token_timestamp_loaded:
+            token_timestamp = file_handling.read_file(self.timestamp_file_path)
+            self._token_timestamp = (
+                datetime.strptime(token_timestamp, _TIMESTAMP_FORMAT)
+                if token_timestamp
+                else None
+            )
+            self._token_timestamp_loaded = True
+
+        return self._token_timestamp
+
+    def _is_expiring(self, ahead: float = _EXPIRY_MARGIN_SECONDS) -> bool:
+        """
+        :param ahead: seconds before the expiry of a JWT from which on it counts as expiring
+        """
+        if self._expires_at is not None:
+            return time.time() >= self._expires_at - ahead
+
+        # without an expiry in the token we fall back to the time it was saved
+        token_timestamp = self._get_token_timestamp()
+        if token_timestamp is None:
             return False
-        token_timestamp = datetime.strptime(token_timestamp, "%Y-%m-%d %H:%M:%S.%f")
         diff = datetime.now() - token_timestamp
         # get new access token if token timestamp more than 23 hours(82800 seconds)
         # refresh token is valid for 30 days
         renew_limit = 82800
-        if diff.total_seconds() > renew_limit:
-            self.request_new_access_token()
-            return True
+        return diff.total_seconds() > renew_limit
+
+    def renew_expiring_token(self, ahead: float = _EXPIRY_MARGIN_SECONDS):
+        """
+        Requests a new access token if the current one is about to expire.
+        Concurrent callers, also in other processes, wait for a single refresh instead of each requesting a new token.
+        After the auth server did not return a new token, no new token is requested for a minute.
+
+        :param ahead: seconds before the expiry of a JWT from which on it is renewed
+        :returns: true if this call renewed the token
+        """
+        if not self._is_expiring(ahead) or time.time() < self._retry_renewal_at:
+            return False
+
+        generation = self._refresh_generation
+        with self._refresh_lock:
+            # another thread finished or failed a refresh while we were waiting for the lock
+            if (
+                generation != self._refresh_generation
+                or not self._is_expiring(ahead)
+                or time.time() < self._retry_renewal_at
+            ):
+                return False
+
+            try:
+                with FileLock(self.lock_file_path):
+                    # another process may have stored a new token while we were waiting for the lock
+                    self._reload_token()
+                    if not self._is_expiring(ahead):
+                        return False
 
-        return False
+                    return self.request_new_access_token()
+            finally:
+                self._refresh_generation += 1
 
-    def request_new_access_token(self):
+    def _reload_token(self) -> None:
+        self._token_timestamp_loaded = False
+        token = get_token(
+            service_name=_ACCESS_TOKEN_KEY, backup_save_path=self.token_file_path
+        )
+        if token and token != self._access_token:
+            self._set_access_token(token)
+
+    def request_new_access_token(self) -> bool:
+        """
+        Requests a new access token with the refresh token and stores it.
+
+        :returns: true if a new token was stored, false if the auth server did not return one
+        """
         refresh_token = get_token(
             service_name=_REFRESH_TOKEN_KEY,
             backup_save_path=self.refresh_token_file_path,
         )
         data = self._environment.refresh_token_data(refresh_token)
-        response = requests.post(
+        response = http.session().post(
             self._environment.auth_url_token,
             data=data,
             headers=self._environment.headers,
         )
         json_response = response.json()
-        if "access_token" in json_response:
-            access_token = json_response["access_token"]
-            save_token(
-                service_name="tq42_access_token",
-                backup_save_path=self.token_file_path,
-                token=access_token,
+        if "access_token" not in json_response:
+            # e.g. the refresh token expired, asking again right away would fail the same way
+            self._retry_renewal_at = time.time() + _FAILED_RENEWAL_BACKOFF_SECONDS
+            logging.warning(
+                "Renewing the access token failed: %s",
+                json_response.get("error_description", json_response.get("error")),
             )
-            current_datetime = datetime.now()
-            file_handling.write_to_file(self.timestamp_file_path, current_datetime)
+            return False
+
+        access_token = json_response["access_token"]
+        save_token(
+            service_name=_ACCESS_TOKEN_KEY,
+            backup_save_path=self.token_file_path,
+            token=access_token,
+        )
+        current_datetime = datetime.now()
+        file_handling.write_to_file(self.timestamp_file_path, current_datetime)
+
+        self._token_timestamp = current_datetime
+        self._token_timestamp_loaded = True
+        self._set_access_token(access_token)
+        return True
@@ -0,0 +1,71 @@
+import threading
+import weakref
+from dataclasses import astuple
+from typing import Callable, Dict, Hashable, List
+
+import grpc
+
+from tq42.utils.environment import ConfigEnvironment
+from tq42.utils.token_manager import TokenManager
+
+# channels that are shared by all clients of this process, keyed by their configuration
+_lock = threading.Lock()
+_channels: Dict[Hashable, grpc.Channel] = {}
+# clients that hold a shared channel, they are told to drop it when the channels are closed
+_users: Dict[Hashable, "weakref.WeakSet"] = {}
+# token managers of the shared channels per environment, they live as long as the process
+_token_managers: Dict[Hashable, TokenManager] = {}
+
+
+def get_or_create_token_manager(environment: ConfigEnvironment) -> TokenManager:
+    """
+    Returns the token manager shared by all clients of `environment` that share their channels.
+    The credentials of the shared channels read the access token from it, so they do not keep the client alive that
+    created the channel and keep working after that client was closed.
+    """
+    key = astuple(environment)
+    with _lock:
+        token_manager = _token_managers.get(key)
+        if token_manager is None:
+            token_manager = TokenManager(environment)
+            _token_managers[key] = token_manager
+        return token_manager
+
+
+def get_or_create_channel(
+    key: Hashable, factory: Callable[[], grpc.Channel], user=None
+) -> grpc.Channel:
+    """
+    Returns the shared channel for the given key. The channel is created with `factory` on first use.
+    Shared channels stay open until :py:func:`close_shared_channels` is called, so clients created later reuse
+    the already established connections.
+
+    :param user: the client the channel is returned to. Its `_detach_api_channel` method is called when the shared
+        channels are closed, only a weak reference to it is kept.
+    """
+    with _lock:
+        channel = _channels.get(key)
+        if channel is None:
+            channel = factory()
+            _channels[key] = channel
+        if user is not None:
+            _users.setdefault(key, weakref.WeakSet()).add(user)
+        return channel
+
+
+def close_shared_channels() -> None:
+    """
+    Closes all shared channels. The clients using them drop the closed channels and create new ones on their next call.
+    Calls in flight while the channels are closed fail.
+    """
+    with _lock:
+        channels: List[grpc.Channel] = list(_channels.values())
+        users = [user for key_users in _users.values() for user in key_users]
+        _channels.clear()
+        _users.clear()
+
+    for user in users:
+        user._detach_api_channel()
+
+    for channel in channels:
+        channel.close()